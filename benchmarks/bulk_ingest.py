@@ -0,0 +1,134 @@
+"""Benchmark bulk ingestion of GDELT 15-minute export and GKG archives.
+
+Writes synthetic zipped fixture files shaped like GDELT 2.0 exports (61 columns)
+and GKG 2.1 (27 columns), then reports parse-only and parse+store throughput
+(rows/sec) and the peak RSS of the process. Runs offline.
+
+Usage:
+  python benchmarks/bulk_ingest.py [--files 4] [--rows 20000] [--workers 1 4]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import resource
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+from world_news.article_store import LocalArticleStore
+from world_news.bulk_ingest import ingest_files, iter_records
+
+WORDS = (
+    "government election minister court storm market police climate talks ceasefire "
+    "inflation protest company shares energy health vaccine border trade summit "
+    "president parliament earthquake flood wildfire strike bank rates oil war peace"
+).split()
+DOMAINS = [f"news{i}.example.com" for i in range(300)]
+
+
+def _url(rng: random.Random, story: int) -> str:
+    slug = "-".join(rng.choice(WORDS) for _ in range(rng.randint(4, 9)))
+    return f"https://www.{rng.choice(DOMAINS)}/2025/01/01/{slug}-{story}.html"
+
+
+def export_row(rng: random.Random, url: str, stamp: str) -> str:
+    fields = [str(rng.randint(10**8, 10**9))] + ["x"] * 58 + [stamp, url]
+    return "\t".join(fields)
+
+
+def gkg_row(rng: random.Random, url: str, stamp: str, index: int) -> str:
+    fields = [""] * 27
+    fields[0] = f"{stamp}-{index}"
+    fields[1] = stamp
+    fields[2] = "1"
+    fields[3] = url.split("/")[2].removeprefix("www.")
+    fields[4] = url
+    fields[7] = ";".join(rng.choice(WORDS).upper() for _ in range(12))
+    fields[17] = ",".join(f"c{i}:{rng.random():.3f}" for i in range(80))
+    title = " ".join(rng.choice(WORDS) for _ in range(8)).capitalize()
+    fields[26] = f"<PAGE_LINKS></PAGE_LINKS><PAGE_TITLE>{title}</PAGE_TITLE>"
+    return "\t".join(fields)
+
+
+def write_fixtures(directory: Path, files: int, rows: int, rng: random.Random) -> list[Path]:
+    paths: list[Path] = []
+    for n in range(files):
+        stamp = f"20250101{n // 4:02d}{(n % 4) * 15:02d}00"
+        for kind in ("export.CSV", "gkg.csv"):
+            path = directory / f"{stamp}.{kind}.zip"
+            with (
+                zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as archive,
+                archive.open(path.stem, "w") as raw,
+            ):
+                story = 0
+                url = _url(rng, story)
+                for i in range(rows):
+                    # Exports list several events per article; GKG has one row per article.
+                    if kind.startswith("gkg") or rng.random() < 0.3:
+                        story += 1
+                        url = _url(rng, story)
+                    line = (
+                        gkg_row(rng, url, stamp, i)
+                        if kind.startswith("gkg")
+                        else export_row(rng, url, stamp)
+                    )
+                    raw.write(line.encode() + b"\n")
+            paths.append(path)
+    return paths
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes elsewhere.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=4, help="15-minute slots (export+GKG each)")
+    parser.add_argument("--rows", type=int, default=20000, help="Rows per file")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        paths = write_fixtures(directory, args.files, args.rows, rng)
+        archive_mb = sum(p.stat().st_size for p in paths) / (1024 * 1024)
+
+        started = time.perf_counter()
+        records = sum(1 for path in paths for _ in iter_records(path))
+        parse_seconds = time.perf_counter() - started
+        total_rows = len(paths) * args.rows
+        results: dict[str, object] = {
+            "files": len(paths),
+            "rows": total_rows,
+            "archive_mb": round(archive_mb, 2),
+            "parse_only": {
+                "records": records,
+                "seconds": round(parse_seconds, 3),
+                "rows_per_second": round(total_rows / parse_seconds, 1),
+                "peak_rss_mb": round(peak_rss_mb(), 1),
+            },
+        }
+        for workers in args.workers:
+            store = LocalArticleStore(directory / f"store-{workers}.sqlite3", retention_days=3650)
+            stats = ingest_files(paths, store, workers=workers)
+            results[f"ingest_workers_{workers}"] = {
+                **stats.as_dict(),
+                "stored": store.count(),
+                "peak_rss_mb": round(peak_rss_mb(), 1),
+            }
+            store.close()
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
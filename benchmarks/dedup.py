@@ -0,0 +1,84 @@
+"""Benchmark near-duplicate collapsing on synthetic syndicated articles.
+
+Generates batches where a share of stories is re-published across several
+domains with small title edits, then reports the cost per 1k articles and how
+many were collapsed. Runs offline.
+
+Usage:
+  python benchmarks/dedup.py [--sizes 1000 5000] [--syndication 0.4] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+
+from world_news.clients import Article
+from world_news.dedup import collapse_duplicates
+
+WORDS = (
+    "government election minister court storm market police climate talks ceasefire "
+    "inflation protest company shares energy health vaccine border trade summit "
+    "president parliament earthquake flood wildfire strike bank rates oil war peace"
+).split()
+DOMAINS = [f"news{i}.example.com" for i in range(200)]
+
+
+def make_articles(size: int, syndication: float, rng: random.Random) -> list[Article]:
+    articles: list[Article] = []
+    story = 0
+    while len(articles) < size:
+        story += 1
+        title = " ".join(rng.choice(WORDS) for _ in range(rng.randint(7, 12))).capitalize()
+        snippet = " ".join(rng.choice(WORDS) for _ in range(30))
+        copies = rng.randint(2, 8) if rng.random() < syndication else 1
+        for copy in range(copies):
+            domain = rng.choice(DOMAINS)
+            variant = title if copy % 3 else f"{title} - {domain.split('.')[0].title()}"
+            articles.append(
+                Article(
+                    title=variant,
+                    url=f"https://www.{domain}/story/{story}?utm_source=feed{copy}",
+                    domain=domain,
+                    snippet=snippet,
+                    isduplicate=1 if copy else 0,
+                )
+            )
+    return articles[:size]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[250, 1000, 5000])
+    parser.add_argument("--syndication", type=float, default=0.4)
+    parser.add_argument("--max-distance", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    results = []
+    for size in args.sizes:
+        articles = make_articles(size, args.syndication, random.Random(args.seed))
+        timings = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            collapsed = collapse_duplicates(articles, max_distance=args.max_distance)
+            timings.append(time.perf_counter() - started)
+        best = min(timings)
+        results.append(
+            {
+                "articles": size,
+                "representatives": len(collapsed),
+                "collapsed": size - len(collapsed),
+                "seconds": round(best, 4),
+                "ms_per_1k_articles": round(best / size * 1000 * 1000, 2),
+            }
+        )
+    print(json.dumps({"max_distance": args.max_distance, "results": results}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,64 @@
+"""Benchmark the rule-based planner against a corpus of sample questions.
+
+Reports how many planner LLM calls the fast path avoids at a given confidence
+threshold, plus the per-question cost of the local rules. Runs offline.
+
+Usage:
+  python benchmarks/fast_planner.py [--threshold 0.8] [--questions FILE] [--verbose]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+from world_news.fast_planner import plan_locally
+
+DEFAULT_QUESTIONS = Path(__file__).parent / "data" / "sample_questions.txt"
+
+
+def load_questions(path: Path) -> list[str]:
+    lines = path.read_text(encoding="utf-8").splitlines()
+    return [line.strip() for line in lines if line.strip() and not line.startswith("#")]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threshold", type=float, default=0.8)
+    parser.add_argument("--questions", type=Path, default=DEFAULT_QUESTIONS)
+    parser.add_argument("--repeat", type=int, default=200, help="Timing repetitions per question")
+    parser.add_argument("--verbose", action="store_true", help="Print every plan")
+    args = parser.parse_args(argv)
+
+    questions = load_questions(args.questions)
+    handled = 0
+    for question in questions:
+        local = plan_locally(question)
+        accepted = local.confidence >= args.threshold
+        handled += accepted
+        if args.verbose:
+            route = "rules" if accepted else "llm"
+            print(f"[{route} {local.confidence:.2f}] {question!r} -> {local.plan}")
+
+    started = time.perf_counter()
+    for _ in range(args.repeat):
+        for question in questions:
+            plan_locally(question)
+    elapsed = time.perf_counter() - started
+
+    report = {
+        "questions": len(questions),
+        "threshold": args.threshold,
+        "llm_calls_baseline": len(questions),
+        "llm_calls_with_fast_path": len(questions) - handled,
+        "llm_call_reduction": round(handled / len(questions), 3) if questions else 0.0,
+        "rules_us_per_question": round(elapsed / (args.repeat * len(questions)) * 1e6, 2),
+    }
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,247 @@
+"""Offline load benchmark of the pipeline, `NewsService.search` and `/chat`.
+
+Starts a stub GDELT HTTP server and a fake Gemini model (see `stubs.py`), then
+drives each scenario at several concurrency levels and reports p50/p95/p99
+latency, throughput, error count and memory as JSON, so runs can be compared.
+Caches (search cache, local store, plan cache, response cache) are off unless
+``--warm`` is given, so every request exercises the full path.
+
+Usage:
+  python benchmarks/load.py [--scenarios pipeline search chat] [--concurrency 1 8 32]
+      [--requests 200] [--gdelt-latency-ms 50] [--gemini-latency-ms 400]
+      [--error-rate 0] [--warm] [--speculative] [--output results.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import resource
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+from stubs import FakeGenerativeModel, StubConfig, StubGDELTServer, iter_cycle, load_questions
+
+from world_news.clients import GDELTClient, GeminiClient
+from world_news.config import GDELTConfig, PipelineConfig, ProjectConfig
+from world_news.generation_cache import GenerationCache
+from world_news.pipeline import PipelineTrace, run_pipeline_async
+from world_news.service import NewsService
+from world_news.text import extract_keywords
+
+SCENARIOS = ("pipeline", "search", "chat")
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes elsewhere.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+async def drive(
+    call: Callable[[str], Awaitable[Any]], inputs: list[str], concurrency: int
+) -> dict[str, float]:
+    """Issue ``call`` for every input with at most ``concurrency`` in flight."""
+
+    limit = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    errors = 0
+
+    async def one(value: str) -> None:
+        nonlocal errors
+        async with limit:
+            started = time.perf_counter()
+            try:
+                await call(value)
+            except Exception:
+                errors += 1
+                return
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(v) for v in inputs))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "requests": len(inputs),
+        "errors": errors,
+        "seconds": round(elapsed, 3),
+        "throughput_rps": round(len(inputs) / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+    }
+
+
+def build_service(
+    endpoint: str, model: FakeGenerativeModel, *, warm: bool, speculative: bool = False
+) -> NewsService:
+    # No rate cap: measure our own overhead. Retries and adaptive concurrency stay on.
+    gdelt = GDELTConfig(
+        backend="http", endpoint=endpoint, cache_enabled=warm, rate_limit_per_second=0
+    )
+    pipeline = PipelineConfig(
+        plan_cache_enabled=False,
+        local_store_enabled=False,
+        speculative_retrieval=speculative,
+    )
+    response_cache = GenerationCache(max_entries=1024, ttl=3600) if warm else None
+    return NewsService(
+        gdelt_client=GDELTClient.create_default(gdelt),
+        gemini_client=GeminiClient(model=model, response_cache=response_cache),  # type: ignore[arg-type]
+        config=ProjectConfig(gdelt=gdelt, pipeline=pipeline),
+    )
+
+
+def scenario_call(
+    name: str, service: NewsService, speculation: Counter[str] | None = None
+) -> Callable[[str], Awaitable[Any]]:
+    if name == "pipeline":
+
+        async def pipeline(question: str) -> Any:
+            trace = PipelineTrace()
+            answer = await run_pipeline_async(
+                question,
+                service.planner_llm,
+                service.retriever,
+                service.gemini_client,
+                config=service.config.pipeline,
+                trace=trace,
+            )
+            if speculation is not None and trace.speculative_query is not None:
+                speculation["hits" if trace.speculative_hit else "misses"] += 1
+            return answer
+
+        return pipeline
+    if name == "search":
+
+        async def search(question: str) -> Any:
+            return await service.search_async(extract_keywords(question), max_records=75)
+
+        return search
+    if name == "chat":
+        import httpx
+
+        from world_news import app as app_module
+
+        app_module.use_service(service)
+        client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app_module.app), base_url="http://bench"
+        )
+
+        async def chat(question: str) -> Any:
+            response = await client.post("/chat", json={"query": question})
+            response.raise_for_status()
+            return response.json()
+
+        return chat
+    raise ValueError(f"Unknown scenario {name!r}; expected one of {SCENARIOS}")
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    questions = load_questions(args.questions)
+    gdelt_stub = StubConfig(
+        latency_ms=args.gdelt_latency_ms,
+        jitter_ms=args.gdelt_latency_ms / 5,
+        payload=args.gdelt_articles,
+        snippet_chars=args.snippet_chars,
+        error_rate=args.error_rate,
+    )
+    gemini_stub = StubConfig(
+        latency_ms=args.gemini_latency_ms,
+        jitter_ms=args.gemini_latency_ms / 5,
+        payload=args.gemini_words,
+        error_rate=args.error_rate,
+    )
+    results: list[dict[str, Any]] = []
+    with StubGDELTServer(gdelt_stub) as server:
+        for name in args.scenarios:
+            for concurrency in args.concurrency:
+                model = FakeGenerativeModel(config=gemini_stub)
+                service = build_service(
+                    server.endpoint, model, warm=args.warm, speculative=args.speculative
+                )
+                speculation: Counter[str] = Counter()
+                call = scenario_call(name, service, speculation)
+                inputs = list(iter_cycle(questions, args.requests))
+                if args.tracemalloc:
+                    tracemalloc.start()
+                stats = await drive(call, inputs, concurrency)
+                if args.tracemalloc:
+                    stats["alloc_peak_mb"] = round(tracemalloc.get_traced_memory()[1] / 2**20, 1)
+                    tracemalloc.stop()
+                results.append(
+                    {
+                        "scenario": name,
+                        "concurrency": concurrency,
+                        **stats,
+                        "gdelt_requests": server.requests,
+                        "gemini_calls": model.calls,
+                        "gdelt_retries": service.stats().get("gdelt_limiter", {}).get("retries", 0),
+                        "peak_rss_mb": round(peak_rss_mb(), 1),
+                    }
+                )
+                if args.speculative and name == "pipeline":
+                    results[-1]["speculative_hits"] = speculation["hits"]
+                    results[-1]["speculative_misses"] = speculation["misses"]
+                server.requests = 0
+    return {
+        "python": platform.python_version(),
+        "settings": {
+            "requests": args.requests,
+            "warm": args.warm,
+            "speculative": args.speculative,
+            "gdelt": asdict(gdelt_stub),
+            "gemini": asdict(gemini_stub),
+        },
+        "results": results,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument(
+        "--questions", type=Path, default=Path(__file__).parent / "data" / "sample_questions.txt"
+    )
+    parser.add_argument("--gdelt-latency-ms", type=float, default=50.0)
+    parser.add_argument("--gdelt-articles", type=int, default=75)
+    parser.add_argument("--snippet-chars", type=int, default=300)
+    parser.add_argument("--gemini-latency-ms", type=float, default=400.0)
+    parser.add_argument("--gemini-words", type=int, default=150)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--warm", action="store_true", help="Enable caches")
+    parser.add_argument("--speculative", action="store_true", help="Enable speculative retrieval")
+    parser.add_argument("--tracemalloc", action="store_true", help="Report Python alloc peak")
+    parser.add_argument("--output", type=Path, help="Also write the JSON report here")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(run(args))
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,87 @@
+"""Benchmark BM25 reranking of a retrieved batch against a question.
+
+Builds synthetic batches (250 articles by default, GDELT's per-request maximum)
+where a minority of articles is on-topic, then reports rerank time and how many
+on-topic articles land in the kept top-k. Runs offline.
+
+Usage:
+  python benchmarks/rerank.py [--sizes 250 1000] [--top-k 25] [--repeat 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import time
+
+from world_news.clients import Article
+from world_news.rerank import rerank
+
+WORDS = (
+    "government election minister court storm market police climate talks ceasefire "
+    "inflation protest company shares energy health vaccine border trade summit "
+    "president parliament earthquake flood wildfire strike bank rates oil war"
+).split()
+QUESTION = "What is the latest on the Gaza ceasefire negotiations in Cairo?"
+TOPIC = ["gaza", "ceasefire", "negotiations", "cairo", "hostages", "mediators"]
+
+
+def make_articles(size: int, on_topic: float, rng: random.Random) -> list[Article]:
+    articles: list[Article] = []
+    for i in range(size):
+        relevant = rng.random() < on_topic
+        pool = WORDS + TOPIC * 3 if relevant else WORDS
+        title = " ".join(rng.choice(pool) for _ in range(rng.randint(6, 12))).capitalize()
+        snippet = " ".join(rng.choice(pool) for _ in range(rng.randint(20, 40)))
+        articles.append(
+            Article(
+                title=title,
+                url=f"https://news{i % 40}.example.com/{i}{'-topic' if relevant else ''}",
+                snippet=snippet,
+            )
+        )
+    return articles
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[250, 1000])
+    parser.add_argument("--top-k", type=int, default=25)
+    parser.add_argument("--on-topic", type=float, default=0.1)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    results = []
+    for size in args.sizes:
+        articles = make_articles(size, args.on_topic, rng)
+        timings = []
+        kept: list[Article] = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            kept = rerank(articles, QUESTION, top_k=args.top_k)
+            timings.append(time.perf_counter() - started)
+        relevant = sum(a.url.endswith("-topic") for a in articles)
+        relevant_kept = sum(a.url.endswith("-topic") for a in kept)
+        # By date order the first top-k would be kept instead.
+        relevant_first = sum(a.url.endswith("-topic") for a in articles[: args.top_k])
+        results.append(
+            {
+                "articles": size,
+                "top_k": args.top_k,
+                "rerank_ms_median": round(statistics.median(timings) * 1000, 3),
+                "rerank_ms_max": round(max(timings) * 1000, 3),
+                "on_topic_total": relevant,
+                "on_topic_in_top_k": relevant_kept,
+                "on_topic_in_first_k": relevant_first,
+            }
+        )
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,105 @@
+"""Cold-start benchmark: import cost of the app, the MCP server and the service.
+
+Imports each target module in a fresh interpreter under ``python -X importtime``
+and reports its cumulative import time, the heaviest packages it pulled in, and
+the wall time of the whole process (interpreter start included, median of
+``--repeat`` runs). Nothing is built at import, so no API key or network is
+needed. Exits non-zero when a target exceeds ``--budget-ms`` or imports one of
+the heavy dependencies that must stay lazy (``--forbid``).
+
+Usage:
+  PYTHONPATH=src python benchmarks/startup.py [--targets world_news.app world_news.service]
+      [--budget-ms 1000] [--repeat 5] [--top 8]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any
+
+TARGETS = ("world_news.app", "world_news.mcp_server", "world_news.service")
+# Imported on first use by the clients; a cold start must not pay for them.
+FORBIDDEN = ("google.generativeai", "gdeltdoc", "pandas")
+
+
+def import_profile(module: str) -> tuple[float, list[tuple[str, int, int]]]:
+    """Wall seconds of ``python -X importtime -c 'import module'`` and its rows.
+
+    Rows are ``(name, self_us, cumulative_us)`` in the order Python reports them.
+    """
+
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-W", "ignore", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+        check=False,
+    )
+    elapsed = time.perf_counter() - started
+    if proc.returncode != 0:
+        last = proc.stderr.strip().splitlines()[-1:] or ["unknown error"]
+        raise RuntimeError(f"import {module} failed: {last[0]}")
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        rows.append((name.rstrip(), int(self_us), int(cumulative_us)))
+    return elapsed, rows
+
+
+def summarize(module: str, repeat: int, top: int) -> dict[str, Any]:
+    walls, cumulative = [], []
+    rows: list[tuple[str, int, int]] = []
+    for _ in range(repeat):
+        wall, rows = import_profile(module)
+        walls.append(wall)
+        cumulative.append(next(c for name, _, c in rows if name.strip() == module) / 1000)
+    packages: dict[str, int] = {}
+    for name, self_us, _ in rows:
+        root = name.strip().split(".")[0]
+        packages[root] = packages.get(root, 0) + self_us
+    heaviest = sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]
+    imported = {name.strip() for name, _, _ in rows}
+    return {
+        "target": module,
+        "import_ms_median": round(statistics.median(cumulative), 1),
+        "process_wall_ms_median": round(statistics.median(walls) * 1000, 1),
+        "modules_imported": len(imported),
+        "heaviest_packages_ms": {name: round(us / 1000, 1) for name, us in heaviest},
+        "forbidden_imported": [name for name in FORBIDDEN if name in imported],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--targets", nargs="+", default=list(TARGETS))
+    parser.add_argument("--budget-ms", type=float, default=1000.0, help="Import budget per target")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=8, help="Heaviest packages to list")
+    args = parser.parse_args(argv)
+
+    results, failed = [], False
+    for target in args.targets:
+        try:
+            result = summarize(target, args.repeat, args.top)
+        except RuntimeError as exc:
+            results.append({"target": target, "error": str(exc)})
+            failed = True
+            continue
+        result["within_budget"] = result["import_ms_median"] <= args.budget_ms
+        failed = failed or not result["within_budget"] or bool(result["forbidden_imported"])
+        results.append(result)
+    print(json.dumps({"budget_ms": args.budget_ms, "results": results}, indent=2))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,241 @@
+"""Offline stand-ins for GDELT and Gemini used by the benchmark suite.
+
+`StubGDELTServer` is a local HTTP server speaking the Doc API's
+``mode=artlist&format=json`` dialect; `FakeGenerativeModel` mimics the parts of
+``genai.GenerativeModel`` that `GeminiClient` uses. Both have configurable
+latency, payload size and error rate, so pipeline overhead can be measured
+without network access or API keys.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import random
+import re
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+from world_news.text import extract_keywords
+
+DEFAULT_QUESTIONS = Path(__file__).parent / "data" / "sample_questions.txt"
+FILLER = (
+    "officials said the government would respond after talks with regional partners "
+    "as markets reacted and analysts warned of further delays in the coming weeks"
+).split()
+
+
+def load_questions(path: Path = DEFAULT_QUESTIONS) -> list[str]:
+    lines = path.read_text(encoding="utf-8").splitlines()
+    return [line.strip() for line in lines if line.strip() and not line.startswith("#")]
+
+
+@dataclass
+class StubConfig:
+    """Behaviour of a stub backend.
+
+    Attributes:
+        latency_ms: Base latency of each call.
+        jitter_ms: Extra uniformly distributed latency.
+        payload: Articles per GDELT response, or words per Gemini response.
+        snippet_chars: Snippet length of stub GDELT articles.
+        error_rate: Share of calls that fail (HTTP 429/500, or a raised error).
+    """
+
+    latency_ms: float = 50.0
+    jitter_ms: float = 10.0
+    payload: int = 75
+    snippet_chars: int = 300
+    error_rate: float = 0.0
+    seed: int = 7
+
+    def delay(self, rng: random.Random) -> float:
+        return (self.latency_ms + rng.uniform(0.0, self.jitter_ms)) / 1000.0
+
+
+def stub_articles(query: str, count: int, snippet_chars: int) -> list[dict[str, Any]]:
+    """Deterministic artlist records mentioning the query terms."""
+
+    terms = re.findall(r"\w+", query.lower()) or ["news"]
+    now = datetime.now(UTC)
+    articles = []
+    for i in range(count):
+        words = [
+            terms[(i + j) % len(terms)] if j % 4 == 0 else FILLER[(i + j) % len(FILLER)]
+            for j in range(max(8, snippet_chars // 6))
+        ]
+        snippet = " ".join(words)[:snippet_chars]
+        seen = now - timedelta(minutes=7 * i)
+        articles.append(
+            {
+                "url": f"https://news{i % 60}.example.com/{'-'.join(terms)}/{i}",
+                "title": f"{' '.join(terms).title()} update {i}: {' '.join(words[1:7])}",
+                "seendate": seen.strftime("%Y%m%dT%H%M%SZ"),
+                "socialimage": "",
+                "domain": f"news{i % 60}.example.com",
+                "language": "English",
+                "sourcecountry": "United States",
+                "snippet": snippet,
+            }
+        )
+    return articles
+
+
+class _Server(ThreadingHTTPServer):
+    # The default backlog of 5 drops connections under concurrent load.
+    request_queue_size = 256
+    daemon_threads = True
+
+
+class StubGDELTServer:
+    """Threaded local HTTP server answering ``GET /api/v2/doc/doc`` like GDELT."""
+
+    def __init__(self, config: StubConfig | None = None) -> None:
+        self.config = config or StubConfig()
+        self.requests = 0
+        self.errors = 0
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._server = _Server(("127.0.0.1", 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def endpoint(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api/v2/doc/doc"
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:  # noqa: N802
+                params = parse_qs(urlsplit(self.path).query)
+                with stub._lock:
+                    stub.requests += 1
+                    delay = stub.config.delay(stub._rng)
+                    failed = stub._rng.random() < stub.config.error_rate
+                    if failed:
+                        stub.errors += 1
+                time.sleep(delay)
+                if failed:
+                    body = b"Please limit requests to one every 5 seconds"
+                    self._send(429 if stub.requests % 2 else 500, body, "text/plain")
+                    return
+                query = re.sub(r"\w+:\S+", " ", params.get("query", [""])[0])
+                count = min(int(params.get("maxrecords", ["75"])[0]), stub.config.payload)
+                articles = stub_articles(query, count, stub.config.snippet_chars)
+                self._send(200, json.dumps({"articles": articles}).encode(), "application/json")
+
+            def _send(self, status: int, body: bytes, content_type: str) -> None:
+                # Cancelled (e.g. hedged) requests hang up before the reply.
+                with contextlib.suppress(BrokenPipeError, ConnectionResetError):
+                    self.send_response(status)
+                    self.send_header("Content-Type", content_type)
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+                pass
+
+        return Handler
+
+    def __enter__(self) -> StubGDELTServer:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@dataclass
+class _Usage:
+    prompt_token_count: int
+    candidates_token_count: int
+    total_token_count: int
+
+
+@dataclass
+class _Chunk:
+    text: str
+    usage_metadata: _Usage | None = None
+
+
+def _usage(prompt: Any, text: str) -> _Usage:
+    # Roughly four characters per token, like the context packer's estimate.
+    prompt_tokens, output_tokens = len(str(prompt)) // 4, len(text) // 4
+    return _Usage(prompt_tokens, output_tokens, prompt_tokens + output_tokens)
+
+
+@dataclass
+class FakeGenerativeModel:
+    """Drop-in for ``genai.GenerativeModel`` with scripted latency and output size.
+
+    Planner prompts get a JSON plan built from the question's keywords; every other
+    prompt gets ``payload`` words of filler text.
+    """
+
+    config: StubConfig = field(default_factory=lambda: StubConfig(latency_ms=400, payload=150))
+    model_name: str = "models/fake-gemini"
+    calls: int = 0
+    errors: int = 0
+    _rng: random.Random = field(default_factory=random.Random, repr=False)
+
+    def _respond(self, prompt: Any) -> str:
+        self.calls += 1
+        if self._rng.random() < self.config.error_rate:
+            self.errors += 1
+            raise RuntimeError("503 The model is overloaded. Please try again later.")
+        text = str(prompt)
+        if "USER QUESTION:" in text:
+            question = text.rsplit("USER QUESTION:", 1)[1].strip()
+            plan = {"query": extract_keywords(question) or question, "max_records": 75}
+            return json.dumps(plan)
+        return " ".join(FILLER[i % len(FILLER)] for i in range(self.config.payload))
+
+    def _chunks(self, text: str) -> list[str]:
+        words = text.split(" ")
+        return [" ".join(words[i : i + 8]) + " " for i in range(0, len(words), 8)]
+
+    def generate_content(self, prompt: Any, stream: bool = False, **_: Any) -> Any:
+        time.sleep(self.config.delay(self._rng))
+        text = self._respond(prompt)
+        if stream:
+            chunks = [_Chunk(c) for c in self._chunks(text)]
+            chunks[-1].usage_metadata = _usage(prompt, text)
+            return iter(chunks)
+        return _Chunk(text, _usage(prompt, text))
+
+    async def generate_content_async(self, prompt: Any, stream: bool = False, **_: Any) -> Any:
+        delay = self.config.delay(self._rng)
+        if not stream:
+            await asyncio.sleep(delay)
+            text = self._respond(prompt)
+            return _Chunk(text, _usage(prompt, text))
+        # Time to first token is a third of the latency; the rest spreads over chunks.
+        await asyncio.sleep(delay / 3)
+        text = self._respond(prompt)
+        chunks = self._chunks(text)
+        return _stream(chunks, 2 * delay / 3 / max(1, len(chunks)), _usage(prompt, text))
+
+
+async def _stream(chunks: list[str], gap: float, usage: _Usage) -> AsyncIterator[_Chunk]:
+    for i, chunk in enumerate(chunks):
+        await asyncio.sleep(gap)
+        yield _Chunk(chunk, usage if i == len(chunks) - 1 else None)
+
+
+def iter_cycle(items: list[str], count: int) -> Iterator[str]:
+    for i in range(count):
+        yield items[i % len(items)]
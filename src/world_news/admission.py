@@ -0,0 +1,219 @@
+"""Admission control and load shedding for the chat endpoints.
+
+When Gemini or GDELT slows down, requests would otherwise pile up on the event
+loop until everyone times out. `AdmissionController` bounds the number of
+pipeline runs in flight and the number of requests waiting for a slot. A waiting
+request gives up after its queue deadline. Requests that cannot be admitted fail
+fast with `OverloadedError`, which carries a ``Retry-After`` estimate based on recent
+run times. A request may take several slots at once (a batch charges one per
+question it runs concurrently); waiters are served strictly in arrival order.
+
+Under pressure (queue depth at or above ``degrade_queue_depth`` on arrival),
+admitted requests are flagged as degraded. Callers then run the pipeline with
+`degraded_config`: the rule-based planner only (no planner LLM) and a lower
+record cap.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import math
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from dataclasses import asdict, dataclass, replace
+
+from .config import PipelineConfig
+
+# Weight of the newest run time in the moving average used for Retry-After.
+_EWMA_ALPHA = 0.2
+
+
+class OverloadedError(Exception):
+    """The request was shed; retry after ``retry_after`` seconds."""
+
+    def __init__(self, reason: str, retry_after: int) -> None:
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+@dataclass
+class AdmissionStats:
+    """Counters of admitted, queued, shed and degraded requests."""
+
+    admitted: int = 0
+    queued: int = 0
+    shed_queue_full: int = 0
+    shed_timeout: int = 0
+    degraded: int = 0
+
+    def as_dict(self) -> dict[str, float]:
+        return {k: float(v) for k, v in asdict(self).items()}
+
+
+@dataclass
+class Admission:
+    """A granted slot; ``degraded`` asks the caller to run the cheap pipeline."""
+
+    degraded: bool = False
+    admitted_at: float = 0.0
+    released: bool = False
+    slots: int = 1
+
+
+class AdmissionController:
+    """Bounded concurrency plus a bounded FIFO wait queue with per-request deadlines.
+
+    Args:
+        max_concurrent: Slots, i.e. pipeline runs allowed at once.
+        max_queue: Requests allowed to wait for a slot; more are shed at once.
+        queue_timeout: Default longest wait for a slot, in seconds.
+        degrade_queue_depth: Queue depth on arrival from which admitted requests are
+            degraded; 0 disables degraded mode.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int,
+        max_queue: int,
+        queue_timeout: float,
+        degrade_queue_depth: int = 0,
+    ) -> None:
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_queue = max(0, max_queue)
+        self.queue_timeout = queue_timeout
+        self.degrade_queue_depth = degrade_queue_depth
+        self.running = 0
+        self.stats = AdmissionStats()
+        self._waiters: deque[tuple[asyncio.Future[None], int]] = deque()
+        self._avg_seconds = 1.0
+
+    @classmethod
+    def from_config(cls, config: PipelineConfig) -> AdmissionController:
+        return cls(
+            max_concurrent=config.admission_max_concurrent,
+            max_queue=config.admission_max_queue,
+            queue_timeout=config.admission_queue_timeout_seconds,
+            degrade_queue_depth=config.admission_degrade_queue_depth,
+        )
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    def retry_after(self) -> int:
+        """Seconds until a slot is likely free: queued rounds times the average run."""
+
+        rounds = (self.queue_depth + 1) / self.max_concurrent
+        return max(1, min(60, math.ceil(rounds * self._avg_seconds)))
+
+    def stats_dict(self) -> dict[str, float]:
+        return {
+            **self.stats.as_dict(),
+            "running": float(self.running),
+            "queue_depth": float(self.queue_depth),
+            "avg_run_seconds": round(self._avg_seconds, 3),
+        }
+
+    async def acquire(self, timeout: float | None = None, *, slots: int = 1) -> Admission:
+        """Take ``slots`` slots, waiting up to ``timeout`` (default ``queue_timeout``).
+
+        ``slots`` is capped at ``max_concurrent`` so a large request can still run.
+
+        Raises:
+            OverloadedError: The queue is full, or the wait exceeded the deadline.
+        """
+
+        slots = min(max(1, slots), self.max_concurrent)
+        degraded = 0 < self.degrade_queue_depth <= self.queue_depth
+        if self.running + slots <= self.max_concurrent and not self._waiters:
+            self.running += slots
+            return self._admit(degraded, slots)
+        if self.queue_depth >= self.max_queue:
+            self.stats.shed_queue_full += 1
+            raise OverloadedError("server is busy", self.retry_after())
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append((waiter, slots))
+        self.stats.queued += 1
+        try:
+            await asyncio.wait_for(waiter, self.queue_timeout if timeout is None else timeout)
+        except BaseException as exc:
+            with contextlib.suppress(ValueError):
+                self._waiters.remove((waiter, slots))
+            if waiter.done() and not waiter.cancelled():
+                # The slots were handed over just as we gave up; pass them on.
+                self._release_slots(slots)
+            else:
+                # Leaving the head of the queue may let smaller requests behind it in.
+                self._wake()
+            if isinstance(exc, TimeoutError):
+                self.stats.shed_timeout += 1
+                raise OverloadedError(
+                    "timed out waiting for capacity", self.retry_after()
+                ) from None
+            raise
+        # `release` handed the slots to this waiter; `running` already counts them.
+        return self._admit(degraded, slots)
+
+    def _admit(self, degraded: bool, slots: int) -> Admission:
+        self.stats.admitted += 1
+        if degraded:
+            self.stats.degraded += 1
+        return Admission(degraded=degraded, admitted_at=time.monotonic(), slots=slots)
+
+    def release(self, admission: Admission) -> None:
+        """Return the slots of ``admission`` and record its run time; idempotent."""
+
+        if admission.released:
+            return
+        admission.released = True
+        elapsed = time.monotonic() - admission.admitted_at
+        self._avg_seconds += _EWMA_ALPHA * (elapsed - self._avg_seconds)
+        self._release_slots(admission.slots)
+
+    def _release_slots(self, slots: int) -> None:
+        self.running -= slots
+        self._wake()
+
+    def _wake(self) -> None:
+        # Hand free slots to waiters in arrival order; a large request at the head
+        # is not overtaken, so it cannot starve.
+        while self._waiters:
+            waiter, slots = self._waiters[0]
+            if waiter.done():
+                self._waiters.popleft()
+                continue
+            if self.running + slots > self.max_concurrent:
+                return
+            self._waiters.popleft()
+            self.running += slots
+            waiter.set_result(None)
+
+    @contextlib.asynccontextmanager
+    async def admit(
+        self, timeout: float | None = None, *, slots: int = 1
+    ) -> AsyncIterator[Admission]:
+        """``async with`` form of `acquire` / `release`."""
+
+        admission = await self.acquire(timeout, slots=slots)
+        try:
+            yield admission
+        finally:
+            self.release(admission)
+
+
+def degraded_config(config: PipelineConfig) -> PipelineConfig:
+    """Cheaper pipeline settings for overload: rules planner only, fewer records."""
+
+    cap = config.degraded_max_records
+    return replace(
+        config,
+        fast_planner=True,
+        fast_planner_threshold=0.0,
+        speculative_retrieval=False,
+        max_records_cap=min(cap, config.max_records_cap or cap),
+        rerank_top_k=min(config.rerank_top_k, cap),
+    )
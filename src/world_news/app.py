@@ -2,15 +2,31 @@
 
 The endpoint fetches relevant articles from GDELT and answers the user's
 question using Gemini, grounded in the fetched articles.
+
+Importing this module builds nothing: the `NewsService` (settings, YAML, clients)
+is created on startup by the lifespan, or on first use via `get_service`. Tests
+and benchmarks can install their own with `use_service`.
 """
 
 from __future__ import annotations
 
-from fastapi import FastAPI
+import json
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 from pydantic import BaseModel, Field
+from starlette.background import BackgroundTask
 
-from .config import get_settings
-from .pipeline import run_pipeline
+from .admission import Admission, AdmissionController, OverloadedError, degraded_config
+from .batch import answer_batch_async
+from .clients import GDELTThrottledError, GDELTTransientError
+from .config import PipelineConfig, get_settings
+from .ingest import IngestScheduler
+from .metrics import METRICS, request_timings, timed
+from .pipeline import PipelineEvent, PipelineTrace, run_pipeline_async, stream_pipeline_async
 from .service import NewsService
 
 
@@ -18,6 +34,12 @@ class ChatRequest(BaseModel):
     """Request body for the chat endpoint."""
 
     query: str = Field(..., description="User's question or topic")
+    budget_seconds: float | None = Field(
+        None,
+        gt=0,
+        le=300,
+        description="Latency budget; stages degrade to answer within it",
+    )
 
 
 class ChatResponse(BaseModel):
@@ -25,39 +47,279 @@ class ChatResponse(BaseModel):
 
     answer: str
     num_articles: int
+    degradations: list[str] = Field(
+        default_factory=list, description="Shortcuts taken to answer in time"
+    )
+
+
+class BatchChatRequest(BaseModel):
+    """Request body for the batch chat endpoint."""
+
+    queries: list[str] = Field(..., min_length=1, description="Related questions to answer")
+
+
+class BatchChatItem(BaseModel):
+    """Answer (or error) for one question of a batch."""
+
+    query: str
+    answer: str | None = None
+    num_articles: int = 0
+    error: str | None = None
+
+
+class BatchChatResponse(BaseModel):
+    """Response body for the batch chat endpoint."""
+
+    results: list[BatchChatItem]
+    gdelt_fetches: int
+    degradations: list[str] = Field(
+        default_factory=list, description="Shortcuts taken to answer in time"
+    )
 
 
 def build_service() -> NewsService:
     settings = get_settings()
     return NewsService.create_default(
-        gemini_api_key=settings.gemini_api_key, gemini_model=settings.gemini_model
+        gemini_api_key=settings.gemini_api_key,
+        gemini_model=settings.gemini_model,
+        config=settings.project,
     )
 
 
-app = FastAPI(title="World News Chat API", version="0.1.0")
-service = build_service()
+_service: NewsService | None = None
+_admission: AdmissionController | None = None
+
+
+def use_service(service: NewsService) -> None:
+    """Serve requests with ``service``, with admission control and metrics from its config."""
+
+    global _service, _admission
+    _service = service
+    _admission = AdmissionController.from_config(service.config.pipeline)
+    METRICS.enabled = service.config.pipeline.metrics_enabled
+
+
+def get_service() -> NewsService:
+    """The app's service, built from settings on first use."""
+
+    if _service is None:
+        use_service(build_service())
+    assert _service is not None
+    return _service
+
+
+def get_admission() -> AdmissionController:
+    get_service()
+    assert _admission is not None
+    return _admission
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Build the service and run the watched-topic ingest scheduler when enabled."""
+
+    service = get_service()
+    ingest = service.config.ingest
+    scheduler = IngestScheduler(service.gdelt_client, ingest) if ingest.enabled else None
+    if scheduler is not None:
+        scheduler.start()
+    try:
+        yield
+    finally:
+        if scheduler is not None:
+            await scheduler.stop()
+        if service.gdelt_client.store is not None:
+            service.gdelt_client.store.flush()
+
+
+app = FastAPI(title="World News Chat API", version="0.1.0", lifespan=lifespan)
+
+# GDELT asks throttled clients for one request every 5 seconds.
+GDELT_RETRY_AFTER_SECONDS = 5
+
+
+@app.exception_handler(GDELTThrottledError)
+@app.exception_handler(GDELTTransientError)
+async def gdelt_unavailable(request: Request, exc: Exception) -> JSONResponse:
+    """GDELT still failed after the client's retries; ask the caller to come back later."""
+
+    return JSONResponse(
+        status_code=503,
+        content={"detail": f"GDELT is unavailable: {exc}"},
+        headers={"Retry-After": str(GDELT_RETRY_AFTER_SECONDS)},
+    )
+
+
+@app.exception_handler(OverloadedError)
+async def overloaded(request: Request, exc: OverloadedError) -> JSONResponse:
+    """Shed load: the pipeline slots and the wait queue are full."""
+
+    return JSONResponse(
+        status_code=503,
+        content={"detail": f"Overloaded: {exc.reason}"},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
+def pipeline_options(ticket: Admission, trace: PipelineTrace) -> PipelineConfig:
+    """Pipeline config for an admitted request; cheaper when admitted under pressure."""
+
+    config = get_service().config.pipeline
+    if not ticket.degraded:
+        return config
+    trace.degradations.append("overload")
+    return degraded_config(config)
 
 
 @app.post("/chat", response_model=ChatResponse)
-def chat(req: ChatRequest) -> ChatResponse:
+async def chat(req: ChatRequest, response: Response) -> ChatResponse:
     """Answer a news-related question based on fresh GDELT data.
 
     This endpoint fetches relevant articles then answers grounded in those
-    articles. It returns the answer and the number of articles used.
+    articles. It returns the answer and the number of articles used. It runs
+    on the event loop, so no threadpool worker is held while waiting on I/O.
+    Stage durations are returned in the ``Server-Timing`` header.
+
+    At most ``pipeline.admission_max_concurrent`` requests run at once; others wait
+    in a bounded queue and get a 503 with ``Retry-After`` once it is full or their
+    wait times out. Requests admitted under pressure skip the planner LLM and fetch
+    fewer records; ``degradations`` then lists ``"overload"``.
+
+    With a ``budget_seconds`` (or ``pipeline.default_budget_seconds``), time spent
+    queued counts against it and every stage degrades as needed to answer in time;
+    ``degradations`` lists the steps taken (see `world_news.deadline`).
     """
 
     # Two-LLM pipeline:
     # 1) Planner LLM creates a clean query and optional params
     # 2) Retrieve via GDELT
     # 3) Summarizer LLM produces the final answer
-    summary = run_pipeline(
+    service, admission = get_service(), get_admission()
+    trace = PipelineTrace()
+    budget = req.budget_seconds or service.config.pipeline.default_budget_seconds
+    arrived = time.monotonic()
+    with request_timings() as timings:
+        with timed("queue"):
+            queue_timeout = admission.queue_timeout
+            ticket = await admission.acquire(min(queue_timeout, budget or queue_timeout))
+        if budget is not None:
+            budget = max(0.0, budget - (time.monotonic() - arrived))
+        try:
+            with timed("total"):
+                summary = await run_pipeline_async(
+                    user_question=req.query,
+                    planner_llm=service.planner_llm,
+                    retriever=service.retriever,
+                    summarizer_llm=service.gemini_client,
+                    config=pipeline_options(ticket, trace),
+                    plan_cache=service.plan_cache,
+                    trace=trace,
+                    budget_seconds=budget,
+                )
+        finally:
+            admission.release(ticket)
+    if timings.stages:
+        response.headers["Server-Timing"] = timings.header()
+    return ChatResponse(
+        answer=summary, num_articles=trace.num_articles, degradations=trace.degradations
+    )
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+    """Stage timings, article counts, Gemini usage and cache counters for Prometheus."""
+
+    if not METRICS.enabled:
+        raise HTTPException(status_code=404, detail="Metrics are disabled")
+    components = {**get_service().stats(), "admission": get_admission().stats_dict()}
+    return PlainTextResponse(METRICS.render(components), media_type="text/plain; version=0.0.4")
+
+
+@app.post("/chat/batch", response_model=BatchChatResponse)
+async def chat_batch(req: BatchChatRequest) -> BatchChatResponse:
+    """Answer many related questions in one request.
+
+    Questions are planned concurrently; planned searches with the same terms and
+    overlapping windows share one GDELT fetch. Results keep the input order, and a
+    failing question reports its ``error`` without failing the batch.
+
+    A batch takes one admission slot per question it runs at once, i.e. up to
+    ``pipeline.batch_concurrency`` slots, for its whole run. Under pressure it runs
+    degraded and ``degradations`` lists ``"overload"``.
+    """
+
+    service, admission = get_service(), get_admission()
+    pipeline = service.config.pipeline
+    if len(req.queries) > pipeline.batch_max_questions:
+        raise HTTPException(
+            status_code=422, detail=f"At most {pipeline.batch_max_questions} queries per batch"
+        )
+    trace = PipelineTrace()
+    slots = min(len(req.queries), pipeline.batch_concurrency)
+    async with admission.admit(slots=slots) as ticket:
+        items, fetches = await answer_batch_async(
+            service, req.queries, config=pipeline_options(ticket, trace)
+        )
+    return BatchChatResponse(
+        results=[
+            BatchChatItem(
+                query=item.question,
+                answer=item.answer,
+                num_articles=item.num_articles,
+                error=item.error,
+            )
+            for item in items
+        ],
+        gdelt_fetches=fetches,
+        degradations=trace.degradations,
+    )
+
+
+@app.post("/chat/stream")
+async def chat_stream(req: ChatRequest) -> StreamingResponse:
+    """Stream the pipeline as server-sent events.
+
+    Events arrive in order: ``plan`` (the planned GDELT query), ``articles`` (as
+    soon as GDELT returns), ``token`` (summary chunks as Gemini generates them)
+    and ``done``. Failures after the stream started are sent as an ``error`` event.
+    Admission control applies as for ``/chat``; the slot is held until the stream ends.
+    """
+
+    service, admission = get_service(), get_admission()
+    ticket = await admission.acquire()
+    trace = PipelineTrace()
+    events = stream_pipeline_async(
         user_question=req.query,
-        planner_llm=service.gemini_client,
-        retriever=service.gdelt_client,
+        planner_llm=service.planner_llm,
+        retriever=service.retriever,
         summarizer_llm=service.gemini_client,
+        config=pipeline_options(ticket, trace),
+        plan_cache=service.plan_cache,
+        trace=trace,
     )
-    # We do not return article count here since retrieval is encapsulated in pipeline.
-    return ChatResponse(answer=summary, num_articles=0)
+    return StreamingResponse(
+        _sse(events, ticket),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        # Also released by `_sse`; covers streams that never start.
+        background=BackgroundTask(admission.release, ticket),
+    )
+
+
+async def _sse(events: AsyncIterator[PipelineEvent], ticket: Admission) -> AsyncIterator[str]:
+    try:
+        async for item in events:
+            yield format_sse(item.event, item.data)
+    except Exception as exc:  # the response has started; report in-band
+        yield format_sse("error", {"detail": str(exc) or type(exc).__name__})
+    finally:
+        get_admission().release(ticket)
+
+
+def format_sse(event: str, data: object) -> str:
+    """Encode one server-sent event; ``data`` is JSON-encoded on a single line."""
+
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
 
 
 def main() -> None:
@@ -68,5 +330,3 @@ def main() -> None:
 
 if __name__ == "__main__":
     main()
-
-
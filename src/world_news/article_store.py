@@ -0,0 +1,682 @@
+"""Local SQLite article store with an FTS5 index, and a local-first retriever.
+
+Every article returned by `GDELTClient` can be ingested into the store (writes are
+buffered and committed in batches). `LocalArticleStore` answers searches with the
+same signature as `GDELTClient.search_articles`, matching the query against an
+FTS5 index over title and snippet and filtering on indexed ``seendate``,
+``language``, ``sourcecountry`` and ``domain`` columns. The store also records
+coverage: for a normalized query and languages, which date windows GDELT results
+were written for, and when. `LocalFirstRetriever` serves a search from the store
+when recent coverage of the same query contains its window (or, for date-sorted
+searches, holds its newest results), and falls back to GDELT otherwise.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+
+from .cache import CacheStats
+from .clients.gdelt import DEFAULT_SEARCH_WINDOW, Article, ArticleRetriever, SearchRequest
+from .config.schemas import PipelineConfig
+from .fast_planner import LANGUAGE_CODES
+from .metrics import timed
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    url TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    snippet TEXT,
+    socialimage TEXT,
+    language TEXT,
+    sourcecountry TEXT,
+    domain TEXT,
+    seendate TEXT,
+    seen_ts REAL,
+    isduplicate INTEGER,
+    sourceurl TEXT,
+    ingested_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS articles_seen_ts ON articles (seen_ts);
+CREATE INDEX IF NOT EXISTS articles_language ON articles (language);
+CREATE INDEX IF NOT EXISTS articles_sourcecountry ON articles (sourcecountry);
+CREATE INDEX IF NOT EXISTS articles_domain ON articles (domain);
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+    title, snippet, content='articles', content_rowid='rowid'
+);
+CREATE TRIGGER IF NOT EXISTS articles_ai AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts (rowid, title, snippet)
+    VALUES (new.rowid, new.title, new.snippet);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_ad AFTER DELETE ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title, snippet)
+    VALUES ('delete', old.rowid, old.title, old.snippet);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_au AFTER UPDATE ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title, snippet)
+    VALUES ('delete', old.rowid, old.title, old.snippet);
+    INSERT INTO articles_fts (rowid, title, snippet)
+    VALUES (new.rowid, new.title, new.snippet);
+END;
+CREATE TABLE IF NOT EXISTS coverage (
+    topic TEXT NOT NULL,
+    start_date TEXT NOT NULL,
+    end_date TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (topic, start_date, end_date)
+);
+"""
+
+_COVER = """
+INSERT INTO coverage VALUES (?, ?, ?, ?)
+ON CONFLICT (topic, start_date, end_date)
+DO UPDATE SET fetched_at = MAX(coverage.fetched_at, excluded.fetched_at)
+"""
+
+_UPSERT = """
+INSERT INTO articles VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (url) DO UPDATE SET
+    title = excluded.title,
+    snippet = COALESCE(excluded.snippet, articles.snippet),
+    socialimage = COALESCE(excluded.socialimage, articles.socialimage),
+    language = COALESCE(excluded.language, articles.language),
+    sourcecountry = COALESCE(excluded.sourcecountry, articles.sourcecountry),
+    domain = COALESCE(excluded.domain, articles.domain),
+    seendate = COALESCE(excluded.seendate, articles.seendate),
+    seen_ts = COALESCE(excluded.seen_ts, articles.seen_ts),
+    isduplicate = COALESCE(excluded.isduplicate, articles.isduplicate),
+    sourceurl = COALESCE(excluded.sourceurl, articles.sourceurl),
+    ingested_at = excluded.ingested_at
+"""
+
+_INSERT_NEW = """
+INSERT INTO articles VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) ON CONFLICT DO NOTHING
+"""
+
+_FIELDS = (
+    "url",
+    "title",
+    "snippet",
+    "socialimage",
+    "language",
+    "sourcecountry",
+    "domain",
+    "seendate",
+    "isduplicate",
+    "sourceurl",
+)
+logger = logging.getLogger(__name__)
+
+_QUERY_TOKEN_RE = re.compile(r'"[^"]*"|[()]|[^\s()]+')
+_PURGE_INTERVAL_SECONDS = 3600.0
+
+
+def seen_timestamp(seendate: str | None) -> float | None:
+    """Unix timestamp of a GDELT ``seendate`` (``20250101T120000Z`` or ISO form)."""
+
+    digits = re.sub(r"\D", "", seendate or "")[:14]
+    if len(digits) < 8:
+        return None
+    digits = digits.ljust(14, "0")
+    try:
+        # Direct construction; strptime dominates bulk-ingest profiles.
+        seen = datetime(
+            int(digits[:4]),
+            int(digits[4:6]),
+            int(digits[6:8]),
+            int(digits[8:10]),
+            int(digits[10:12]),
+            int(digits[12:14]),
+            tzinfo=UTC,
+        )
+    except ValueError:
+        return None
+    return seen.timestamp()
+
+
+# (topic, start date, end date) of a covered window; "" for a missing date.
+CoverageKey = tuple[str, str, str]
+
+
+def coverage_topic(query: str, languages: Iterable[str] | None) -> str:
+    """Normalized query and languages; coverage is looked up by topic, then window."""
+
+    langs = sorted({lang.strip().lower() for lang in languages}) if languages else []
+    return json.dumps([" ".join(query.lower().split()), langs])
+
+
+def coverage_key(
+    query: str,
+    start_date: str | None,
+    end_date: str | None,
+    languages: Iterable[str] | None,
+) -> CoverageKey:
+    """Normalized filters of a search; record cap and sort order don't change coverage."""
+
+    return coverage_topic(query, languages), start_date or "", end_date or ""
+
+
+def _row(article: Article, now: float) -> tuple[object, ...]:
+    return (
+        article.url,
+        article.title,
+        article.snippet,
+        article.socialimage,
+        article.language,
+        article.sourcecountry,
+        article.domain,
+        article.seendate,
+        seen_timestamp(article.seendate) or now,
+        article.isduplicate,
+        article.sourceurl,
+        now,
+    )
+
+
+def _window_start(start_date: str | None, now: float) -> float:
+    # Without a start date GDELT searches its default window back from ``now``.
+    if not start_date:
+        return now - DEFAULT_SEARCH_WINDOW.total_seconds()
+    return _day_start(start_date)
+
+
+def _window_end(end_date: str | None, now: float) -> float:
+    # Dates are inclusive days; nothing is seen after ``now``.
+    if not end_date:
+        return now
+    return min(now, _day_start(end_date) + timedelta(days=1).total_seconds())
+
+
+def _day_start(value: str) -> float:
+    day = date.fromisoformat(value[:10])
+    return datetime(day.year, day.month, day.day, tzinfo=UTC).timestamp()
+
+
+def fts_query(query: str) -> str | None:
+    """Translate a GDELT keyword query into an FTS5 MATCH expression.
+
+    Supports bare words (ANDed), quoted phrases, ``OR``, parentheses and ``-word``
+    exclusions. Returns None for queries using other operators (``domain:``,
+    ``tone<``, ...), which the local store cannot answer faithfully.
+    """
+
+    positive: list[str] = []
+    negative: list[str] = []
+
+    def operand(value: str) -> None:
+        # FTS5 needs an explicit AND next to parentheses; GDELT ANDs implicitly.
+        if positive and positive[-1] not in ("(", "OR"):
+            positive.append("AND")
+        positive.append(value)
+
+    for token in _QUERY_TOKEN_RE.findall(query):
+        if token == "(":
+            operand(token)
+            continue
+        if token in (")", "OR"):
+            positive.append(token)
+            continue
+        excluded = token.startswith("-")
+        token = token.removeprefix("-")
+        if token.startswith('"'):
+            text = token.strip('"').strip()
+        elif re.fullmatch(r"[^\W_]+(?:['’][^\W_]+)*", token):
+            text = token
+        else:
+            return None
+        if not text:
+            continue
+        term = '"' + text.replace('"', "") + '"'
+        if excluded:
+            negative.append(term)
+        else:
+            operand(term)
+    if not any(t not in ("(", ")", "OR", "AND") for t in positive):
+        return None
+    expression = " ".join(positive)
+    if negative:
+        expression = f"({expression}) NOT ({' OR '.join(negative)})"
+    return expression
+
+
+def _language_values(languages: Iterable[str]) -> set[str]:
+    # Plans carry ISO 639-3 codes; GDELT reports languages by English name.
+    values: set[str] = set()
+    for lang in languages:
+        value = lang.strip().lower()
+        values.add(value)
+        values.update(name for name, code in LANGUAGE_CODES.items() if code == value)
+    return values
+
+
+@dataclass
+class ArticleStoreStats:
+    ingested: int = 0
+    batches: int = 0
+    purged: int = 0
+    searches: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return {
+            "ingested": self.ingested,
+            "batches": self.batches,
+            "purged": self.purged,
+            "searches": self.searches,
+        }
+
+
+class LocalArticleStore:
+    """SQLite store of ingested articles, searchable like `GDELTClient`.
+
+    Args:
+        path: Database file; parent directories are created. ``":memory:"`` is allowed.
+        retention_days: Articles first seen longer ago than this are purged.
+        batch_size: Buffered articles that trigger a write; `flush` writes the rest.
+    """
+
+    def __init__(
+        self, path: str | Path, *, retention_days: float = 7.0, batch_size: int = 200
+    ) -> None:
+        self.path = str(path)
+        if self.path != ":memory:":
+            self.path = str(Path(self.path).expanduser())
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self.retention_seconds = retention_days * 86400.0
+        self.batch_size = max(1, batch_size)
+        self.stats = ArticleStoreStats()
+        self._lock = threading.Lock()
+        self._pending: list[Article] = []
+        # Coverage keys of buffered remote results; recorded once their batch is written.
+        self._pending_coverage: dict[CoverageKey, float] = {}
+        # Single writer thread for batches filled from an event loop (`add_nowait`).
+        self._writer: ThreadPoolExecutor | None = None
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        if self.path != ":memory:":
+            # Readers don't block the batched writer; commits skip the per-batch fsync.
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+        row = self._conn.execute("SELECT MAX(ingested_at) FROM articles").fetchone()
+        self.last_ingested_at: float | None = row[0]
+        self._last_purge = 0.0
+        self.purge()
+
+    def add(self, articles: Iterable[Article], *, request: SearchRequest | None = None) -> None:
+        """Buffer ``articles`` for ingestion, writing once a batch is full.
+
+        Pass the GDELT ``request`` the articles answer to record its coverage.
+        """
+
+        full = self._buffer(articles, request)
+        if full is not None:
+            self._write(*full)
+
+    def add_nowait(
+        self, articles: Iterable[Article], *, request: SearchRequest | None = None
+    ) -> None:
+        """Like `add`, but a full batch is written on the store's writer thread.
+
+        Never blocks on SQLite, so it is safe to call from an event loop.
+        """
+
+        full = self._buffer(articles, request)
+        if full is None:
+            return
+        with self._lock:
+            if self._writer is None:
+                self._writer = ThreadPoolExecutor(1, thread_name_prefix="article-store")
+            future = self._writer.submit(self._write, *full)
+        future.add_done_callback(_log_write_error)
+
+    def _buffer(
+        self, articles: Iterable[Article], request: SearchRequest | None
+    ) -> tuple[list[Article], dict[CoverageKey, float]] | None:
+        # Returns the buffered batch (and its coverage) once it is full.
+        with self._lock:
+            before = len(self._pending)
+            self._pending.extend(a for a in articles if a.url)
+            if request is not None and len(self._pending) > before:
+                key = coverage_key(
+                    request.query, request.start_date, request.end_date, request.languages
+                )
+                self._pending_coverage[key] = time.time()
+            if len(self._pending) < self.batch_size:
+                return None
+            return self._take()
+
+    def flush(self) -> None:
+        """Write all buffered articles."""
+
+        with self._lock:
+            batch, coverage = self._take()
+        if batch:
+            self._write(batch, coverage)
+
+    def insert_new(self, articles: Iterable[Article]) -> int:
+        """Write ``articles`` whose URL is not stored yet, in one transaction.
+
+        For bulk loads, whose records are poorer than Doc API results: existing rows
+        are never overwritten. Returns the number of rows inserted.
+        """
+
+        self.flush()
+        now = time.time()
+        rows = [_row(a, now) for a in articles if a.url]
+        if not rows:
+            return 0
+        with self._lock, self._conn:
+            inserted = self._conn.executemany(_INSERT_NEW, rows).rowcount
+            self.stats.ingested += inserted
+            self.stats.batches += 1
+            self.last_ingested_at = now
+        return inserted
+
+    def _take(self) -> tuple[list[Article], dict[CoverageKey, float]]:
+        # Caller holds the lock.
+        batch, coverage = self._pending, self._pending_coverage
+        self._pending, self._pending_coverage = [], {}
+        return batch, coverage
+
+    def coverage(
+        self, query: str, languages: Iterable[str] | None
+    ) -> list[tuple[str | None, str | None, float]]:
+        """Windows ``(start_date, end_date, fetched_at)`` written for this query and languages."""
+
+        topic = coverage_topic(query, languages)
+        with self._lock:
+            pending = any(key[0] == topic for key in self._pending_coverage)
+        if pending:
+            self.flush()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT start_date, end_date, fetched_at FROM coverage WHERE topic = ?", (topic,)
+            ).fetchall()
+        return [(start or None, end or None, fetched) for start, end, fetched in rows]
+
+    def mark_covered(
+        self,
+        query: str,
+        start_date: str | None,
+        end_date: str | None,
+        languages: Iterable[str] | None,
+        fetched_at: float | None = None,
+    ) -> None:
+        """Record that GDELT results for this window are stored, e.g. across several fetches.
+
+        Buffered articles, and batches queued on the writer thread, are written first.
+        """
+
+        self.flush()
+        with self._lock:
+            writer = self._writer
+        if writer is not None:
+            writer.submit(lambda: None).result()
+        key = coverage_key(query, start_date, end_date, languages)
+        with self._lock, self._conn:
+            self._conn.execute(_COVER, (*key, fetched_at or time.time()))
+
+    def _write(
+        self, batch: list[Article], coverage: dict[CoverageKey, float] | None = None
+    ) -> None:
+        now = time.time()
+        rows = [_row(a, now) for a in batch]
+        with self._lock, self._conn:
+            self._conn.executemany(_UPSERT, rows)
+            if coverage:
+                self._conn.executemany(_COVER, [(*key, at) for key, at in coverage.items()])
+            self.stats.ingested += len(rows)
+            self.stats.batches += 1
+            self.last_ingested_at = now
+        if now - self._last_purge >= _PURGE_INTERVAL_SECONDS:
+            self.purge(now)
+
+    def purge(self, now: float | None = None) -> int:
+        """Delete articles older than the retention window; return how many."""
+
+        now = now if now is not None else time.time()
+        cutoff = now - self.retention_seconds
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM articles WHERE seen_ts < ?", (cutoff,))
+            self._conn.execute("DELETE FROM coverage WHERE fetched_at < ?", (cutoff,))
+            self._last_purge = now
+            self.stats.purged += cursor.rowcount
+        return cursor.rowcount
+
+    def covers(self, start_date: str | None) -> bool:
+        """Whether the retention window reaches back to ``start_date``."""
+
+        if not start_date:
+            return True
+        try:
+            start = _day_start(start_date)
+        except ValueError:
+            return False
+        return start >= time.time() - self.retention_seconds
+
+    def search_articles(
+        self,
+        query: str,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        max_records: int = 20,
+        sort_by: str = "date",
+        languages: Iterable[str] | None = None,
+    ) -> list[Article]:
+        match = fts_query(query)
+        if match is None:
+            return []
+        self.flush()
+        clauses = ["articles_fts MATCH ?"]
+        params: list[object] = [match]
+        try:
+            if start_date:
+                clauses.append("a.seen_ts >= ?")
+                params.append(_day_start(start_date))
+            if end_date:
+                clauses.append("a.seen_ts < ?")
+                params.append(_day_start(end_date) + timedelta(days=1).total_seconds())
+        except ValueError:
+            return []
+        if languages:
+            values = sorted(_language_values(languages))
+            clauses.append(f"LOWER(a.language) IN ({', '.join('?' * len(values))})")
+            params.extend(values)
+        order = {
+            "date": "a.seen_ts DESC",
+            "datedesc": "a.seen_ts DESC",
+            "dateasc": "a.seen_ts ASC",
+        }.get(sort_by.lower(), "bm25(articles_fts)")
+        sql = (
+            f"SELECT {', '.join('a.' + name for name in _FIELDS)} "
+            "FROM articles_fts JOIN articles AS a ON a.rowid = articles_fts.rowid "
+            f"WHERE {' AND '.join(clauses)} ORDER BY {order} LIMIT ?"
+        )
+        params.append(int(max_records))
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+            self.stats.searches += 1
+        return [Article(**dict(zip(_FIELDS, row, strict=True))) for row in rows]
+
+    async def search_articles_async(
+        self,
+        query: str,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        max_records: int = 20,
+        sort_by: str = "date",
+        languages: Iterable[str] | None = None,
+    ) -> list[Article]:
+        return await asyncio.to_thread(
+            self.search_articles, query, start_date, end_date, max_records, sort_by, languages
+        )
+
+    def count(self) -> int:
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0])
+
+    def stats_dict(self) -> dict[str, float]:
+        return {
+            **self.stats.as_dict(),
+            "entries": self.count(),
+            "pending": len(self._pending),
+        }
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.shutdown(wait=True)
+        self.flush()
+        with self._lock:
+            self._conn.close()
+
+
+def _log_write_error(future: Future[None]) -> None:
+    if not future.cancelled() and future.exception() is not None:
+        logger.error("Article store write failed", exc_info=future.exception())
+
+
+@dataclass
+class LocalFirstRetriever:
+    """Serve searches from a `LocalArticleStore` when fresh enough, else from GDELT.
+
+    A search is answered locally when the query is expressible in FTS5 and the
+    window starts inside the store's retention, and GDELT results for the same
+    query and languages were written for a window that reaches the search's end
+    (as of ``max_age_seconds`` ago, or after a past window ended). Then either:
+
+    - that window also contains the search's start (a missing start means GDELT's
+      default three months), and at least ``min(max_records, min_results)``
+      articles match; or
+    - the search is sorted newest first and its ``max_records`` newest local
+      matches all fall inside the covered window, so GDELT would return the same.
+
+    `stats` counts local hits and fallbacks (misses).
+    """
+
+    store: LocalArticleStore
+    remote: ArticleRetriever
+    max_age_seconds: float = 900.0
+    min_results: int = 10
+
+    def __post_init__(self) -> None:
+        self.stats = CacheStats()
+
+    def _covered_since(
+        self,
+        query: str,
+        start_date: str | None,
+        end_date: str | None,
+        languages: list[str] | None,
+    ) -> float | None:
+        """Start of the widest fresh coverage reaching the window's end, or None."""
+
+        if fts_query(query) is None or not self.store.covers(start_date):
+            return None
+        now = time.time()
+        try:
+            want_end = _window_end(end_date, now)
+        except ValueError:
+            return None
+        since: float | None = None
+        for start, end, fetched in self.store.coverage(query, languages):
+            try:
+                # Results written at ``fetched`` cover nothing seen after it.
+                covered_end = _window_end(end, fetched)
+                covered_start = _window_start(start, fetched)
+            except ValueError:
+                continue
+            if covered_end >= want_end - self.max_age_seconds:
+                since = covered_start if since is None else min(since, covered_start)
+        return since
+
+    def _local(
+        self,
+        query: str,
+        start_date: str | None,
+        end_date: str | None,
+        max_records: int,
+        sort_by: str,
+        languages: list[str] | None,
+    ) -> list[Article] | None:
+        # Blocking (SQLite); the async path runs it in a worker thread.
+        since = self._covered_since(query, start_date, end_date, languages)
+        if since is None:
+            return None
+        whole = since <= _window_start(start_date, time.time())
+        if not whole and sort_by.lower() not in ("date", "datedesc"):
+            return None
+        with timed("local_store"):
+            local = self.store.search_articles(
+                query, start_date, end_date, max_records, sort_by, languages
+            )
+        if whole:
+            return local if self._enough(local, max_records) else None
+        # Only the newest part of the window is covered: enough matches inside it are
+        # exactly the newest ``max_records`` GDELT would return.
+        if len(local) < max_records:
+            return None
+        seen = [seen_timestamp(a.seendate) for a in local]
+        return local if all(ts is not None and ts >= since for ts in seen) else None
+
+    def _enough(self, articles: list[Article], max_records: int) -> bool:
+        return len(articles) >= max(1, min(max_records, self.min_results))
+
+    def search_articles(
+        self,
+        query: str,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        max_records: int = 20,
+        sort_by: str = "date",
+        languages: Iterable[str] | None = None,
+    ) -> list[Article]:
+        langs = list(languages) if languages else None
+        local = self._local(query, start_date, end_date, max_records, sort_by, langs)
+        if local is not None:
+            self.stats.hits += 1
+            return local
+        self.stats.misses += 1
+        return self.remote.search_articles(query, start_date, end_date, max_records, sort_by, langs)
+
+    async def search_articles_async(
+        self,
+        query: str,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        max_records: int = 20,
+        sort_by: str = "date",
+        languages: Iterable[str] | None = None,
+    ) -> list[Article]:
+        langs = list(languages) if languages else None
+        local = await asyncio.to_thread(
+            self._local, query, start_date, end_date, max_records, sort_by, langs
+        )
+        if local is not None:
+            self.stats.hits += 1
+            return local
+        self.stats.misses += 1
+        return await self.remote.search_articles_async(
+            query, start_date, end_date, max_records, sort_by, langs
+        )
+
+
+def create_store(config: PipelineConfig) -> LocalArticleStore | None:
+    """Open the article store configured by ``config``, or None if it is disabled."""
+
+    if not config.local_store_enabled:
+        return None
+    return LocalArticleStore(
+        config.local_store_path,
+        retention_days=config.local_store_retention_days,
+        batch_size=config.local_store_batch_size,
+    )
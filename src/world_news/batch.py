@@ -0,0 +1,187 @@
+"""Answer many related questions with shared GDELT retrieval.
+
+Dashboards ask 20-50 related questions at once (e.g. per-country briefings).
+`answer_batch_async` plans them concurrently, merges planned searches that share
+the same terms and languages and whose date windows end on the same day into one
+GDELT fetch (`merge_plans`), then answers each question with bounded concurrency through
+`NewsService.answer_question_async`. Failures are reported per question.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Sequence
+from dataclasses import dataclass, field, replace
+from datetime import UTC, date, datetime
+from typing import TypeVar
+
+from .clients import Article
+from .config import PipelineConfig
+from .pipeline import (
+    DEFAULT_SEARCH_WINDOW,
+    PipelineTrace,
+    PlanResult,
+    fetch_records,
+    plan_question_async,
+    query_terms,
+    refine_articles,
+    seen_within,
+)
+from .service import NewsService
+
+# The Doc API returns at most 250 records per request.
+GDELT_MAX_RECORDS = 250
+
+T = TypeVar("T")
+
+
+@dataclass
+class BatchItem:
+    """Outcome for one question of a batch."""
+
+    question: str
+    answer: str | None = None
+    num_articles: int = 0
+    plan: PlanResult | None = None
+    error: str | None = None
+
+
+@dataclass
+class SharedFetch:
+    """One GDELT search serving the plans of several questions."""
+
+    plan: PlanResult
+    members: list[int] = field(default_factory=list)
+
+
+def _window(plan: PlanResult, today: date) -> tuple[date, date]:
+    try:
+        start = date.fromisoformat(plan.start_date[:10]) if plan.start_date else None
+        end = date.fromisoformat(plan.end_date[:10]) if plan.end_date else None
+    except ValueError:
+        start = end = None
+    end = end or today
+    return start or (end - DEFAULT_SEARCH_WINDOW), end
+
+
+def merge_plans(
+    plans: Sequence[PlanResult | None], *, today: date | None = None
+) -> list[SharedFetch]:
+    """Group plans into shared fetches.
+
+    Plans merge when their queries have the same content terms (or are identical,
+    for queries using operators), their languages match and their date windows end
+    on the same day, so one window contains the other. A merged fetch covers the
+    widest window with the largest record cap. Results come newest first, so each
+    member's share of it, filtered to its own window, is that window's newest
+    articles up to the cap; windows with different ends are fetched separately,
+    since a newer window's articles could crowd out an older one's.
+    """
+
+    today = today or datetime.now(UTC).date()
+    fetches: dict[tuple[object, ...], SharedFetch] = {}
+    for index, plan in enumerate(plans):
+        if plan is None:
+            continue
+        terms = query_terms(plan.query)
+        key = (
+            terms if terms is not None else " ".join(plan.query.split()),
+            tuple(sorted(lang.lower() for lang in plan.languages or ())),
+            _window(plan, today)[1],
+        )
+        current = fetches.get(key)
+        if current is None:
+            fetches[key] = SharedFetch(plan=plan, members=[index])
+            continue
+        merged = current.plan
+        if _window(plan, today)[0] < _window(merged, today)[0]:
+            merged = replace(merged, start_date=plan.start_date, end_date=plan.end_date)
+        current.plan = replace(merged, max_records=max(merged.max_records, plan.max_records))
+        current.members.append(index)
+    return list(fetches.values())
+
+
+async def answer_batch_async(
+    service: NewsService,
+    questions: Sequence[str],
+    *,
+    concurrency: int | None = None,
+    config: PipelineConfig | None = None,
+) -> tuple[list[BatchItem], int]:
+    """Answer ``questions``; returns the per-question items and the number of fetches.
+
+    ``config`` overrides the service's pipeline settings, e.g. `degraded_config`.
+    """
+
+    config = config or service.config.pipeline
+    limit = asyncio.Semaphore(max(1, concurrency or config.batch_concurrency))
+    items = [BatchItem(question=q) for q in questions]
+
+    async def bounded(awaitable: Awaitable[T]) -> T:
+        async with limit:
+            return await awaitable
+
+    plans = await asyncio.gather(
+        *(
+            bounded(
+                plan_question_async(
+                    q, service.planner_llm, config=config, plan_cache=service.plan_cache
+                )
+            )
+            for q in questions
+        ),
+        return_exceptions=True,
+    )
+    for item, plan in zip(items, plans, strict=True):
+        if isinstance(plan, BaseException):
+            item.error = f"planning failed: {plan}"
+        else:
+            item.plan = plan
+
+    fetches = merge_plans([item.plan for item in items])
+    results = await asyncio.gather(
+        *(bounded(_fetch(service, fetch.plan, config)) for fetch in fetches),
+        return_exceptions=True,
+    )
+
+    async def answer(item: BatchItem, articles: list[Article]) -> None:
+        assert item.plan is not None
+        own = [a for a in articles if seen_within(a, item.plan.start_date, item.plan.end_date)]
+        # Articles without a seendate can't be placed in a window; keep them for all members.
+        own += [a for a in articles if not a.seendate]
+        trace = PipelineTrace(plan=item.plan)
+        try:
+            own = refine_articles(own, item.question, item.plan, config, trace)
+        except Exception as exc:
+            # One question's bad data must not fail the whole batch.
+            item.error = f"refine failed: {exc}"
+            return
+        item.num_articles = trace.num_articles
+        if not own:
+            item.answer = "No relevant articles found."
+            return
+        try:
+            async with limit:
+                item.answer = await service.answer_question_async(item.question, articles=own)
+        except Exception as exc:
+            item.error = f"answer failed: {exc}"
+
+    pending = []
+    for fetch, result in zip(fetches, results, strict=True):
+        for index in fetch.members:
+            if isinstance(result, BaseException):
+                items[index].error = f"retrieval failed: {result}"
+            else:
+                pending.append(answer(items[index], result))
+    await asyncio.gather(*pending)
+    return items, len(fetches)
+
+
+async def _fetch(service: NewsService, plan: PlanResult, config: PipelineConfig) -> list[Article]:
+    return await service.retriever.search_articles_async(
+        query=plan.query,
+        start_date=plan.start_date,
+        end_date=plan.end_date,
+        max_records=min(fetch_records(plan.max_records, config), GDELT_MAX_RECORDS),
+        languages=plan.languages,
+    )
@@ -0,0 +1,321 @@
+"""Offline bulk ingestion of GDELT 2.0 15-minute export and GKG files.
+
+GDELT publishes zipped tab-separated files every 15 minutes
+(``YYYYMMDDHHMMSS.export.CSV.zip`` for events, ``YYYYMMDDHHMMSS.gkg.csv.zip`` for
+the Global Knowledge Graph; ``.translation.`` variants cover non-English sources).
+This module stream-parses such files from local disk into compact `BulkRecord`
+tuples: archives are decompressed incrementally line by line and never loaded
+whole. Records are loaded into the `LocalArticleStore`, optionally parsing
+several files in parallel worker processes. Records older than the store's
+retention are skipped (the store would purge them), and URLs already in the store
+are left alone, since Doc API records carry real titles and snippets.
+
+Export rows carry no headline. GKG rows use ``<PAGE_TITLE>`` from the extras XML
+when present. Otherwise the URL slug's words are stored as a marked snippet
+(``URL keywords: ...``) with an empty title, so they stay searchable but are
+never shown as a headline. Usage::
+
+    python -m world_news.bulk_ingest FILE [FILE ...] [--workers 4]
+    python -m world_news.bulk_ingest FILE ... --store bulk.sqlite3 --retention-days 365
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import re
+import time
+import zipfile
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import NamedTuple
+from urllib.parse import urlsplit
+
+from .article_store import LocalArticleStore, create_store, seen_timestamp
+from .clients.gdelt import Article
+from .config import ConfigManager
+from .fast_planner import LANGUAGE_CODES
+
+# Column positions in the GDELT 2.0 event export (61 columns).
+EXPORT_DATEADDED = 59
+EXPORT_SOURCEURL = 60
+# Column positions in GKG 2.1 (27 columns).
+GKG_DATE = 1
+GKG_SOURCE_NAME = 3
+GKG_DOCUMENT_ID = 4
+GKG_TRANSLATION_INFO = 25
+GKG_EXTRAS = 26
+
+_LANGUAGE_NAMES = {code: name.title() for name, code in LANGUAGE_CODES.items()}
+_PAGE_TITLE_RE = re.compile(r"<PAGE_TITLE>(.*?)</PAGE_TITLE>", re.S)
+_SRCLC_RE = re.compile(r"srclc:(\w+)")
+_SLUG_SPLIT_RE = re.compile(r"[-_+.]+")
+# Records per store transaction; larger than the store's default to amortize commits.
+LOAD_BATCH = 5000
+# Marks slug-derived text in the snippet; it is not a headline.
+SLUG_PREFIX = "URL keywords: "
+_ID_LIKE_RE = re.compile(r"^(?:\d+|[0-9a-f]{8,}|index|article|story|news|html?|php|aspx?)$", re.I)
+
+
+class BulkRecord(NamedTuple):
+    """Compact article record parsed from a bulk file."""
+
+    url: str
+    title: str
+    seendate: str
+    domain: str | None
+    language: str | None
+    # ``title`` was derived from the URL slug rather than published with the article.
+    slug_title: bool = False
+
+    def to_article(self) -> Article:
+        if self.slug_title:
+            title, snippet = "", (SLUG_PREFIX + self.title if self.title else None)
+        else:
+            title, snippet = self.title, None
+        return Article(
+            title=title,
+            url=self.url,
+            domain=self.domain,
+            seendate=self.seendate,
+            language=self.language,
+            snippet=snippet,
+        )
+
+
+@dataclass
+class BulkIngestStats:
+    files: int = 0
+    rows: int = 0
+    records: int = 0
+    # Records older than the store's retention, and records whose URL was already stored.
+    skipped_old: int = 0
+    skipped_existing: int = 0
+    seconds: float = 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "files": self.files,
+            "rows": self.rows,
+            "records": self.records,
+            "skipped_old": self.skipped_old,
+            "skipped_existing": self.skipped_existing,
+            "seconds": round(self.seconds, 3),
+            "rows_per_second": round(self.rows / self.seconds, 1) if self.seconds else 0.0,
+        }
+
+
+def file_kind(path: str | Path) -> str:
+    """``"export"`` or ``"gkg"``, from the GDELT file name."""
+
+    name = Path(path).name.lower()
+    if ".gkg." in name:
+        return "gkg"
+    if ".export." in name:
+        return "export"
+    raise ValueError(f"Not a GDELT export or GKG file: {path}")
+
+
+def iter_lines(path: str | Path) -> Iterator[str]:
+    """Yield the text lines of a plain or zipped GDELT file, decompressing as it goes."""
+
+    path = Path(path)
+    if path.suffix.lower() == ".zip":
+        with zipfile.ZipFile(path) as archive:
+            for member in archive.infolist():
+                if member.is_dir():
+                    continue
+                with archive.open(member) as raw:
+                    yield from io.TextIOWrapper(raw, encoding="utf-8", errors="replace")
+        return
+    with path.open(encoding="utf-8", errors="replace") as fp:
+        yield from fp
+
+
+def to_seendate(value: str) -> str | None:
+    """``YYYYMMDDHHMMSS`` to the Doc API ``seendate`` form ``YYYYMMDDTHHMMSSZ``."""
+
+    if len(value) != 14 or not value.isdigit():
+        return None
+    return f"{value[:8]}T{value[8:]}Z"
+
+
+def url_domain(url: str) -> str | None:
+    host = urlsplit(url).hostname
+    return host.removeprefix("www.") if host else None
+
+
+def title_from_url(url: str) -> str:
+    """Best-effort headline from a URL slug (``/2025/01/ukraine-talks-resume.html``)."""
+
+    segments = [s for s in urlsplit(url).path.split("/") if s]
+    for segment in reversed(segments):
+        words = [w for w in _SLUG_SPLIT_RE.split(segment) if w and not _ID_LIKE_RE.match(w)]
+        if len(words) >= 2:
+            return " ".join(words)
+    return ""
+
+
+def parse_export_row(fields: list[str], *, translated: bool = False) -> BulkRecord | None:
+    if len(fields) <= EXPORT_SOURCEURL:
+        return None
+    url = fields[EXPORT_SOURCEURL].strip()
+    seendate = to_seendate(fields[EXPORT_DATEADDED])
+    if not url.startswith("http") or seendate is None:
+        return None
+    # The English stream carries no language column; translated rows don't say which.
+    language = None if translated else "English"
+    return BulkRecord(url, title_from_url(url), seendate, url_domain(url), language, True)
+
+
+def parse_gkg_row(fields: list[str]) -> BulkRecord | None:
+    if len(fields) <= GKG_DOCUMENT_ID:
+        return None
+    url = fields[GKG_DOCUMENT_ID].strip()
+    seendate = to_seendate(fields[GKG_DATE])
+    if not url.startswith("http") or seendate is None:
+        return None
+    title = ""
+    if len(fields) > GKG_EXTRAS and (match := _PAGE_TITLE_RE.search(fields[GKG_EXTRAS])):
+        title = " ".join(match.group(1).split())
+    language = "English"
+    if len(fields) > GKG_TRANSLATION_INFO and (
+        code := _SRCLC_RE.search(fields[GKG_TRANSLATION_INFO])
+    ):
+        language = _LANGUAGE_NAMES.get(code.group(1), code.group(1))
+    domain = fields[GKG_SOURCE_NAME].strip().lower() or url_domain(url)
+    if title:
+        return BulkRecord(url, title, seendate, domain, language)
+    return BulkRecord(url, title_from_url(url), seendate, domain, language, True)
+
+
+def iter_records(path: str | Path, *, stats: BulkIngestStats | None = None) -> Iterator[BulkRecord]:
+    """Stream the records of one file, one per distinct URL."""
+
+    kind = file_kind(path)
+    translated = ".translation." in Path(path).name.lower()
+    seen: set[str] = set()
+    rows = 0
+    try:
+        for line in iter_lines(path):
+            rows += 1
+            fields = line.rstrip("\r\n").split("\t")
+            if kind == "gkg":
+                record = parse_gkg_row(fields)
+            else:
+                record = parse_export_row(fields, translated=translated)
+            # Event exports repeat a URL for every event coded from the article.
+            if record is None or record.url in seen:
+                continue
+            seen.add(record.url)
+            yield record
+    finally:
+        if stats is not None:
+            stats.files += 1
+            stats.rows += rows
+
+
+def parse_file(path: str | Path) -> tuple[int, list[BulkRecord]]:
+    """Parse one file completely; returns (rows read, records). Used by worker processes."""
+
+    stats = BulkIngestStats()
+    records = list(iter_records(path, stats=stats))
+    return stats.rows, records
+
+
+def ingest_files(
+    paths: Iterable[str | Path],
+    store: LocalArticleStore,
+    *,
+    workers: int = 1,
+) -> BulkIngestStats:
+    """Load GDELT bulk files into ``store``.
+
+    With ``workers > 1`` files are parsed in a process pool and loaded as each file
+    completes; with one worker records stream straight from the archive into the
+    store's write batches, keeping memory flat. Records seen before the store's
+    retention window are skipped; URLs already in the store are not overwritten.
+    """
+
+    paths = [Path(p) for p in paths]
+    stats = BulkIngestStats()
+    started = time.perf_counter()
+    cutoff = time.time() - store.retention_seconds
+    if workers > 1 and len(paths) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for rows, records in pool.map(parse_file, paths):
+                stats.files += 1
+                stats.rows += rows
+                _load(store, records, cutoff, stats)
+    else:
+        for path in paths:
+            _load(store, iter_records(path, stats=stats), cutoff, stats)
+    stats.seconds = time.perf_counter() - started
+    return stats
+
+
+def _load(
+    store: LocalArticleStore,
+    records: Iterable[BulkRecord],
+    cutoff: float,
+    stats: BulkIngestStats,
+) -> None:
+    batch: list[Article] = []
+    for record in records:
+        seen = seen_timestamp(record.seendate)
+        if seen is not None and seen < cutoff:
+            stats.skipped_old += 1
+            continue
+        batch.append(record.to_article())
+        if len(batch) >= LOAD_BATCH:
+            _insert(store, batch, stats)
+            batch = []
+    _insert(store, batch, stats)
+
+
+def _insert(store: LocalArticleStore, batch: list[Article], stats: BulkIngestStats) -> None:
+    inserted = store.insert_new(batch)
+    stats.records += inserted
+    stats.skipped_existing += len(batch) - inserted
+
+
+def main() -> None:
+    """Entrypoint to load local GDELT bulk files into the configured article store."""
+
+    parser = argparse.ArgumentParser(description="Load GDELT export/GKG files into the store")
+    parser.add_argument("files", nargs="+", type=Path)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--store", help="Override pipeline.local_store_path")
+    parser.add_argument(
+        "--retention-days",
+        type=float,
+        help="Retention of the --store database (older records are skipped)",
+    )
+    args = parser.parse_args()
+    if args.retention_days is not None and not args.store:
+        # The app reopens the configured store with its own retention and would purge them.
+        parser.error("--retention-days needs a separate --store PATH")
+
+    config = ConfigManager().config.pipeline
+    store = (
+        LocalArticleStore(
+            args.store,
+            retention_days=args.retention_days or config.local_store_retention_days,
+            batch_size=config.local_store_batch_size,
+        )
+        if args.store
+        else create_store(config)
+    )
+    if store is None:
+        parser.error("pipeline.local_store_enabled is false; pass --store PATH")
+    try:
+        stats = ingest_files(args.files, store, workers=args.workers)
+    finally:
+        store.close()
+    print(stats.as_dict())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Bounded in-process TTL + LRU cache.
+
+Used to keep recent results (e.g., GDELT searches) in memory. Entries expire
+after a per-entry TTL and the least recently used entries are evicted once the
+entry or byte budget is exceeded.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import asdict, dataclass
+
+
+@dataclass
+class CacheStats:
+    """Counters describing cache effectiveness."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        return {**asdict(self), "hit_rate": round(self.hit_rate, 4)}
+
+
+class TTLCache[V]:
+    """Thread-safe TTL cache with LRU eviction by entry count and byte size.
+
+    Args:
+        ttl: Default time-to-live in seconds for new entries.
+        max_entries: Maximum number of entries kept.
+        max_bytes: Optional budget for the summed ``sizeof`` of all values.
+        sizeof: Function estimating the size of a value in bytes.
+        clock: Monotonic clock, overridable for tests.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float,
+        max_entries: int,
+        max_bytes: int | None = None,
+        sizeof: Callable[[V], int] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof or (lambda _value: 0)
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, int, V]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.stats = CacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: Hashable) -> V | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            expires_at, _size, value = entry
+            if expires_at <= self._clock():
+                self._remove(key)
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: V, *, ttl: float | None = None) -> None:
+        size = self._sizeof(value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            expires_at = self._clock() + (self.ttl if ttl is None else ttl)
+            self._entries[key] = (expires_at, size, value)
+            self._bytes += size
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _remove(self, key: Hashable) -> None:
+        _expires_at, size, _value = self._entries.pop(key)
+        self._bytes -= size
+
+    def _evict(self) -> None:
+        while self._entries and (
+            len(self._entries) > self.max_entries
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.stats.evictions += 1
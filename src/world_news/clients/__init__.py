@@ -1,4 +1,21 @@
-from .gdelt import Article, GDELTClient
+from .gdelt import (
+    Article,
+    GDELTClient,
+    GdeltDocBackend,
+    GDELTError,
+    GDELTThrottledError,
+    GDELTTransientError,
+    SearchRequest,
+)
 from .gemini import GeminiClient
 
-__all__ = ["GDELTClient", "Article", "GeminiClient"]
+__all__ = [
+    "GDELTClient",
+    "GdeltDocBackend",
+    "SearchRequest",
+    "Article",
+    "GDELTError",
+    "GDELTThrottledError",
+    "GDELTTransientError",
+    "GeminiClient",
+]
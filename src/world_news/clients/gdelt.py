@@ -1,10 +1,45 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
-from dataclasses import asdict, dataclass
-from typing import Any
+import asyncio
+from collections.abc import Hashable, Iterable
+from dataclasses import asdict, dataclass, fields
+from datetime import UTC, date, datetime, timedelta
+from typing import TYPE_CHECKING, Any, Protocol
 
-from gdeltdoc import Filters, GdeltDoc
+from ..cache import TTLCache
+from ..config.schemas import GDELTConfig
+from ..metrics import record_articles, timed
+from ..singleflight import SingleFlight
+
+if TYPE_CHECKING:
+    from gdeltdoc import GdeltDoc
+
+    from ..article_store import LocalArticleStore
+    from .gdelt_limiter import GDELTLimiter
+
+
+class GDELTError(RuntimeError):
+    """The Doc API answered with an error message instead of JSON."""
+
+
+class GDELTThrottledError(GDELTError):
+    """GDELT asked us to slow down (HTTP 429 or its "Please limit requests" notice)."""
+
+
+class GDELTTransientError(GDELTError):
+    """A failure worth retrying: HTTP 5xx, timeout or dropped connection."""
+
+
+# GDELT searches without explicit dates cover roughly the last three months.
+DEFAULT_SEARCH_WINDOW = timedelta(days=90)
+
+# GDELT's throttle notice, sometimes sent with status 200 in place of JSON.
+THROTTLE_MARKERS = ("limit requests", "rate limit", "too many requests")
+
+
+def is_throttle_message(text: str) -> bool:
+    lowered = text.lower()
+    return any(marker in lowered for marker in THROTTLE_MARKERS)
 
 
 @dataclass(frozen=True)
@@ -19,6 +54,8 @@ class Article:
     isduplicate: int | None = None
     sourceurl: str | None = None
     snippet: str | None = None
+    # URLs of near-duplicate articles collapsed into this one (see `world_news.dedup`).
+    alternate_sources: list[str] | None = None
 
 
 def article_to_dict(article: Article) -> dict[str, Any]:
@@ -61,19 +98,203 @@ def articles_from_dicts(items: list[dict[str, Any]]) -> list[Article]:
                 isduplicate=d.get("isduplicate"),
                 sourceurl=d.get("sourceurl"),
                 snippet=d.get("snippet"),
+                alternate_sources=d.get("alternate_sources"),
             )
         )
     return articles
 
 
+def search_key(
+    query: str,
+    start_date: str | None,
+    end_date: str | None,
+    max_records: int,
+    sort_by: str,
+    languages: Iterable[str] | None,
+) -> Hashable:
+    """Return a normalized, hashable key for a set of search filters."""
+
+    return (
+        " ".join(query.split()),
+        start_date or None,
+        end_date or None,
+        int(max_records),
+        sort_by,
+        tuple(sorted({lang.strip().lower() for lang in languages})) if languages else (),
+    )
+
+
+def is_historical_window(end_date: str | None, today: date | None = None) -> bool:
+    """Whether the window ended before today (UTC), so its results no longer change."""
+
+    if not end_date:
+        return False
+    try:
+        end = date.fromisoformat(end_date[:10])
+    except ValueError:
+        return False
+    return end < (today or datetime.now(UTC).date())
+
+
+def estimate_articles_size(articles: list[Article]) -> int:
+    """Rough in-memory footprint of a list of articles, in bytes."""
+
+    size = 0
+    for article in articles:
+        size += 64
+        for f in fields(article):
+            value = getattr(article, f.name)
+            if isinstance(value, str):
+                size += len(value)
+    return size
+
+
+@dataclass(frozen=True)
+class SearchRequest:
+    """Filters of a single GDELT Doc API article search."""
+
+    query: str
+    start_date: str | None = None
+    end_date: str | None = None
+    max_records: int = 20
+    sort_by: str = "date"
+    languages: list[str] | None = None
+
+    def key(self) -> Hashable:
+        return search_key(
+            self.query,
+            self.start_date,
+            self.end_date,
+            self.max_records,
+            self.sort_by,
+            self.languages,
+        )
+
+
+class GDELTBackend(Protocol):
+    """Transport used by `GDELTClient` to execute a search."""
+
+    def fetch(self, request: SearchRequest) -> list[Article]: ...
+
+    async def fetch_async(self, request: SearchRequest) -> list[Article]: ...
+
+
+class ArticleRetriever(Protocol):
+    """Anything searchable like `GDELTClient` (e.g. `LocalFirstRetriever`)."""
+
+    def search_articles(
+        self,
+        query: str,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        max_records: int = 20,
+        sort_by: str = "date",
+        languages: Iterable[str] | None = None,
+    ) -> list[Article]: ...
+
+    async def search_articles_async(
+        self,
+        query: str,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        max_records: int = 20,
+        sort_by: str = "date",
+        languages: Iterable[str] | None = None,
+    ) -> list[Article]: ...
+
+
 @dataclass
-class GDELTClient:
+class GdeltDocBackend:
+    """Backend built on `gdeltdoc`; results go through a pandas DataFrame."""
+
     gdelt: GdeltDoc
 
     @classmethod
-    def create_default(cls) -> GDELTClient:
+    def create(cls) -> GdeltDocBackend:
+        from gdeltdoc import GdeltDoc
+
         return cls(gdelt=GdeltDoc())
 
+    def fetch(self, request: SearchRequest) -> list[Article]:
+        from gdeltdoc import Filters
+
+        filters = Filters(
+            keyword=request.query,
+            **_filter_window(request),
+            num_records=request.max_records,
+            sortby=request.sort_by,
+            language=request.languages,
+        )
+        try:
+            df = self.gdelt.article_search(filters)
+        except OSError as exc:  # requests' connection errors and timeouts
+            raise GDELTTransientError(str(exc) or type(exc).__name__) from exc
+        except Exception as exc:
+            if is_throttle_message(str(exc)):
+                raise GDELTThrottledError(str(exc)) from exc
+            raise
+        with timed("gdelt_decode"):
+            return [article_from_row(row) for _, row in df.iterrows()]
+
+    async def fetch_async(self, request: SearchRequest) -> list[Article]:
+        # gdeltdoc only offers a blocking API; run it off the event loop.
+        return await asyncio.to_thread(self.fetch, request)
+
+
+def _filter_window(request: SearchRequest) -> dict[str, Any]:
+    # gdeltdoc needs both dates or a timespan. Dates are inclusive days, as in
+    # `gdelt_http.build_params`: a one-day window runs to 23:59:59.
+    if not request.start_date and not request.end_date:
+        return {"timespan": "3months"}  # GDELT's own default window
+    if request.end_date:
+        end = date.fromisoformat(request.end_date[:10])
+    else:
+        end = datetime.now(UTC).date()
+    if request.start_date:
+        start = date.fromisoformat(request.start_date[:10])
+    else:
+        start = end - DEFAULT_SEARCH_WINDOW
+    return {
+        "start_date": datetime(start.year, start.month, start.day),
+        "end_date": datetime(end.year, end.month, end.day, 23, 59, 59),
+    }
+
+
+@dataclass
+class GDELTClient:
+    backend: GDELTBackend
+    cache: TTLCache[list[Article]] | None = None
+    historical_ttl: float | None = None
+    singleflight: SingleFlight | None = None
+    # Every fetched article is ingested here (see `world_news.article_store`).
+    store: LocalArticleStore | None = None
+    # Rate limit, adaptive concurrency, retries and hedging of backend fetches.
+    limiter: GDELTLimiter | None = None
+
+    @classmethod
+    def create_default(
+        cls, config: GDELTConfig | None = None, *, store: LocalArticleStore | None = None
+    ) -> GDELTClient:
+        from .gdelt_limiter import GDELTLimiter
+
+        config = config or GDELTConfig()
+        cache: TTLCache[list[Article]] | None = None
+        if config.cache_enabled:
+            cache = TTLCache(
+                ttl=config.cache_ttl_seconds,
+                max_entries=config.cache_max_entries,
+                max_bytes=config.cache_max_bytes,
+                sizeof=estimate_articles_size,
+            )
+        return cls(
+            backend=create_backend(config),
+            cache=cache,
+            historical_ttl=config.cache_historical_ttl_seconds,
+            singleflight=SingleFlight() if config.coalesce_requests else None,
+            store=store,
+            limiter=GDELTLimiter.from_config(config),
+        )
+
     def search_articles(
         self,
         query: str,
@@ -83,13 +304,90 @@ class GDELTClient:
         sort_by: str = "date",
         languages: Iterable[str] | None = None,
     ) -> list[Article]:
-        filters = Filters(
-            keyword=query,
-            start_date=start_date,
-            end_date=end_date,
-            num_records=max_records,
-            sortby=sort_by,
-            language=list(languages) if languages else None,
-        )
-        df = self.gdelt.article_search(filters)
-        return [article_from_row(row) for _, row in df.iterrows()]
+        langs = list(languages) if languages else None
+        request = SearchRequest(query, start_date, end_date, max_records, sort_by, langs)
+        key = request.key()
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+        if self.singleflight is None:
+            return self._fetch(request, key)
+        return list(self.singleflight.do(key, lambda: self._fetch(request, key)))
+
+    async def search_articles_async(
+        self,
+        query: str,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        max_records: int = 20,
+        sort_by: str = "date",
+        languages: Iterable[str] | None = None,
+    ) -> list[Article]:
+        langs = list(languages) if languages else None
+        request = SearchRequest(query, start_date, end_date, max_records, sort_by, langs)
+        key = request.key()
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+        if self.singleflight is None:
+            return await self._fetch_async(request, key)
+        articles = await self.singleflight.do_async(key, lambda: self._fetch_async(request, key))
+        return list(articles)
+
+    def _fetch(self, request: SearchRequest, key: Hashable) -> list[Article]:
+        with timed("gdelt"):
+            if self.limiter is None:
+                articles = self.backend.fetch(request)
+            else:
+                articles = self.limiter.call(lambda: self.backend.fetch(request))
+        record_articles("gdelt", len(articles))
+        self._remember(request, key, articles)
+        return articles
+
+    async def _fetch_async(self, request: SearchRequest, key: Hashable) -> list[Article]:
+        with timed("gdelt"):
+            if self.limiter is None:
+                articles = await self.backend.fetch_async(request)
+            else:
+                articles = await self.limiter.call_async(lambda: self.backend.fetch_async(request))
+        record_articles("gdelt", len(articles))
+        self._remember(request, key, articles, blocking=False)
+        return articles
+
+    def _cached(self, key: Hashable) -> list[Article] | None:
+        if self.cache is None:
+            return None
+        hit = self.cache.get(key)
+        return list(hit) if hit is not None else None
+
+    def _remember(
+        self,
+        request: SearchRequest,
+        key: Hashable,
+        articles: list[Article],
+        *,
+        blocking: bool = True,
+    ) -> None:
+        if self.store is not None and articles:
+            # On the event loop, full batches are written by the store's writer thread.
+            if blocking:
+                self.store.add(articles, request=request)
+            else:
+                self.store.add_nowait(articles, request=request)
+        # Empty results are often throttling artefacts; don't pin them.
+        if self.cache is None or not articles:
+            return
+        ttl = self.historical_ttl if is_historical_window(request.end_date) else None
+        self.cache.set(key, list(articles), ttl=ttl)
+
+
+def create_backend(config: GDELTConfig) -> GDELTBackend:
+    """Instantiate the GDELT backend selected by ``config.backend``."""
+
+    if config.backend == "http":
+        from .gdelt_http import GDELTHttpBackend
+
+        return GDELTHttpBackend.create(config)
+    if config.backend == "gdeltdoc":
+        return GdeltDocBackend.create()
+    raise ValueError(f"Unknown GDELT backend: {config.backend!r} (expected 'gdeltdoc' or 'http')")
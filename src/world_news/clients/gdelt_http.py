@@ -0,0 +1,161 @@
+"""Direct HTTP backend for the GDELT Doc API.
+
+Calls ``mode=artlist&format=json`` over shared keep-alive ``httpx`` clients and
+decodes the JSON payload straight into `Article` records, avoiding the pandas
+DataFrame round trip of `gdeltdoc`.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any
+
+import httpx
+
+from ..config.schemas import GDELTConfig
+from ..metrics import timed
+from .gdelt import (
+    Article,
+    GDELTError,
+    GDELTThrottledError,
+    GDELTTransientError,
+    SearchRequest,
+    article_from_row,
+    is_throttle_message,
+)
+
+DEFAULT_ENDPOINT = "https://api.gdeltproject.org/api/v2/doc/doc"
+
+# Doc API sort modes keyed by the aliases accepted by `GDELTClient.search_articles`.
+SORT_MODES = {
+    "date": "DateDesc",
+    "datedesc": "DateDesc",
+    "dateasc": "DateAsc",
+    "relevance": "HybridRel",
+    "hybridrel": "HybridRel",
+    "tonedesc": "ToneDesc",
+    "toneasc": "ToneAsc",
+}
+
+
+def build_params(request: SearchRequest) -> dict[str, str]:
+    """Translate a `SearchRequest` into Doc API query parameters."""
+
+    query = request.query.strip()
+    if request.languages:
+        langs = [f"sourcelang:{lang}" for lang in request.languages]
+        lang_clause = langs[0] if len(langs) == 1 else "(" + " OR ".join(langs) + ")"
+        query = f"{query} {lang_clause}"
+    params = {
+        "query": query,
+        "mode": "artlist",
+        "format": "json",
+        "maxrecords": str(max(1, min(int(request.max_records), 250))),
+        "sort": SORT_MODES.get(request.sort_by.lower(), request.sort_by),
+    }
+    if request.start_date:
+        params["startdatetime"] = _to_gdelt_datetime(request.start_date, end_of_day=False)
+    if request.end_date:
+        params["enddatetime"] = _to_gdelt_datetime(request.end_date, end_of_day=True)
+    return params
+
+
+def _to_gdelt_datetime(value: str, *, end_of_day: bool) -> str:
+    day = date.fromisoformat(value[:10])
+    return day.strftime("%Y%m%d") + ("235959" if end_of_day else "000000")
+
+
+def parse_response(text: str) -> list[Article]:
+    """Decode a Doc API ``artlist`` JSON body into articles."""
+
+    body = text.strip()
+    if not body:
+        return []
+    try:
+        # GDELT occasionally emits raw control characters inside titles.
+        data: Any = json.loads(body, strict=False)
+    except json.JSONDecodeError as exc:
+        if is_throttle_message(body[:200]):
+            raise GDELTThrottledError(body[:200]) from exc
+        raise GDELTError(body[:200]) from exc
+    items = data.get("articles") if isinstance(data, dict) else None
+    if not isinstance(items, list):
+        return []
+    return [article_from_row(item) for item in items if isinstance(item, dict)]
+
+
+def check_status(response: httpx.Response) -> None:
+    """Raise the `GDELTError` subclass matching an unsuccessful response."""
+
+    if response.status_code == 429:
+        raise GDELTThrottledError(response.text[:200] or "HTTP 429")
+    if response.status_code >= 500:
+        raise GDELTTransientError(f"HTTP {response.status_code}: {response.text[:200]}")
+    response.raise_for_status()
+
+
+@dataclass
+class GDELTHttpBackend:
+    """Pooled HTTP transport honoring `GDELTConfig.endpoint`."""
+
+    endpoint: str = DEFAULT_ENDPOINT
+    timeout: float = 30.0
+    max_connections: int = 20
+    _client: httpx.Client | None = field(default=None, init=False, repr=False)
+    _async_client: httpx.AsyncClient | None = field(default=None, init=False, repr=False)
+
+    @classmethod
+    def create(cls, config: GDELTConfig) -> GDELTHttpBackend:
+        return cls(
+            endpoint=config.endpoint or DEFAULT_ENDPOINT,
+            timeout=config.http_timeout_seconds,
+            max_connections=config.http_max_connections,
+        )
+
+    def _limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_connections,
+        )
+
+    @property
+    def client(self) -> httpx.Client:
+        if self._client is None:
+            self._client = httpx.Client(timeout=self.timeout, limits=self._limits())
+        return self._client
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(timeout=self.timeout, limits=self._limits())
+        return self._async_client
+
+    def fetch(self, request: SearchRequest) -> list[Article]:
+        try:
+            response = self.client.get(self.endpoint, params=build_params(request))
+        except httpx.TransportError as exc:
+            raise GDELTTransientError(str(exc) or type(exc).__name__) from exc
+        check_status(response)
+        with timed("gdelt_decode"):
+            return parse_response(response.text)
+
+    async def fetch_async(self, request: SearchRequest) -> list[Article]:
+        try:
+            response = await self.async_client.get(self.endpoint, params=build_params(request))
+        except httpx.TransportError as exc:
+            raise GDELTTransientError(str(exc) or type(exc).__name__) from exc
+        check_status(response)
+        with timed("gdelt_decode"):
+            return parse_response(response.text)
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    async def aclose(self) -> None:
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
@@ -0,0 +1,373 @@
+"""Client-side rate limiting, retries and hedging for GDELT searches.
+
+GDELT throttles aggressive clients with HTTP 429 or a plain-text "Please limit
+requests" notice. `GDELTLimiter` wraps every backend fetch of a `GDELTClient`:
+
+- a `TokenBucket` shared by all searches caps the request rate;
+- `AdaptiveConcurrency` bounds in-flight requests, growing the limit additively
+  on success and halving it on throttle signals (AIMD);
+- throttled and transient failures (5xx, timeouts, connection errors) are retried
+  with full-jitter exponential backoff;
+- optionally, an attempt still pending after ``hedge_after`` seconds is hedged with
+  a second one when the limits allow it; the first to succeed wins.
+
+Hedging is async-only; the blocking path retries but never hedges.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import random
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from typing import TypeVar
+
+from ..config.schemas import GDELTConfig
+from .gdelt import GDELTThrottledError, GDELTTransientError
+
+T = TypeVar("T")
+
+
+class TokenBucket:
+    """Token bucket refilled at ``rate`` tokens per second up to ``burst``.
+
+    Callers reserve a token and sleep off the deficit, so concurrent callers are
+    spaced ``1 / rate`` apart instead of polling. ``rate <= 0`` disables the bucket.
+    """
+
+    def __init__(
+        self, rate: float, burst: int, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._clock = clock
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(float(self.burst), self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Take a token; return how long to wait before using it."""
+
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            self._refill()
+            self._tokens -= 1.0
+            return max(0.0, -self._tokens / self.rate)
+
+    def try_acquire(self) -> bool:
+        """Take a token only if one is available now."""
+
+        if self.rate <= 0:
+            return True
+        with self._lock:
+            self._refill()
+            if self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+            return True
+
+    def drain(self) -> None:
+        """Drop the saved-up burst, e.g. after GDELT asked us to slow down."""
+
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, 0.0)
+
+    @property
+    def tokens(self) -> float:
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def acquire(self) -> None:
+        wait = self.reserve()
+        if wait:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        wait = self.reserve()
+        if wait:
+            await asyncio.sleep(wait)
+
+
+class AdaptiveConcurrency:
+    """In-flight limit with additive increase and multiplicative decrease.
+
+    Each success raises the limit by ``1 / limit`` (about one per round of
+    requests); a throttle signal multiplies it by ``decrease``, at most once per
+    ``cooldown`` seconds so a burst of 429s from one round counts once. Usable from
+    threads and event loops at the same time.
+    """
+
+    def __init__(
+        self,
+        maximum: int,
+        minimum: int = 1,
+        *,
+        decrease: float = 0.5,
+        cooldown: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.maximum = max(1, maximum)
+        self.minimum = max(1, min(minimum, self.maximum))
+        self.decrease = decrease
+        self.cooldown = cooldown
+        self.limit = float(self.maximum)
+        self.in_flight = 0
+        self._clock = clock
+        self._last_decrease = float("-inf")
+        self._cond = threading.Condition()
+        self._waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]] = []
+
+    def _try_locked(self) -> bool:
+        if self.in_flight < int(self.limit):
+            self.in_flight += 1
+            return True
+        return False
+
+    def try_acquire(self) -> bool:
+        with self._cond:
+            return self._try_locked()
+
+    def acquire(self) -> None:
+        with self._cond:
+            while not self._try_locked():
+                self._cond.wait()
+
+    async def acquire_async(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._cond:
+                if self._try_locked():
+                    return
+                waiter: asyncio.Future[None] = loop.create_future()
+                self._waiters.append((loop, waiter))
+            try:
+                await waiter
+            finally:
+                with self._cond, contextlib.suppress(ValueError):
+                    self._waiters.remove((loop, waiter))
+
+    def release(self, *, success: bool = True, throttled: bool = False) -> None:
+        """Free a slot; grow the limit on ``success``, shrink it when ``throttled``."""
+
+        with self._cond:
+            self.in_flight -= 1
+            if throttled:
+                now = self._clock()
+                if now - self._last_decrease >= self.cooldown:
+                    self._last_decrease = now
+                    self.limit = max(float(self.minimum), self.limit * self.decrease)
+            elif success:
+                self.limit = min(float(self.maximum), self.limit + 1.0 / self.limit)
+            # Wake everyone; each waiter re-checks the limit (cancelled ones just leave).
+            self._cond.notify_all()
+            for loop, waiter in self._waiters:
+                loop.call_soon_threadsafe(_wake, waiter)
+
+
+def _wake(waiter: asyncio.Future[None]) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+def failure_kind(exc: BaseException) -> str | None:
+    """``"throttled"``, ``"transient"`` or None for failures not worth retrying."""
+
+    if isinstance(exc, GDELTThrottledError):
+        return "throttled"
+    if isinstance(exc, GDELTTransientError | TimeoutError | ConnectionError):
+        return "transient"
+    return None
+
+
+@dataclass
+class LimiterStats:
+    """Counters of the GDELT limiter."""
+
+    requests: int = 0
+    attempts: int = 0
+    retries: int = 0
+    throttled: int = 0
+    failures: int = 0
+    hedges: int = 0
+    hedge_wins: int = 0
+
+    def as_dict(self) -> dict[str, float]:
+        return {k: float(v) for k, v in asdict(self).items()}
+
+
+class GDELTLimiter:
+    """Rate limit, bound, retry and optionally hedge calls to a GDELT backend.
+
+    Args:
+        bucket: Shared request-rate limit.
+        concurrency: Adaptive in-flight limit.
+        retries: Extra attempts after a throttled or transient failure.
+        backoff: Base delay of the exponential backoff, in seconds.
+        backoff_max: Cap of a single backoff delay.
+        hedge_after: Seconds before a pending attempt is hedged (None disables).
+        rng: Random source for backoff jitter.
+    """
+
+    def __init__(
+        self,
+        bucket: TokenBucket,
+        concurrency: AdaptiveConcurrency,
+        *,
+        retries: int = 3,
+        backoff: float = 1.0,
+        backoff_max: float = 30.0,
+        hedge_after: float | None = None,
+        rng: random.Random | None = None,
+    ) -> None:
+        self.bucket = bucket
+        self.concurrency = concurrency
+        self.retries = max(0, retries)
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        self.hedge_after = hedge_after
+        self._rng = rng or random.Random()
+        self.stats = LimiterStats()
+
+    @classmethod
+    def from_config(cls, config: GDELTConfig) -> GDELTLimiter | None:
+        if not config.rate_limit_enabled:
+            return None
+        return cls(
+            TokenBucket(config.rate_limit_per_second, config.rate_limit_burst),
+            AdaptiveConcurrency(
+                config.concurrency_max,
+                config.concurrency_min,
+                cooldown=config.retry_backoff_seconds,
+            ),
+            retries=config.retry_attempts,
+            backoff=config.retry_backoff_seconds,
+            backoff_max=config.retry_backoff_max_seconds,
+            hedge_after=config.hedge_after_seconds,
+        )
+
+    def stats_dict(self) -> dict[str, float]:
+        return {
+            **self.stats.as_dict(),
+            "concurrency_limit": round(self.concurrency.limit, 2),
+            "in_flight": float(self.concurrency.in_flight),
+            "tokens": round(self.bucket.tokens, 2),
+        }
+
+    def delay(self, attempt: int) -> float:
+        """Full-jitter backoff before retry number ``attempt`` (0-based)."""
+
+        return self._rng.uniform(0.0, min(self.backoff_max, self.backoff * 2**attempt))
+
+    def _failed(self, exc: BaseException) -> str | None:
+        kind = failure_kind(exc)
+        if kind == "throttled":
+            self.stats.throttled += 1
+            self.bucket.drain()
+        self.concurrency.release(success=False, throttled=kind == "throttled")
+        return kind
+
+    def call(self, fn: Callable[[], T]) -> T:
+        """Run the blocking ``fn`` under the limits, retrying retryable failures."""
+
+        self.stats.requests += 1
+        for attempt in range(self.retries + 1):
+            self.bucket.acquire()
+            self.concurrency.acquire()
+            self.stats.attempts += 1
+            try:
+                result = fn()
+            except Exception as exc:
+                kind = self._failed(exc)
+                if kind is None or attempt == self.retries:
+                    self.stats.failures += 1
+                    raise
+                self.stats.retries += 1
+                time.sleep(self.delay(attempt))
+                continue
+            except BaseException:
+                # KeyboardInterrupt, SystemExit...: give the slot back, as `_run` does.
+                self.concurrency.release(success=False)
+                raise
+            self.concurrency.release()
+            return result
+        raise AssertionError("unreachable")
+
+    async def call_async(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """Async variant of `call`; also hedges slow attempts when configured."""
+
+        self.stats.requests += 1
+        for attempt in range(self.retries + 1):
+            await self.bucket.acquire_async()
+            await self.concurrency.acquire_async()
+            try:
+                return await self._attempt(fn)
+            except Exception as exc:
+                if failure_kind(exc) is None or attempt == self.retries:
+                    self.stats.failures += 1
+                    raise
+                self.stats.retries += 1
+                await asyncio.sleep(self.delay(attempt))
+        raise AssertionError("unreachable")
+
+    async def _run(self, fn: Callable[[], Awaitable[T]]) -> T:
+        # The caller holds a token and a concurrency slot for this attempt.
+        self.stats.attempts += 1
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            self.concurrency.release(success=False)
+            raise
+        except Exception as exc:
+            self._failed(exc)
+            raise
+        self.concurrency.release()
+        return result
+
+    async def _attempt(self, fn: Callable[[], Awaitable[T]]) -> T:
+        if self.hedge_after is None:
+            return await self._run(fn)
+        primary = asyncio.ensure_future(self._run(fn))
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.hedge_after)
+            if done or not self._hedge_allowed():
+                return await primary
+            self.stats.hedges += 1
+            hedge = asyncio.ensure_future(self._run(fn))
+            tasks.add(hedge)
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if not task.cancelled() and task.exception() is None:
+                        if task is hedge:
+                            self.stats.hedge_wins += 1
+                        return task.result()
+            # Both attempts failed; surface the primary's error.
+            return primary.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                    with contextlib.suppress(BaseException):
+                        await task
+
+    def _hedge_allowed(self) -> bool:
+        # Hedges never wait: they only go out if a slot and a token are free right now.
+        if not self.concurrency.try_acquire():
+            return False
+        if not self.bucket.try_acquire():
+            self.concurrency.release(success=False)
+            return False
+        return True
@@ -1,32 +1,248 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
-from dataclasses import dataclass
-
-import google.generativeai as genai
+from collections.abc import AsyncIterator, Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
 
+from ..generation_cache import GenerationCache, generation_key
+from ..metrics import record_generation, timed
 from ..prompt_library import get_prompts
+from ..singleflight import SingleFlight
+
+if TYPE_CHECKING:
+    import google.generativeai as genai
 
 
 @dataclass
 class GeminiClient:
     model: genai.GenerativeModel
+    singleflight: SingleFlight | None = None
+    # Caches summaries and grounded answers; planner calls (`generate`) are not cached.
+    # ``bypass_cache=True`` skips the lookup but still stores the fresh generation.
+    response_cache: GenerationCache | None = None
+    # The model's generation settings; part of cache and coalescing keys.
+    generation_config: dict[str, Any] = field(default_factory=dict)
 
     @classmethod
-    def create(cls, api_key: str, model_name: str) -> GeminiClient:
+    def create(
+        cls,
+        api_key: str,
+        model_name: str,
+        *,
+        coalesce: bool = True,
+        response_cache: GenerationCache | None = None,
+        generation_config: Mapping[str, Any] | None = None,
+    ) -> GeminiClient:
+        import google.generativeai as genai
+
+        settings = dict(generation_config or {})
         genai.configure(api_key=api_key)
-        model = genai.GenerativeModel(model_name)
-        return cls(model=model)
+        model = genai.GenerativeModel(model_name, generation_config=settings)
+        return cls(
+            model=model,
+            singleflight=SingleFlight() if coalesce else None,
+            response_cache=response_cache,
+            generation_config=settings,
+        )
+
+    def generate(self, prompt: str, *, schema: type | None = None) -> str:
+        """Generate text; with ``schema`` (a dataclass), constrain the reply to that JSON shape."""
+
+        if self.singleflight is None:
+            return self._generate(prompt, schema)
+        return self.singleflight.do(
+            self._prompt_key(prompt, schema), lambda: self._generate(prompt, schema)
+        )
 
-    def summarize(self, text: str, max_words: int = 160) -> str:
-        template = get_prompts().summarize
-        prompt = template.replace("{{max_words}}", str(max_words)).replace("{{text}}", text)
-        response = self.model.generate_content(prompt)
+    async def generate_async(self, prompt: str, *, schema: type | None = None) -> str:
+        if self.singleflight is None:
+            return await self._generate_async(prompt, schema)
+        return await self.singleflight.do_async(
+            self._prompt_key(prompt, schema), lambda: self._generate_async(prompt, schema)
+        )
+
+    def _generate(self, prompt: str, schema: type | None = None) -> str:
+        with timed("gemini"):
+            response = self.model.generate_content(prompt, **_schema_config(schema))
+        record_generation(self.model_name, prompt, getattr(response, "usage_metadata", None))
         return getattr(response, "text", "") or ""
 
-    def answer_based_on_context(self, question: str, passages: Iterable[str]) -> str:
-        context_blob = "\n\n".join(passages)
-        template = get_prompts().qa
-        prompt = template.replace("{{context}}", context_blob).replace("{{question}}", question)
-        response = self.model.generate_content(prompt)
+    async def _generate_async(self, prompt: str, schema: type | None = None) -> str:
+        with timed("gemini"):
+            response = await self.model.generate_content_async(prompt, **_schema_config(schema))
+        record_generation(self.model_name, prompt, getattr(response, "usage_metadata", None))
         return getattr(response, "text", "") or ""
+
+    def generate_stream(self, prompt: str) -> Iterator[str]:
+        """Yield the response text chunk by chunk as the model produces it."""
+
+        usage = None
+        with timed("gemini"):
+            for chunk in self.model.generate_content(prompt, stream=True):
+                # Usage metadata is complete on the last chunk.
+                usage = getattr(chunk, "usage_metadata", None) or usage
+                text = _chunk_text(chunk)
+                if text:
+                    yield text
+        record_generation(self.model_name, prompt, usage)
+
+    async def generate_stream_async(self, prompt: str) -> AsyncIterator[str]:
+        """Async variant of `generate_stream`."""
+
+        usage = None
+        with timed("gemini"):
+            response = await self.model.generate_content_async(prompt, stream=True)
+            async for chunk in response:
+                usage = getattr(chunk, "usage_metadata", None) or usage
+                text = _chunk_text(chunk)
+                if text:
+                    yield text
+        record_generation(self.model_name, prompt, usage)
+
+    @property
+    def model_name(self) -> str:
+        return getattr(self.model, "model_name", "")
+
+    def _prompt_key(self, prompt: str, schema: type | None = None) -> str:
+        return generation_key(self.model_name, prompt, self.generation_config, schema)
+
+    def _cached_generate(self, prompt: str, bypass_cache: bool) -> str:
+        if self.response_cache is None:
+            return self.generate(prompt)
+        key = self._prompt_key(prompt)
+        text = None if bypass_cache else self.response_cache.get(key)
+        if text is None:
+            text = self.generate(prompt)
+            self.response_cache.set(key, text)
+        return text
+
+    async def _cached_generate_async(self, prompt: str, bypass_cache: bool) -> str:
+        if self.response_cache is None:
+            return await self.generate_async(prompt)
+        key = self._prompt_key(prompt)
+        text = None if bypass_cache else self.response_cache.get(key)
+        if text is None:
+            text = await self.generate_async(prompt)
+            self.response_cache.set(key, text)
+        return text
+
+    def _cached_stream(self, prompt: str, bypass_cache: bool) -> Iterator[str]:
+        if self.response_cache is None:
+            yield from self.generate_stream(prompt)
+            return
+        key = self._prompt_key(prompt)
+        text = None if bypass_cache else self.response_cache.get(key)
+        if text is not None:
+            yield text
+            return
+        parts: list[str] = []
+        for part in self.generate_stream(prompt):
+            parts.append(part)
+            yield part
+        self.response_cache.set(key, "".join(parts))
+
+    async def _cached_stream_async(self, prompt: str, bypass_cache: bool) -> AsyncIterator[str]:
+        if self.response_cache is None:
+            async for part in self.generate_stream_async(prompt):
+                yield part
+            return
+        key = self._prompt_key(prompt)
+        text = None if bypass_cache else self.response_cache.get(key)
+        if text is not None:
+            yield text
+            return
+        parts: list[str] = []
+        async for part in self.generate_stream_async(prompt):
+            parts.append(part)
+            yield part
+        self.response_cache.set(key, "".join(parts))
+
+    def summarize(self, text: str, max_words: int = 160, *, bypass_cache: bool = False) -> str:
+        return self._cached_generate(render_summarize_prompt(text, max_words), bypass_cache)
+
+    async def summarize_async(
+        self, text: str, max_words: int = 160, *, bypass_cache: bool = False
+    ) -> str:
+        prompt = render_summarize_prompt(text, max_words)
+        return await self._cached_generate_async(prompt, bypass_cache)
+
+    def summarize_stream(
+        self, text: str, max_words: int = 160, *, bypass_cache: bool = False
+    ) -> Iterator[str]:
+        return self._cached_stream(render_summarize_prompt(text, max_words), bypass_cache)
+
+    def summarize_stream_async(
+        self, text: str, max_words: int = 160, *, bypass_cache: bool = False
+    ) -> AsyncIterator[str]:
+        return self._cached_stream_async(render_summarize_prompt(text, max_words), bypass_cache)
+
+    def merge_summaries(
+        self, summaries: Iterable[str], max_words: int = 160, *, bypass_cache: bool = False
+    ) -> str:
+        return self._cached_generate(render_merge_prompt(summaries, max_words), bypass_cache)
+
+    async def merge_summaries_async(
+        self, summaries: Iterable[str], max_words: int = 160, *, bypass_cache: bool = False
+    ) -> str:
+        prompt = render_merge_prompt(summaries, max_words)
+        return await self._cached_generate_async(prompt, bypass_cache)
+
+    def merge_summaries_stream_async(
+        self, summaries: Iterable[str], max_words: int = 160, *, bypass_cache: bool = False
+    ) -> AsyncIterator[str]:
+        return self._cached_stream_async(render_merge_prompt(summaries, max_words), bypass_cache)
+
+    def answer_based_on_context(
+        self, question: str, passages: Iterable[str], *, bypass_cache: bool = False
+    ) -> str:
+        return self._cached_generate(render_qa_prompt(question, passages), bypass_cache)
+
+    async def answer_based_on_context_async(
+        self, question: str, passages: Iterable[str], *, bypass_cache: bool = False
+    ) -> str:
+        prompt = render_qa_prompt(question, passages)
+        return await self._cached_generate_async(prompt, bypass_cache)
+
+    def answer_based_on_context_stream(
+        self, question: str, passages: Iterable[str], *, bypass_cache: bool = False
+    ) -> Iterator[str]:
+        return self._cached_stream(render_qa_prompt(question, passages), bypass_cache)
+
+    def answer_based_on_context_stream_async(
+        self, question: str, passages: Iterable[str], *, bypass_cache: bool = False
+    ) -> AsyncIterator[str]:
+        return self._cached_stream_async(render_qa_prompt(question, passages), bypass_cache)
+
+
+def _chunk_text(chunk: object) -> str:
+    # `.text` raises on chunks without text parts (e.g., a trailing safety chunk).
+    try:
+        return getattr(chunk, "text", "") or ""
+    except ValueError:
+        return ""
+
+
+def render_summarize_prompt(text: str, max_words: int) -> str:
+    template = get_prompts().summarize
+    return template.replace("{{max_words}}", str(max_words)).replace("{{text}}", text)
+
+
+def render_merge_prompt(summaries: Iterable[str], max_words: int) -> str:
+    text = "\n\n".join(f"Digest {i}:\n{s}" for i, s in enumerate(summaries, start=1))
+    template = get_prompts().merge_summaries
+    return template.replace("{{max_words}}", str(max_words)).replace("{{text}}", text)
+
+
+def render_qa_prompt(question: str, passages: Iterable[str]) -> str:
+    context_blob = "\n\n".join(passages)
+    template = get_prompts().qa
+    return template.replace("{{context}}", context_blob).replace("{{question}}", question)
+
+
+def _schema_config(schema: type | None) -> dict[str, Any]:
+    # Per-call settings are merged over the model's own generation config.
+    if schema is None:
+        return {}
+    return {
+        "generation_config": {"response_mime_type": "application/json", "response_schema": schema}
+    }
@@ -4,13 +4,25 @@ Exports common configuration utilities and schemas.
 """
 
 from .manager import ConfigManager
-from .schemas import GDELTConfig, GeminiConfig, ProjectConfig
+from .schemas import (
+    GDELTConfig,
+    GeminiConfig,
+    IngestConfig,
+    ModelConfig,
+    PipelineConfig,
+    ProjectConfig,
+    WatchedTopic,
+)
 from .settings import Settings, get_settings
 
 __all__ = [
     "ProjectConfig",
     "GeminiConfig",
+    "ModelConfig",
     "GDELTConfig",
+    "PipelineConfig",
+    "IngestConfig",
+    "WatchedTopic",
     "ConfigManager",
     "Settings",
     "get_settings",
@@ -1,11 +1,20 @@
 from __future__ import annotations
 
+from dataclasses import fields, replace
 from pathlib import Path
 from typing import Any
 
 import yaml
 
-from .schemas import GDELTConfig, GeminiConfig, ProjectConfig
+from .schemas import (
+    GDELTConfig,
+    GeminiConfig,
+    IngestConfig,
+    ModelConfig,
+    PipelineConfig,
+    ProjectConfig,
+    WatchedTopic,
+)
 
 DEFAULT_CONFIG_FILENAMES = (
     "world_news.yaml",
@@ -13,6 +22,16 @@ DEFAULT_CONFIG_FILENAMES = (
     "config.yaml",
 )
 
+# Gemini roles with their own `ModelConfig`.
+ROLES = ("planner", "summarizer", "qa")
+
+SECTIONS = (
+    ("gemini", GeminiConfig),
+    ("gdelt", GDELTConfig),
+    ("pipeline", PipelineConfig),
+    ("ingest", IngestConfig),
+)
+
 DEFAULT_CONFIG_DIRS = (
     Path.cwd(),
     Path.cwd() / "configs",
@@ -49,15 +68,50 @@ class ConfigManager:
         if not isinstance(raw, dict):
             return {}
         result: dict[str, Any] = {}
-        if "gemini" in raw and isinstance(raw["gemini"], dict):
-            result["gemini"] = {"model": raw["gemini"].get("model")}
-        if "gdelt" in raw and isinstance(raw["gdelt"], dict):
-            result["gdelt"] = {"endpoint": raw["gdelt"].get("endpoint")}
+        for section, schema in SECTIONS:
+            if section in raw and isinstance(raw[section], dict):
+                known = {f.name for f in fields(schema)}
+                result[section] = {k: v for k, v in raw[section].items() if k in known}
         return result
 
     def _from_dict(self, data: dict[str, Any]) -> ProjectConfig:
-        gemini = GeminiConfig(
-            **{k: v for k, v in (data.get("gemini") or {}).items() if v is not None}
-        )
+        gemini_data = {k: v for k, v in (data.get("gemini") or {}).items() if v is not None}
+        for role in ROLES:
+            if role in gemini_data:
+                gemini_data[role] = self._model(gemini_data[role], getattr(GeminiConfig, role))
+        gemini = GeminiConfig(**gemini_data)
         gdelt = GDELTConfig(**{k: v for k, v in (data.get("gdelt") or {}).items() if v is not None})
-        return ProjectConfig(gemini=gemini, gdelt=gdelt)
+        pipeline = PipelineConfig(
+            **{k: v for k, v in (data.get("pipeline") or {}).items() if v is not None}
+        )
+        ingest_data = {k: v for k, v in (data.get("ingest") or {}).items() if v is not None}
+        ingest_data["topics"] = self._topics(ingest_data.get("topics") or [])
+        ingest = IngestConfig(**ingest_data)
+        return ProjectConfig(gemini=gemini, gdelt=gdelt, pipeline=pipeline, ingest=ingest)
+
+    def _model(self, raw: Any, default: ModelConfig) -> ModelConfig:
+        # A role is a model name or a mapping overriding the role's default settings.
+        if isinstance(raw, str):
+            return replace(default, model=raw)
+        if not isinstance(raw, dict):
+            return default
+        known = {f.name for f in fields(ModelConfig)}
+        return replace(default, **{k: v for k, v in raw.items() if k in known})
+
+    def _topics(self, raw: list[Any]) -> tuple[WatchedTopic, ...]:
+        # Topics are either plain query strings or mappings with per-topic overrides.
+        known = {f.name for f in fields(WatchedTopic)}
+        topics: list[WatchedTopic] = []
+        for item in raw:
+            if isinstance(item, str):
+                topics.append(WatchedTopic(query=item))
+            elif isinstance(item, dict) and item.get("query"):
+                values = {k: v for k, v in item.items() if k in known and v is not None}
+                if "languages" in values:
+                    languages = values["languages"]
+                    # A scalar (`languages: english`) is one language, not its characters.
+                    if isinstance(languages, str):
+                        languages = [languages]
+                    values["languages"] = tuple(languages)
+                topics.append(WatchedTopic(**values))
+        return tuple(topics)
@@ -3,17 +3,172 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
+@dataclass(frozen=True)
+class ModelConfig:
+    """Model and generation settings of one Gemini role (planner, summarizer, QA)."""
+
+    # Null falls back to `GeminiConfig.model`.
+    model: str | None = None
+    temperature: float | None = None
+    max_output_tokens: int | None = None
+    # "application/json" makes the model emit bare JSON (no prose or code fences).
+    response_mime_type: str | None = None
+
+    def generation_config(self) -> dict[str, object]:
+        """Settings for ``genai.GenerativeModel(generation_config=...)``; unset ones omitted."""
+
+        settings = {
+            "temperature": self.temperature,
+            "max_output_tokens": self.max_output_tokens,
+            "response_mime_type": self.response_mime_type,
+        }
+        return {k: v for k, v in settings.items() if v is not None}
+
+
 @dataclass(frozen=True)
 class GeminiConfig:
+    # Default model of every role without its own `model`.
     model: str = "gemini-2.5-flash"
+    # The planner only emits a small JSON plan: run it on the fastest, cheapest model.
+    planner: ModelConfig = ModelConfig(
+        model="gemini-2.5-flash-lite",
+        temperature=0.0,
+        max_output_tokens=512,
+        response_mime_type="application/json",
+    )
+    summarizer: ModelConfig = ModelConfig(temperature=0.3)
+    qa: ModelConfig = ModelConfig(temperature=0.2)
+    # Share one in-flight generation between concurrent identical prompts.
+    coalesce_requests: bool = True
+    # Content-addressed cache of summaries/answers (prompt hash + model name).
+    response_cache_enabled: bool = True
+    response_cache_max_entries: int = 1024
+    response_cache_ttl_seconds: float = 86400.0
+    # Optional SQLite file for an on-disk tier that survives restarts.
+    response_cache_path: str | None = None
 
 
 @dataclass(frozen=True)
 class GDELTConfig:
     endpoint: str | None = None
+    # "gdeltdoc" (pandas-based library) or "http" (pooled httpx, JSON decoded directly).
+    backend: str = "gdeltdoc"
+    http_timeout_seconds: float = 30.0
+    http_max_connections: int = 20
+    # Share one in-flight search between concurrent identical requests.
+    coalesce_requests: bool = True
+    cache_enabled: bool = True
+    cache_ttl_seconds: float = 300.0
+    # Windows that ended before today never change; keep them much longer.
+    cache_historical_ttl_seconds: float = 86400.0
+    cache_max_entries: int = 512
+    cache_max_bytes: int = 32 * 1024 * 1024
+    # Client-side limits on backend fetches (see `clients.gdelt_limiter`).
+    rate_limit_enabled: bool = True
+    # Token bucket shared by all searches; 0 disables the rate cap.
+    rate_limit_per_second: float = 2.0
+    rate_limit_burst: int = 5
+    # In-flight fetches: start at the max, halve on throttling, creep back up on success.
+    concurrency_max: int = 8
+    concurrency_min: int = 1
+    # Retries of throttled/transient failures with full-jitter exponential backoff.
+    retry_attempts: int = 3
+    retry_backoff_seconds: float = 1.0
+    retry_backoff_max_seconds: float = 20.0
+    # Send a second request if the first hasn't answered after this long (null: never).
+    hedge_after_seconds: float | None = None
+
+
+@dataclass(frozen=True)
+class PipelineConfig:
+    # Plan simple questions with local rules; use the LLM planner below this confidence.
+    fast_planner: bool = True
+    fast_planner_threshold: float = 0.8
+    # Start a keyword GDELT search while the planner LLM runs; reuse it if the plan matches.
+    speculative_retrieval: bool = False
+    speculative_max_records: int = 50
+    # Collapse syndicated near-duplicates (URL, title, SimHash distance) after retrieval.
+    dedup: bool = True
+    dedup_max_distance: int = 3
+    # Estimated-token cap for article passages sent to the summarizer/QA model.
+    context_token_budget: int = 6000
+    # BM25-rerank retrieved articles against the question: fetch this many, keep the best.
+    rerank: bool = True
+    rerank_fetch_records: int = 100
+    # Upper bound on articles kept (also capped by the plan's max_records).
+    rerank_top_k: int = 25
+    # Above the context budget, summarize token-bounded chunks concurrently and merge them.
+    map_reduce: bool = True
+    map_reduce_chunk_tokens: int = 3000
+    map_reduce_concurrency: int = 4
+    map_reduce_group_by: str = "tokens"  # "tokens", "domain" or "country"
+    map_reduce_max_chunks: int = 8
+    # POST /chat/batch: questions per request and concurrent planner/GDELT/answer calls.
+    batch_max_questions: int = 50
+    batch_concurrency: int = 8
+    # Per-stage timings for GET /metrics and the Server-Timing header of /chat.
+    metrics_enabled: bool = True
+    # Admission control of /chat and /chat/stream: pipeline runs at once, requests
+    # waiting for a slot and their longest wait; more are shed with 503 + Retry-After.
+    admission_max_concurrent: int = 16
+    admission_max_queue: int = 32
+    admission_queue_timeout_seconds: float = 10.0
+    # Degrade (rules planner only, at most `degraded_max_records`) once this many
+    # requests are queued; 0 disables degraded mode.
+    admission_degrade_queue_depth: int = 4
+    degraded_max_records: int = 25
+    # Hard cap on records fetched per search, applied after the rerank widening.
+    max_records_cap: int | None = None
+    # Latency budget of a pipeline run (null: unbounded); /chat callers may override it.
+    default_budget_seconds: float | None = None
+    # Shares of the remaining budget the planner LLM and GDELT retrieval may take.
+    deadline_planner_share: float = 0.25
+    deadline_retrieval_share: float = 0.5
+    # With less time than this left to summarize, shrink the context and word cap.
+    deadline_summary_full_seconds: float = 8.0
+    deadline_min_max_words: int = 60
+    # SQLite cache of LLM plans keyed by normalized question; survives restarts.
+    plan_cache_enabled: bool = True
+    plan_cache_path: str = "~/.cache/world_news/plans.sqlite3"
+    # Ingest fetched articles into a local SQLite FTS5 store and answer from it when fresh.
+    local_store_enabled: bool = True
+    local_store_path: str = "~/.cache/world_news/articles.sqlite3"
+    local_store_retention_days: float = 7.0
+    local_store_batch_size: int = 200
+    # Open-ended windows are served locally only if the store was written this recently.
+    local_store_max_age_seconds: float = 900.0
+    # Fall back to GDELT when fewer than min(max_records, this) articles match locally.
+    local_store_min_results: int = 10
+
+
+@dataclass(frozen=True)
+class WatchedTopic:
+    query: str
+    # Per-topic overrides of the `IngestConfig` defaults.
+    interval_seconds: float | None = None
+    max_records: int | None = None
+    languages: tuple[str, ...] | None = None
+
+
+@dataclass(frozen=True)
+class IngestConfig:
+    # Start the background ingest scheduler with the FastAPI app.
+    enabled: bool = False
+    topics: tuple[WatchedTopic, ...] = ()
+    interval_seconds: float = 900.0
+    # Each run is delayed by a random 0..jitter_seconds to spread GDELT requests.
+    jitter_seconds: float = 60.0
+    max_records: int = 75
+    # First run of a topic looks back this many days; later runs only ask for newer articles.
+    lookback_days: int = 1
+    # Global budget of scheduler GDELT requests per window.
+    budget_requests: int = 60
+    budget_window_seconds: float = 3600.0
 
 
 @dataclass(frozen=True)
 class ProjectConfig:
     gemini: GeminiConfig = GeminiConfig()
     gdelt: GDELTConfig = GDELTConfig()
+    pipeline: PipelineConfig = PipelineConfig()
+    ingest: IngestConfig = IngestConfig()
@@ -2,12 +2,12 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 
 from dotenv import load_dotenv
 
 from .manager import ConfigManager
-
-load_dotenv()
+from .schemas import ProjectConfig
 
 
 @dataclass(frozen=True)
@@ -15,9 +15,17 @@ class Settings:
     gemini_api_key: str
     gdelt_api_key: str | None
     gemini_model: str
+    project: ProjectConfig = ProjectConfig()
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
+    """Load ``.env``, the environment and the YAML config once; later calls reuse them.
+
+    Call ``get_settings.cache_clear()`` to pick up changed files or variables.
+    """
+
+    load_dotenv()
     gemini_api_key = os.getenv("GEMINI_API_KEY")
     if not gemini_api_key:
         raise RuntimeError(
@@ -29,4 +37,5 @@ def get_settings() -> Settings:
         gemini_api_key=gemini_api_key,
         gdelt_api_key=gdelt_api_key,
         gemini_model=cfg.gemini.model,
+        project=cfg,
     )
@@ -0,0 +1,130 @@
+"""Token-budget-aware context building for the summarizer and QA prompts.
+
+Turns articles into "Title/URL/Snippet" passages, drops empty and duplicate
+ones, ranks the rest by relevance to the question and packs as many as fit the
+token budget.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from .clients import Article
+from .text import content_terms
+
+# Average characters per token for English-like text; good enough for budgeting.
+CHARS_PER_TOKEN = 4
+PASSAGE_SEPARATOR = "\n\n"
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate for ``text``."""
+
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def format_passage(article: Article) -> str:
+    """Render one article as a prompt passage."""
+
+    title = article.title or ""
+    url = article.url or ""
+    snippet = article.snippet or ""
+    return f"Title: {title}\nURL: {url}\nSnippet: {snippet}"
+
+
+@dataclass
+class ContextPack:
+    """Passages selected for a prompt plus bookkeeping of what was dropped.
+
+    Attributes:
+        articles: Articles whose passages were kept, in prompt order.
+        passages: Rendered passages, aligned with ``articles``.
+        kept_tokens: Estimated tokens of the kept passages.
+        dropped_articles: Number of input articles not included.
+        dropped_tokens: Estimated tokens of the non-empty passages that were dropped.
+    """
+
+    articles: list[Article] = field(default_factory=list)
+    passages: list[str] = field(default_factory=list)
+    kept_tokens: int = 0
+    dropped_articles: int = 0
+    dropped_tokens: int = 0
+
+    @property
+    def kept_articles(self) -> int:
+        return len(self.articles)
+
+    @property
+    def text(self) -> str:
+        return PASSAGE_SEPARATOR.join(self.passages)
+
+    def report(self) -> dict[str, int]:
+        return {
+            "kept_articles": self.kept_articles,
+            "dropped_articles": self.dropped_articles,
+            "kept_tokens": self.kept_tokens,
+            "dropped_tokens": self.dropped_tokens,
+        }
+
+
+def relevance(article: Article, terms: set[str]) -> float:
+    """Share of question terms found in the article, weighting title matches double."""
+
+    if not terms:
+        return 0.0
+    title = set(content_terms(article.title or ""))
+    snippet = set(content_terms(article.snippet or ""))
+    score = sum(2.0 if t in title else 1.0 if t in snippet else 0.0 for t in terms)
+    return score / (2.0 * len(terms))
+
+
+def pack_context(
+    articles: Iterable[Article],
+    *,
+    question: str | None = None,
+    token_budget: int | None = None,
+) -> ContextPack:
+    """Select and order passages for a prompt.
+
+    Args:
+        articles: Candidate articles, in retrieval order.
+        question: Optional question used to rank passages; retrieval order otherwise.
+        token_budget: Maximum estimated tokens of the joined passages; unlimited if None.
+
+    Returns:
+        ContextPack: Kept passages and kept/dropped counts.
+    """
+
+    pack = ContextPack()
+    candidates: list[tuple[Article, str]] = []
+    seen: set[str] = set()
+    for article in articles:
+        if not (article.title or "").strip() and not (article.snippet or "").strip():
+            pack.dropped_articles += 1
+            continue
+        keys = {k for k in (article.url.strip(), " ".join(content_terms(article.title))) if k}
+        if keys & seen:
+            pack.dropped_articles += 1
+            pack.dropped_tokens += estimate_tokens(format_passage(article))
+            continue
+        seen |= keys
+        candidates.append((article, format_passage(article)))
+
+    if question:
+        terms = set(content_terms(question))
+        # Stable sort keeps retrieval (recency) order among equally relevant passages.
+        candidates.sort(key=lambda item: relevance(item[0], terms), reverse=True)
+
+    separator_tokens = estimate_tokens(PASSAGE_SEPARATOR)
+    for article, passage in candidates:
+        cost = estimate_tokens(passage) + (separator_tokens if pack.passages else 0)
+        if token_budget is not None and pack.kept_tokens + cost > token_budget:
+            pack.dropped_articles += 1
+            pack.dropped_tokens += estimate_tokens(passage)
+            continue
+        pack.articles.append(article)
+        pack.passages.append(passage)
+        pack.kept_tokens += cost
+    return pack
@@ -0,0 +1,97 @@
+"""Per-request latency budgets for the pipeline.
+
+Callers pass ``budget_seconds`` to `run_pipeline_async` (or ``/chat``). The
+pipeline turns it into a `Deadline` and bounds each stage by a share of the time
+left. A stage that would overrun degrades instead, so the caller gets a
+best-effort answer rather than a timeout:
+
+- planner LLM: after ``deadline_planner_share`` of the remaining time, the
+  rule-based plan is used (``planner_timeout``);
+- retrieval: after ``deadline_retrieval_share``, the request gives up on GDELT
+  (``retrieval_timeout``);
+- summarizer: with less than ``deadline_summary_full_seconds`` left, the context
+  budget and word cap shrink in proportion and map-reduce is skipped
+  (``context_shrunk``); if it still runs out of time, the top headlines are
+  returned instead (``summary_timeout``).
+
+Applied degradations are listed in `PipelineTrace.degradations`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field, replace
+
+from .clients import Article
+from .config import PipelineConfig
+
+# Word cap of the summary when there is no time pressure.
+SUMMARY_MAX_WORDS = 200
+# Smallest context the summarizer is given under pressure, in estimated tokens.
+MIN_CONTEXT_TOKENS = 500
+
+
+@dataclass(frozen=True)
+class Deadline:
+    """Point in (monotonic) time by which the answer is due."""
+
+    expires_at: float
+    clock: Callable[[], float] = field(default=time.monotonic, compare=False)
+
+    @classmethod
+    def after(cls, seconds: float, clock: Callable[[], float] = time.monotonic) -> Deadline:
+        return cls(clock() + seconds, clock)
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - self.clock())
+
+    def share(self, fraction: float) -> float:
+        """Seconds a stage may take: ``fraction`` of the time left."""
+
+        return self.remaining() * fraction
+
+
+async def bounded[T](awaitable: Awaitable[T], deadline: Deadline | None, share: float = 1.0) -> T:
+    """Await ``awaitable`` for at most ``share`` of the remaining time.
+
+    Raises:
+        TimeoutError: The stage ran out of its share; the awaitable is cancelled.
+    """
+
+    if deadline is None:
+        return await awaitable
+    return await asyncio.wait_for(awaitable, deadline.share(share))
+
+
+def fit_summary(
+    config: PipelineConfig, deadline: Deadline | None, degradations: list[str]
+) -> tuple[PipelineConfig, int]:
+    """Summarizer settings and word cap that fit the time left."""
+
+    if deadline is None:
+        return config, SUMMARY_MAX_WORDS
+    remaining = deadline.remaining()
+    if remaining >= config.deadline_summary_full_seconds:
+        return config, SUMMARY_MAX_WORDS
+    # Output tokens dominate generation time, input tokens time to first token.
+    scale = max(0.1, remaining / config.deadline_summary_full_seconds)
+    degradations.append("context_shrunk")
+    config = replace(
+        config,
+        map_reduce=False,
+        context_token_budget=max(MIN_CONTEXT_TOKENS, int(config.context_token_budget * scale)),
+    )
+    return config, max(config.deadline_min_max_words, int(SUMMARY_MAX_WORDS * scale))
+
+
+def headline_digest(articles: Sequence[Article], limit: int = 5) -> str:
+    """Extractive fallback when the summarizer cannot finish in time."""
+
+    lines = [
+        f"- {a.title}" + (f" ({a.domain})" if a.domain else "") for a in articles[:limit] if a.title
+    ]
+    if not lines:
+        return "No summary could be produced within the time budget."
+    return "A summary could not be produced in time. Top headlines:\n" + "\n".join(lines)
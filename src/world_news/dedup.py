@@ -0,0 +1,184 @@
+"""Near-duplicate collapsing for syndicated articles.
+
+GDELT returns the same wire story under many domains. Articles are grouped when
+they share a canonical URL, the same normalized title, or a 64-bit SimHash of
+title + snippet within a small Hamming distance. Each group is collapsed into a
+single representative that lists the other URLs in ``alternate_sources``.
+
+SimHash candidates are found with band indexes (``max_distance + 1`` bands), so
+the cost stays roughly linear in the number of articles.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from collections.abc import Iterable
+from dataclasses import replace
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from .clients import Article
+from .text import content_terms, tokenize
+
+SIMHASH_BITS = 64
+_TRACKING_PARAMS = re.compile(r"^(?:utm_\w+|fbclid|gclid|mc_cid|mc_eid|ref|cmpid|ocid|spm)$", re.I)
+# "Headline - Example News" / "Headline | Example" -> "Headline"
+_TITLE_SUFFIX = re.compile(r"\s+[-|–—:]\s+[^-|–—:]{2,40}$")
+
+
+def canonical_url(url: str) -> str:
+    """Normalize a URL so trivially different links to the same page compare equal."""
+
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or "").lower()
+    for prefix in ("www.", "m.", "amp."):
+        host = host.removeprefix(prefix)
+    path = re.sub(r"/(?:amp|index\.html?)/?$", "/", parts.path).rstrip("/") or "/"
+    query = urlencode(
+        sorted((k, v) for k, v in parse_qsl(parts.query) if not _TRACKING_PARAMS.match(k))
+    )
+    return urlunsplit(("", host, path, query, ""))
+
+
+def normalized_title(title: str) -> str:
+    """Title with a trailing source-name suffix removed, reduced to content terms."""
+
+    return " ".join(content_terms(_TITLE_SUFFIX.sub("", title)))
+
+
+# Per-bit counters are summed in parallel: each hash bit is spread into its own
+# 16-bit lane of a big integer, so adding features costs one integer addition.
+_LANE_BITS = 16
+_LANE_MASK = (1 << _LANE_BITS) - 1
+_SPREAD_BYTE = [sum(((byte >> i) & 1) << (i * _LANE_BITS) for i in range(8)) for byte in range(256)]
+
+
+def _spread_hash(feature: str, cache: dict[str, int]) -> int:
+    value = cache.get(feature)
+    if value is None:
+        digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+        value = 0
+        for index, byte in enumerate(digest):
+            value |= _SPREAD_BYTE[byte] << (index * 8 * _LANE_BITS)
+        cache[feature] = value
+    return value
+
+
+def simhash(text: str, cache: dict[str, int] | None = None) -> int:
+    """64-bit SimHash over word unigrams and bigrams of ``text``.
+
+    Args:
+        text: Text to fingerprint.
+        cache: Optional feature cache shared across calls within one batch.
+    """
+
+    cache = {} if cache is None else cache
+    tokens = tokenize(text)
+    features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:], strict=False)]
+    if not features:
+        return 0
+    counts = 0
+    get = cache.get
+    for feature in features[:_LANE_MASK]:
+        spread = get(feature)
+        counts += spread if spread is not None else _spread_hash(feature, cache)
+    half = min(len(features), _LANE_MASK) / 2
+    fingerprint = 0
+    for bit in range(SIMHASH_BITS):
+        if ((counts >> (bit * _LANE_BITS)) & _LANE_MASK) > half:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def _bands(fingerprint: int, num_bands: int) -> list[tuple[int, int]]:
+    width = SIMHASH_BITS // num_bands
+    mask = (1 << width) - 1
+    return [(i, (fingerprint >> (i * width)) & mask) for i in range(num_bands)]
+
+
+class _UnionFind:
+    def __init__(self, size: int) -> None:
+        self.parent = list(range(size))
+
+    def find(self, i: int) -> int:
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, a: int, b: int) -> None:
+        ra, rb = self.find(a), self.find(b)
+        if ra != rb:
+            # Keep the earliest (highest-ranked) article as the root.
+            self.parent[max(ra, rb)] = min(ra, rb)
+
+
+def collapse_duplicates(articles: Iterable[Article], *, max_distance: int = 3) -> list[Article]:
+    """Collapse near-duplicate articles, preserving the order of representatives.
+
+    Args:
+        articles: Articles in retrieval order.
+        max_distance: Maximum SimHash Hamming distance treated as a duplicate;
+            a negative value disables SimHash matching.
+
+    Returns:
+        list[Article]: One representative per group, with ``alternate_sources``
+        listing the URLs of the collapsed articles.
+    """
+
+    items = list(articles)
+    groups = _UnionFind(len(items))
+    by_key: dict[tuple[str, str], int] = {}
+    num_bands = max_distance + 1 if 0 <= max_distance < SIMHASH_BITS else 0
+    band_index: dict[tuple[int, int], list[int]] = {}
+    fingerprints: list[int] = []
+    hash_cache: dict[str, int] = {}
+    # Syndicated copies often carry identical text; fingerprint each text once.
+    text_cache: dict[str, int] = {}
+
+    for i, article in enumerate(items):
+        keys = [("url", canonical_url(article.url))] if article.url else []
+        title = normalized_title(article.title or "")
+        if title:
+            keys.append(("title", title))
+        for key in keys:
+            if key in by_key:
+                groups.union(by_key[key], i)
+            else:
+                by_key[key] = i
+
+        if not num_bands:
+            continue
+        text = f"{article.title or ''} {article.snippet or ''}"
+        fingerprint = text_cache.get(text)
+        if fingerprint is None:
+            fingerprint = text_cache[text] = simhash(text, hash_cache)
+        fingerprints.append(fingerprint)
+        if not fingerprint:
+            continue
+        candidates: set[int] = set()
+        for band in _bands(fingerprint, num_bands):
+            bucket = band_index.setdefault(band, [])
+            candidates.update(bucket)
+            bucket.append(i)
+        for j in candidates:
+            if (fingerprint ^ fingerprints[j]).bit_count() <= max_distance:
+                groups.union(j, i)
+
+    members: dict[int, list[int]] = {}
+    for i in range(len(items)):
+        members.setdefault(groups.find(i), []).append(i)
+
+    collapsed: list[Article] = []
+    for root in sorted(members):
+        group = members[root]
+        if len(group) == 1:
+            collapsed.append(items[group[0]])
+            continue
+        # Prefer an article GDELT did not flag as a duplicate and that has a snippet.
+        best = min(group, key=lambda i: (bool(items[i].isduplicate), not items[i].snippet, i))
+        others = [items[i].url for i in group if i != best and items[i].url]
+        existing = list(items[best].alternate_sources or [])
+        alternates = existing + [u for u in others if u not in existing]
+        collapsed.append(replace(items[best], alternate_sources=alternates or None))
+    return collapsed
@@ -0,0 +1,220 @@
+"""Deterministic rule-based planner for simple news questions.
+
+Handles questions such as "latest news on X", "X in German last week" or
+"\"Acme Corp\" since 2025-01-01" without an LLM round trip. Relative dates,
+language names, record counts and quoted entities are parsed into a
+`PlanResult` together with a confidence score; callers fall back to the LLM
+planner when the confidence is below their threshold.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+
+from .planner import PlanResult
+from .text import STOPWORDS, extract_keywords, quoted_phrases, tokenize
+
+# ISO 639 codes as accepted by the GDELT ``sourcelang`` filter.
+LANGUAGE_CODES = {
+    "arabic": "ara",
+    "chinese": "zho",
+    "dutch": "nld",
+    "english": "eng",
+    "french": "fra",
+    "german": "deu",
+    "hebrew": "heb",
+    "hindi": "hin",
+    "italian": "ita",
+    "japanese": "jpn",
+    "korean": "kor",
+    "persian": "fas",
+    "farsi": "fas",
+    "polish": "pol",
+    "portuguese": "por",
+    "russian": "rus",
+    "spanish": "spa",
+    "swedish": "swe",
+    "turkish": "tur",
+    "ukrainian": "ukr",
+}
+
+_LANG_NAMES = "|".join(sorted(LANGUAGE_CODES, key=len, reverse=True))
+_LANG_LIST = rf"(?:{_LANG_NAMES})(?:\s*(?:,|and|or)\s*(?:{_LANG_NAMES}))*"
+_LANGUAGE_RES = (
+    re.compile(
+        rf"\b(?:in\s+)?({_LANG_LIST})[- ]language\b(?:\s+(?:media|press|sources|outlets))?",
+        re.I,
+    ),
+    re.compile(rf"\bin\s+({_LANG_LIST})\b", re.I),
+)
+_LANGUAGE_NAME_RE = re.compile(rf"\b({_LANG_NAMES})\b", re.I)
+
+_ISO_DATE = r"(\d{4}-\d{2}-\d{2})"
+_UNITS = {"hour": 1 / 24, "day": 1, "week": 7, "month": 30, "year": 365}
+_NUMBER_WORDS = {"one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "seven": 7, "ten": 10}
+
+_TEMPLATE_RE = re.compile(
+    r"^\s*(?:(?:what(?:'s| is| are)|any|give me|show me|tell me about|get)\s+)?"
+    r"(?:the\s+)?(?:latest|recent|breaking|top|current|today's)?\s*"
+    r"(?:news|headlines|updates?|developments?|stories|coverage)\b"
+    r"|^\s*what(?:'s| is)\s+happening\b"
+    r"|\b(?:news|headlines|updates?|coverage)\s*\??\s*$",
+    re.I,
+)
+_COMPLEX_RE = re.compile(
+    r"\b(?:why|how|compare|comparison|versus|vs\.?|impact|analy[sz]e|analysis|explain|"
+    r"relationship|difference|differences|should|predict|opinion|cause[sd]?|effects?)\b",
+    re.I,
+)
+_UNPARSED_TIME_RE = re.compile(
+    r"\b(?:since|during|before|after|ago|until|between|january|february|march|april|may|"
+    r"june|july|august|september|october|november|december|(?:19|20)\d{2}|quarter|"
+    r"weekend|fortnight|decade|season|recently|q[1-4]|h[12])\b"
+    # Relative expressions the date rules did not consume ("last quarter", "next week").
+    r"|\b(?:last|past|previous|next|coming|this)\s+\w+",
+    re.I,
+)
+# Questions without a time expression ask for recent news.
+RECENT_WINDOW_DAYS = 7
+_RECORDS_RE = re.compile(
+    r"\b(?:top|first|last)?\s*(\d{1,3})\s+(?:articles|stories|results|headlines|records)\b",
+    re.I,
+)
+
+
+@dataclass(frozen=True)
+class LocalPlan:
+    """A locally produced plan and how confident the rules are in it."""
+
+    plan: PlanResult
+    confidence: float
+
+
+def plan_locally(question: str, *, today: date | None = None) -> LocalPlan:
+    """Parse ``question`` into a `PlanResult` without calling an LLM.
+
+    Args:
+        question: The user's natural-language question.
+        today: Reference date for relative expressions; defaults to today (UTC).
+
+    Returns:
+        LocalPlan: Plan plus a confidence score in ``[0, 1]``.
+    """
+
+    today = today or datetime.now(UTC).date()
+    text = " ".join(question.split())
+    confidence = 0.6
+
+    start_date, end_date, text = _parse_dates(text, today)
+    dated = start_date is not None
+    if not dated:
+        start_date = (today - timedelta(days=RECENT_WINDOW_DAYS)).isoformat()
+        end_date = today.isoformat()
+    languages, text = _parse_languages(text)
+    max_records, records_found, text = _parse_max_records(text)
+
+    # Each cleanly parsed element makes the question look more like a simple lookup.
+    if _TEMPLATE_RE.search(text):
+        confidence += 0.2
+    confidence += 0.1 * sum((dated, languages is not None, records_found))
+    if '"' in text:
+        confidence += 0.1
+    if _COMPLEX_RE.search(text):
+        confidence -= 0.4
+    if _UNPARSED_TIME_RE.search(text.replace('"', " ")):
+        confidence -= 0.4
+    if text.count("?") > 1 or re.search(r"\b(?:and then|also|as well as)\b", text, re.I):
+        confidence -= 0.3
+
+    query = extract_keywords(text, max_terms=6)
+    terms = [t for t in tokenize(re.sub(r'"[^"]*"', " ", text)) if t not in STOPWORDS]
+    num_terms = len(terms) + len(quoted_phrases(text))
+    if 1 <= num_terms <= 4:
+        confidence += 0.2
+    elif num_terms > 6:
+        confidence -= 0.3
+    # Entities such as "EU" or "UK" are too short for a plain GDELT keyword.
+    if any(len(t) < 3 and t.isalpha() for t in terms):
+        confidence -= 0.3
+    if not query:
+        confidence = 0.0
+
+    plan = PlanResult(
+        query=query or question.strip(),
+        start_date=start_date,
+        end_date=end_date,
+        languages=languages,
+        max_records=max_records,
+    )
+    return LocalPlan(plan=plan, confidence=round(max(0.0, min(1.0, confidence)), 2))
+
+
+def _parse_dates(text: str, today: date) -> tuple[str | None, str | None, str]:
+    # Dates are inclusive days: ("2026-10-17", "2026-10-17") is that whole day.
+    iso = today.isoformat()
+
+    def window(days: float) -> tuple[str, str]:
+        return (today - timedelta(days=max(1, round(days)))).isoformat(), iso
+
+    def relative(m: re.Match[str]) -> tuple[str, str]:
+        count = m.group(1).lower()
+        n = int(count) if count.isdigit() else _NUMBER_WORDS[count]
+        return window(n * _UNITS[m.group(2).lower()])
+
+    yesterday = (today - timedelta(days=1)).isoformat()
+    monday = (today - timedelta(days=today.weekday())).isoformat()
+    numbers = "|".join(["\\d+", *_NUMBER_WORDS])
+    rules: list[tuple[str, Callable[[re.Match[str]], tuple[str, str]]]] = [
+        (
+            rf"\bfrom\s+{_ISO_DATE}\s+(?:to|until|through)\s+{_ISO_DATE}\b",
+            lambda m: (m.group(1), m.group(2)),
+        ),
+        (rf"\bbetween\s+{_ISO_DATE}\s+and\s+{_ISO_DATE}\b", lambda m: (m.group(1), m.group(2))),
+        (rf"\bsince\s+{_ISO_DATE}\b", lambda m: (m.group(1), iso)),
+        (rf"\bon\s+{_ISO_DATE}\b", lambda m: (m.group(1), m.group(1))),
+        (
+            rf"\b(?:in\s+the\s+)?(?:last|past)\s+({numbers})\s+(hour|day|week|month|year)s?\b",
+            relative,
+        ),
+        (r"\b(?:in\s+the\s+)?(?:last|past)\s+(\d+)h\b", lambda m: window(int(m.group(1)) / 24)),
+        (r"\btoday\b|\bthis\s+morning\b|\btonight\b", lambda m: (iso, iso)),
+        (r"\byesterday\b", lambda m: (yesterday, yesterday)),
+        (r"\bthis\s+week\b", lambda m: (monday, iso)),
+        (r"\b(?:last|past)\s+week\b", lambda m: window(7)),
+        (r"\bthis\s+month\b", lambda m: (today.replace(day=1).isoformat(), iso)),
+        (r"\b(?:last|past)\s+month\b", lambda m: window(30)),
+        (r"\bthis\s+year\b", lambda m: (today.replace(month=1, day=1).isoformat(), iso)),
+        (r"\b(?:last|past)\s+year\b", lambda m: window(365)),
+    ]
+    for pattern, build in rules:
+        match = re.search(pattern, text, re.I)
+        if match:
+            start, end = build(match)
+            return start, end, _cut(text, match)
+    return None, None, text
+
+
+def _parse_languages(text: str) -> tuple[list[str] | None, str]:
+    codes: list[str] = []
+    for pattern in _LANGUAGE_RES:
+        for match in pattern.finditer(text):
+            for name in _LANGUAGE_NAME_RE.findall(match.group(1)):
+                code = LANGUAGE_CODES[name.lower()]
+                if code not in codes:
+                    codes.append(code)
+        text = pattern.sub(" ", text)
+    return (codes or None), " ".join(text.split())
+
+
+def _parse_max_records(text: str) -> tuple[int, bool, str]:
+    match = _RECORDS_RE.search(text)
+    if not match:
+        return 20, False, text
+    return max(1, min(int(match.group(1)), 250)), True, _cut(text, match)
+
+
+def _cut(text: str, match: re.Match[str]) -> str:
+    return " ".join((text[: match.start()] + " " + text[match.end() :]).split())
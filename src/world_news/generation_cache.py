@@ -0,0 +1,135 @@
+"""Content-addressed cache for Gemini generations (summaries and grounded answers).
+
+Keys are a hash of the exact rendered prompt, the model name and the generation
+settings (temperature, response schema, ...), so identical
+requests (e.g., an MCP client retrying ``summarize_articles`` with the same
+articles) are served without a new generation. A bounded in-memory LRU sits in
+front of an optional SQLite tier that survives restarts.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+from .cache import CacheStats, TTLCache
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS generations (
+    key TEXT PRIMARY KEY,
+    text TEXT NOT NULL,
+    expires_at REAL NOT NULL
+)
+"""
+
+
+def generation_key(
+    model_name: str,
+    prompt: str,
+    generation_config: Mapping[str, Any] | None = None,
+    schema: type | None = None,
+) -> str:
+    """Content address of a generation request.
+
+    Hashes the model name, the prompt and, when given, the generation settings and
+    the response schema's fields, so requests differing in any of them get
+    different keys.
+    """
+
+    digest = hashlib.sha256()
+    digest.update(model_name.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(prompt.encode("utf-8"))
+    settings = dict(generation_config or {})
+    if schema is not None:
+        settings["response_schema"] = _describe_schema(schema)
+    if settings:
+        digest.update(b"\0")
+        digest.update(json.dumps(settings, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _describe_schema(schema: type) -> object:
+    # Field names and types, so editing the schema class changes the key.
+    name = f"{schema.__module__}.{schema.__qualname__}"
+    if dataclasses.is_dataclass(schema):
+        return [name, [[f.name, str(f.type)] for f in dataclasses.fields(schema)]]
+    return name
+
+
+class GenerationCache:
+    """Two-tier (memory LRU, optional SQLite) cache of generated texts.
+
+    Args:
+        max_entries: Entry cap of the in-memory LRU.
+        ttl: Time-to-live in seconds for both tiers.
+        path: Optional SQLite file for the on-disk tier.
+    """
+
+    def __init__(self, *, max_entries: int, ttl: float, path: str | Path | None = None) -> None:
+        self.ttl = ttl
+        self.memory: TTLCache[str] = TTLCache(ttl=ttl, max_entries=max_entries)
+        self.stats = CacheStats()
+        self.disk_hits = 0
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        if path is not None:
+            file = Path(path).expanduser()
+            file.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(file), check_same_thread=False)
+            with self._lock, self._conn:
+                self._conn.execute(_SCHEMA)
+                self._conn.execute("DELETE FROM generations WHERE expires_at <= ?", (time.time(),))
+
+    def get(self, key: str) -> str | None:
+        text = self.memory.get(key)
+        if text is None and self._conn is not None:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT text FROM generations WHERE key = ? AND expires_at > ?",
+                    (key, time.time()),
+                ).fetchone()
+            if row is not None:
+                text = row[0]
+                self.memory.set(key, text)
+                with self._lock:
+                    self.disk_hits += 1
+        with self._lock:
+            if text is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+        return text
+
+    def set(self, key: str, text: str) -> None:
+        # Empty generations are usually blocked or failed responses; don't pin them.
+        if not text.strip():
+            return
+        self.memory.set(key, text)
+        if self._conn is not None:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO generations VALUES (?, ?, ?)",
+                    (key, text, time.time() + self.ttl),
+                )
+
+    def stats_dict(self) -> dict[str, float]:
+        return {
+            **self.stats.as_dict(),
+            "disk_hits": self.disk_hits,
+            "evictions": self.memory.stats.evictions,
+            "entries": len(self.memory),
+        }
+
+    def close(self) -> None:
+        if self._conn is not None:
+            with self._lock:
+                self._conn.close()
+            self._conn = None
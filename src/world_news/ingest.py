@@ -0,0 +1,254 @@
+"""Background ingestion of watched topics.
+
+`IngestScheduler` periodically searches GDELT for each configured topic (see
+`IngestConfig`), asking only for articles newer than the last ``seendate`` seen for
+that topic, up to today. Results go through `GDELTClient`, so they are ingested
+into the local article store. After each run the store records the topic's
+coverage from its first fetched day through today, so user searches for the topic
+(any window inside it, or the newest articles of a wider one) are answered from
+the store instead of GDELT; see `LocalFirstRetriever`.
+
+Run it with the FastAPI app (``ingest.enabled: true``) or on its own::
+
+    python -m world_news.ingest [--once]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import logging
+import random
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+from .article_store import create_store
+from .clients.gdelt import Article, GDELTClient
+from .config import ConfigManager, IngestConfig, WatchedTopic
+
+logger = logging.getLogger(__name__)
+
+
+class RequestBudget:
+    """Sliding-window cap of ``max_requests`` per ``window_seconds``."""
+
+    def __init__(
+        self,
+        max_requests: int,
+        window_seconds: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_requests = max(1, max_requests)
+        self.window_seconds = window_seconds
+        self._clock = clock
+        self._sent: deque[float] = deque()
+
+    def _trim(self, now: float) -> None:
+        while self._sent and self._sent[0] <= now - self.window_seconds:
+            self._sent.popleft()
+
+    def try_acquire(self) -> bool:
+        now = self._clock()
+        self._trim(now)
+        if len(self._sent) >= self.max_requests:
+            return False
+        self._sent.append(now)
+        return True
+
+    def wait_time(self) -> float:
+        """Seconds until a request fits in the budget again."""
+
+        now = self._clock()
+        self._trim(now)
+        if len(self._sent) < self.max_requests:
+            return 0.0
+        return self._sent[0] + self.window_seconds - now
+
+
+@dataclass
+class TopicState:
+    topic: WatchedTopic
+    next_run: float
+    # Newest GDELT seendate (``20250101T120000Z``) ingested for this topic.
+    last_seendate: str | None = None
+    # First day of the topic's unbroken coverage in the store (ISO date).
+    covered_since: str | None = None
+
+
+@dataclass
+class IngestStats:
+    runs: int = 0
+    new_articles: int = 0
+    deferred: int = 0
+    errors: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return {
+            "runs": self.runs,
+            "new_articles": self.new_articles,
+            "deferred": self.deferred,
+            "errors": self.errors,
+        }
+
+
+class IngestScheduler:
+    """Periodically fetch watched topics through a `GDELTClient`.
+
+    Args:
+        client: GDELT client; its cache and article store are warmed by each run.
+        config: Topics, per-topic interval, jitter and the global request budget.
+        clock: Monotonic clock, injectable for tests.
+        rng: Random source for jitter.
+    """
+
+    def __init__(
+        self,
+        client: GDELTClient,
+        config: IngestConfig,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        rng: random.Random | None = None,
+    ) -> None:
+        self.client = client
+        self.config = config
+        self.clock = clock
+        self.rng = rng or random.Random()
+        self.budget = RequestBudget(
+            config.budget_requests, config.budget_window_seconds, clock=clock
+        )
+        self.stats = IngestStats()
+        now = clock()
+        self.topics = [TopicState(topic, next_run=now + self._jitter()) for topic in config.topics]
+        self._task: asyncio.Task[None] | None = None
+
+    def _jitter(self) -> float:
+        return self.rng.uniform(0.0, max(0.0, self.config.jitter_seconds))
+
+    def _interval(self, topic: WatchedTopic) -> float:
+        return topic.interval_seconds or self.config.interval_seconds
+
+    def _start_date(self, state: TopicState) -> str:
+        if state.last_seendate:
+            # The Doc API filters by day; newer-than-last is applied to the results.
+            seen = state.last_seendate
+            return f"{seen[:4]}-{seen[4:6]}-{seen[6:8]}"
+        start = datetime.now(UTC).date() - timedelta(days=self.config.lookback_days)
+        return start.isoformat()
+
+    async def run_topic(self, state: TopicState) -> list[Article]:
+        """Fetch one topic and return the articles newer than its last ``seendate``."""
+
+        topic = state.topic
+        start_date = self._start_date(state)
+        # Both bounds: gdeltdoc rejects a start date without an end date.
+        end_date = datetime.now(UTC).date().isoformat()
+        max_records = topic.max_records or self.config.max_records
+        articles = await self.client.search_articles_async(
+            query=topic.query,
+            start_date=start_date,
+            end_date=end_date,
+            max_records=max_records,
+            languages=topic.languages,
+        )
+        fresh = [
+            a
+            for a in articles
+            if a.seendate and (state.last_seendate is None or a.seendate > state.last_seendate)
+        ]
+        if fresh:
+            state.last_seendate = max(a.seendate for a in fresh if a.seendate)
+        if len(articles) >= max_records or state.covered_since is None:
+            # A capped result may leave a gap after the previous run: restart coverage.
+            state.covered_since = start_date
+        if self.client.store is not None:
+            # Blocks on SQLite (and on queued batches); keep it off the event loop.
+            await asyncio.to_thread(
+                self.client.store.mark_covered,
+                topic.query,
+                state.covered_since,
+                end_date,
+                topic.languages,
+            )
+        self.stats.runs += 1
+        self.stats.new_articles += len(fresh)
+        return fresh
+
+    async def run_due(self, *, force: bool = False) -> int:
+        """Run every topic whose time has come (all topics if ``force``); return runs."""
+
+        ran = 0
+        for state in self.topics:
+            now = self.clock()
+            if not force and state.next_run > now:
+                continue
+            if not self.budget.try_acquire():
+                self.stats.deferred += 1
+                state.next_run = now + self.budget.wait_time() + self._jitter()
+                continue
+            try:
+                await self.run_topic(state)
+                ran += 1
+            except Exception:
+                self.stats.errors += 1
+                logger.exception("Ingest of topic %r failed", state.topic.query)
+            state.next_run = self.clock() + self._interval(state.topic) + self._jitter()
+        return ran
+
+    async def run(self) -> None:
+        """Run topics as they fall due, until cancelled."""
+
+        if not self.topics:
+            return
+        while True:
+            await self.run_due()
+            next_run = min(state.next_run for state in self.topics)
+            await asyncio.sleep(max(0.0, next_run - self.clock()))
+
+    def start(self) -> asyncio.Task[None]:
+        """Run the scheduler as a background task on the current event loop."""
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run(), name="world-news-ingest")
+        return self._task
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+
+def main() -> None:
+    """Entrypoint to run the ingest scheduler without the HTTP app."""
+
+    parser = argparse.ArgumentParser(description="Ingest watched GDELT topics")
+    parser.add_argument("--once", action="store_true", help="Fetch every topic once and exit")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    config = ConfigManager().config
+    store = create_store(config.pipeline)
+    client = GDELTClient.create_default(config.gdelt, store=store)
+    scheduler = IngestScheduler(client, config.ingest)
+    try:
+        if args.once:
+            asyncio.run(scheduler.run_due(force=True))
+        else:
+            asyncio.run(scheduler.run())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if store is not None:
+            store.close()
+    logger.info("Ingest stats: %s", scheduler.stats.as_dict())
+
+
+if __name__ == "__main__":
+    main()
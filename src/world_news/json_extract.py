@@ -0,0 +1,75 @@
+"""Tolerant extraction of a JSON object from model output.
+
+Schema-constrained generation returns bare JSON, but a model that ignores the
+constraint (or one configured without it) tends to wrap the object in markdown
+fences or surround it with prose. `JSONObjectExtractor` scans text as it arrives,
+tracking string and escape state, and returns the first balanced ``{...}`` that
+decodes to a JSON object. It can be fed a stream chunk by chunk and stops at the
+object's closing brace, so the rest of a response never has to be waited for.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+
+class JSONObjectExtractor:
+    """Incremental scanner for the first JSON object embedded in text."""
+
+    def __init__(self) -> None:
+        self._buffer: list[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self.result: dict[str, Any] | None = None
+
+    @property
+    def done(self) -> bool:
+        return self.result is not None
+
+    def feed(self, chunk: str) -> dict[str, Any] | None:
+        """Scan ``chunk``; return the object once its closing brace has been seen."""
+
+        for char in chunk:
+            if self.result is not None:
+                break
+            if self._depth == 0:
+                # Outside an object: skip prose and fences until one opens.
+                if char == "{":
+                    self._buffer = [char]
+                    self._depth = 1
+                continue
+            self._buffer.append(char)
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == "{":
+                self._depth += 1
+            elif char == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._close()
+        return self.result
+
+    def _close(self) -> None:
+        try:
+            value = json.loads("".join(self._buffer))
+        except ValueError:
+            # Braces in prose (e.g. "{note}"); keep looking for a real object.
+            value = None
+        self._buffer = []
+        if isinstance(value, dict):
+            self.result = value
+
+
+def extract_json_object(text: str) -> dict[str, Any] | None:
+    """First JSON object in ``text`` (bare, fenced or amid prose), or None."""
+
+    return JSONObjectExtractor().feed(text or "")
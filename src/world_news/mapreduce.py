@@ -0,0 +1,204 @@
+"""Hierarchical (map-reduce) summarization for large article sets.
+
+Articles are split into chunks that each fit a token budget (optionally keeping
+a domain or source country together), the chunks are summarized concurrently
+with a bounded worker pool, and the partial digests are merged into the final
+digest. Inputs that fit one prompt should use the single-call path instead.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+
+from .clients import Article, GeminiClient
+from .config import PipelineConfig
+from .context import PASSAGE_SEPARATOR, ContextPack, estimate_tokens, format_passage, pack_context
+
+GROUP_KEYS = ("tokens", "domain", "country")
+
+# Word cap for each partial digest; the final merge applies the caller's cap.
+PARTIAL_MAX_WORDS = 120
+
+
+def select_summary_context(
+    articles: Iterable[Article], *, question: str | None, config: PipelineConfig
+) -> tuple[ContextPack, bool]:
+    """Choose between the single-call and map-reduce summarization paths.
+
+    Returns:
+        tuple[ContextPack, bool]: The context to use and whether to map-reduce it.
+        Map-reduce is chosen only when enabled and the deduplicated passages exceed
+        ``config.context_token_budget``; otherwise the context is packed to the budget.
+    """
+
+    items = list(articles)
+    if config.map_reduce:
+        full = pack_context(items, question=question)
+        if full.kept_tokens > config.context_token_budget:
+            return full, True
+    return pack_context(items, question=question, token_budget=config.context_token_budget), False
+
+
+def chunk_articles(
+    articles: Iterable[Article],
+    *,
+    chunk_tokens: int,
+    group_by: str = "tokens",
+    max_chunks: int | None = None,
+) -> list[list[str]]:
+    """Split articles into passage chunks of at most ``chunk_tokens`` estimated tokens.
+
+    Args:
+        articles: Articles in priority order.
+        chunk_tokens: Estimated-token budget per chunk.
+        group_by: ``tokens`` (fill in order), ``domain`` or ``country`` (keep
+            articles sharing the key together; small groups share a chunk).
+        max_chunks: Drop chunks beyond this count (lowest priority last).
+
+    Returns:
+        list[list[str]]: Passages per chunk.
+    """
+
+    if group_by not in GROUP_KEYS:
+        raise ValueError(f"Unknown group_by {group_by!r}; expected one of {GROUP_KEYS}")
+
+    items = list(articles)
+    if group_by != "tokens":
+        order: dict[str, int] = {}
+        for article in items:
+            order.setdefault(_group_key(article, group_by), len(order))
+        items.sort(key=lambda a: order[_group_key(a, group_by)])
+
+    chunks: list[list[str]] = []
+    sizes: list[int] = []
+    current_key: str | None = None
+    for article in items:
+        passage = format_passage(article)
+        cost = estimate_tokens(passage + PASSAGE_SEPARATOR)
+        key = _group_key(article, group_by) if group_by != "tokens" else None
+        if not chunks or key != current_key or sizes[-1] + cost > chunk_tokens:
+            chunks.append([])
+            sizes.append(0)
+            current_key = key
+        chunks[-1].append(passage)
+        sizes[-1] += cost
+
+    # Merge neighbouring small chunks (e.g., single-article domains).
+    merged: list[list[str]] = []
+    merged_sizes: list[int] = []
+    for chunk, size in zip(chunks, sizes, strict=True):
+        if merged and merged_sizes[-1] + size <= chunk_tokens:
+            merged[-1].extend(chunk)
+            merged_sizes[-1] += size
+        else:
+            merged.append(list(chunk))
+            merged_sizes.append(size)
+    return merged[:max_chunks] if max_chunks else merged
+
+
+def _group_key(article: Article, group_by: str) -> str:
+    value = article.domain if group_by == "domain" else article.sourcecountry
+    return (value or "").lower()
+
+
+async def map_summaries_async(
+    llm: GeminiClient,
+    chunks: Sequence[Sequence[str]],
+    *,
+    concurrency: int,
+    max_words: int = PARTIAL_MAX_WORDS,
+    bypass_cache: bool = False,
+) -> list[str]:
+    """Summarize each chunk concurrently, at most ``concurrency`` calls at a time."""
+
+    limit = asyncio.Semaphore(max(1, concurrency))
+
+    async def summarize(chunk: Sequence[str]) -> str:
+        async with limit:
+            return await llm.summarize_async(
+                PASSAGE_SEPARATOR.join(chunk), max_words=max_words, bypass_cache=bypass_cache
+            )
+
+    partials = await asyncio.gather(*(summarize(chunk) for chunk in chunks))
+    return [p for p in partials if p.strip()]
+
+
+def map_summaries(
+    llm: GeminiClient,
+    chunks: Sequence[Sequence[str]],
+    *,
+    concurrency: int,
+    max_words: int = PARTIAL_MAX_WORDS,
+    bypass_cache: bool = False,
+) -> list[str]:
+    """Blocking variant of `map_summaries_async` using a thread pool."""
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        partials = list(
+            pool.map(
+                lambda chunk: llm.summarize(
+                    PASSAGE_SEPARATOR.join(chunk), max_words=max_words, bypass_cache=bypass_cache
+                ),
+                chunks,
+            )
+        )
+    return [p for p in partials if p.strip()]
+
+
+async def summarize_chunks_async(
+    llm: GeminiClient,
+    chunks: Sequence[Sequence[str]],
+    *,
+    max_words: int,
+    concurrency: int,
+    bypass_cache: bool = False,
+) -> str:
+    """Summarize chunks concurrently, then merge the partial digests into one.
+
+    The merge always runs, so the result follows the final prompt and ``max_words``
+    even when a single partial survives; a single chunk is summarized directly.
+    """
+
+    if len(chunks) == 1:
+        return await llm.summarize_async(
+            PASSAGE_SEPARATOR.join(chunks[0]), max_words=max_words, bypass_cache=bypass_cache
+        )
+    partials = await map_summaries_async(
+        llm, chunks, concurrency=concurrency, bypass_cache=bypass_cache
+    )
+    if not partials:
+        return ""
+    return await llm.merge_summaries_async(partials, max_words=max_words, bypass_cache=bypass_cache)
+
+
+def summarize_chunks(
+    llm: GeminiClient,
+    chunks: Sequence[Sequence[str]],
+    *,
+    max_words: int,
+    concurrency: int,
+    bypass_cache: bool = False,
+) -> str:
+    """Blocking variant of `summarize_chunks_async`."""
+
+    if len(chunks) == 1:
+        return llm.summarize(
+            PASSAGE_SEPARATOR.join(chunks[0]), max_words=max_words, bypass_cache=bypass_cache
+        )
+    partials = map_summaries(llm, chunks, concurrency=concurrency, bypass_cache=bypass_cache)
+    if not partials:
+        return ""
+    return llm.merge_summaries(partials, max_words=max_words, bypass_cache=bypass_cache)
+
+
+def config_chunks(articles: Iterable[Article], config: PipelineConfig) -> list[list[str]]:
+    """`chunk_articles` with the chunking options of ``config``."""
+
+    return chunk_articles(
+        articles,
+        chunk_tokens=config.map_reduce_chunk_tokens,
+        group_by=config.map_reduce_group_by,
+        max_chunks=config.map_reduce_max_chunks,
+    )
@@ -10,23 +10,50 @@ Run via: `python -m world_news.mcp_server`
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from mcp.server.fastmcp import FastMCP
 
 from .clients import Article
-from .config import get_settings
-from .service import NewsService
+from .config import ConfigManager, get_settings
+
+if TYPE_CHECKING:
+    from .config import ProjectConfig
+    from .service import ArticleSearch, NewsService
+
+
+def build_search(config: ProjectConfig | None = None) -> ArticleSearch:
+    """Construct the GDELT side only: no Gemini key is needed and Gemini is not imported."""
+
+    from .service import ArticleSearch
+
+    return ArticleSearch.create_default(config or ConfigManager().config)
 
 
 def build_service() -> NewsService:
-    """Construct and return a `NewsService` using environment configuration."""
+    """Construct and return a `NewsService` using environment configuration.
+
+    Deferred to the first tool call, so starting a session imports no pipeline code.
+    Shares the session's `ArticleSearch`, so there is one GDELT rate limiter and
+    article store.
+    """
+
+    from .service import NewsService
 
+    global search
     settings = get_settings()
+    if search is None:
+        search = build_search(settings.project)
     return NewsService.create_default(
-        gemini_api_key=settings.gemini_api_key, gemini_model=settings.gemini_model
+        gemini_api_key=settings.gemini_api_key,
+        gemini_model=settings.gemini_model,
+        config=settings.project,
+        search=search,
     )
 
 
 mcp = FastMCP(name="gdelt-gemini")
+search: ArticleSearch | None = None
 service: NewsService | None = None
 
 
@@ -51,10 +78,11 @@ def gdelt_search(
         List[Article]: A list of article records.
     """
 
-    global service
-    if service is None:
-        service = build_service()
-    return service.search(
+    global search
+    # Only the GDELT side: a search-only session never builds Gemini clients.
+    if search is None:
+        search = build_search()
+    return search.search(
         query=query,
         start_date=start_date,
         end_date=end_date,
@@ -64,12 +92,15 @@ def gdelt_search(
 
 
 @mcp.tool()
-def summarize_articles(articles: list[Article], max_words: int = 200) -> str:
+def summarize_articles(
+    articles: list[Article], max_words: int = 200, bypass_cache: bool = False
+) -> str:
     """Summarize a collection of articles into a concise digest.
 
     Args:
         articles: Article records to summarize.
         max_words: Soft cap for summary length.
+        bypass_cache: Force a fresh generation instead of a cached digest.
 
     Returns:
         str: Digest summary.
@@ -78,16 +109,17 @@ def summarize_articles(articles: list[Article], max_words: int = 200) -> str:
     global service
     if service is None:
         service = build_service()
-    return service.summarize_articles(articles, max_words=max_words)
+    return service.summarize_articles(articles, max_words=max_words, bypass_cache=bypass_cache)
 
 
 @mcp.tool()
-def answer_question(question: str, articles: list[Article]) -> str:
+def answer_question(question: str, articles: list[Article], bypass_cache: bool = False) -> str:
     """Answer a question using only the provided articles as context.
 
     Args:
         question: User's question to answer.
         articles: Articles used to ground the answer.
+        bypass_cache: Force a fresh generation instead of a cached answer.
 
     Returns:
         str: Grounded answer.
@@ -96,7 +128,7 @@ def answer_question(question: str, articles: list[Article]) -> str:
     global service
     if service is None:
         service = build_service()
-    return service.answer_question(question, articles=articles)
+    return service.answer_question(question, articles=articles, bypass_cache=bypass_cache)
 
 
 def main() -> None:
@@ -107,5 +139,3 @@ def main() -> None:
 
 if __name__ == "__main__":
     main()
-
-
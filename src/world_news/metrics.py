@@ -0,0 +1,238 @@
+"""Per-stage timing and Prometheus-format metrics.
+
+Pipeline stages (planner LLM, GDELT fetch, article decoding, Gemini calls,
+dedup/rerank, summarization) are wrapped in `timed`. Each duration is observed in
+the process-wide `METRICS` registry, rendered by ``GET /metrics`` in the Prometheus
+text format, and added to the current request's `RequestTimings` if one is active
+(``/chat`` returns it as a ``Server-Timing`` header). Article counts, prompt sizes
+and Gemini token usage are recorded alongside.
+
+With ``METRICS.enabled`` off, `timed` returns a shared no-op context manager and
+the ``record_*`` helpers return immediately.
+"""
+
+from __future__ import annotations
+
+import bisect
+import contextlib
+import threading
+import time
+from collections.abc import Iterator, Mapping
+from contextlib import AbstractContextManager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+Labels = tuple[tuple[str, str], ...]
+
+SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+COUNT_BUCKETS = (0.0, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0)
+CHARS_BUCKETS = (1_000.0, 4_000.0, 16_000.0, 64_000.0, 256_000.0)
+
+HELP = {
+    "world_news_stage_seconds": "Duration of pipeline stages.",
+    "world_news_articles": "Articles returned by a retrieval stage or kept for the prompt.",
+    "world_news_gemini_prompt_chars": "Characters of prompts sent to Gemini.",
+    "world_news_gemini_tokens_total": "Gemini token usage reported in usage metadata.",
+    "world_news_component_stat": "Cache and coalescer counters from NewsService.stats().",
+    "world_news_plan_parse_total": "Planner replies by outcome: ok, recovered or failed.",
+}
+
+
+class _Histogram:
+    __slots__ = ("buckets", "counts", "total", "count")
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.total += value
+        self.count += 1
+
+
+class Metrics:
+    """Thread-safe registry of labelled counters and histograms."""
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._counters: dict[str, dict[Labels, float]] = {}
+        self._histograms: dict[str, dict[Labels, _Histogram]] = {}
+
+    def inc(self, name: str, value: float = 1.0, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + value
+
+    def observe(
+        self,
+        name: str,
+        value: float,
+        buckets: tuple[float, ...] = SECONDS_BUCKETS,
+        **labels: str,
+    ) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = _Histogram(buckets)
+            histogram.observe(value)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def render(self, components: Mapping[str, Mapping[str, float]] | None = None) -> str:
+        """Prometheus text exposition of all series, plus ``components`` as gauges."""
+
+        lines: list[str] = []
+        with self._lock:
+            for name, series in sorted(self._histograms.items()):
+                _header(lines, name, "histogram")
+                for labels, h in sorted(series.items()):
+                    cumulative = 0
+                    for bound, count in zip(h.buckets, h.counts, strict=True):
+                        cumulative += count
+                        le = labels + (("le", _number(bound)),)
+                        lines.append(f"{name}_bucket{_labels(le)} {cumulative}")
+                    lines.append(f"{name}_bucket{_labels(labels + (('le', '+Inf'),))} {h.count}")
+                    lines.append(f"{name}_sum{_labels(labels)} {_number(h.total)}")
+                    lines.append(f"{name}_count{_labels(labels)} {h.count}")
+            for name, counters in sorted(self._counters.items()):
+                _header(lines, name, "counter")
+                for labels, value in sorted(counters.items()):
+                    lines.append(f"{name}{_labels(labels)} {_number(value)}")
+        if components:
+            name = "world_news_component_stat"
+            _header(lines, name, "gauge")
+            for component, stats in sorted(components.items()):
+                for stat, value in sorted(stats.items()):
+                    labels = (("component", component), ("stat", stat))
+                    lines.append(f"{name}{_labels(labels)} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _header(lines: list[str], name: str, kind: str) -> None:
+    if name in HELP:
+        lines.append(f"# HELP {name} {HELP[name]}")
+    lines.append(f"# TYPE {name} {kind}")
+
+
+def _labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        (k, v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")) for k, v in labels
+    )
+    return "{" + ",".join(f'{k}="{v}"' for k, v in escaped) + "}"
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+METRICS = Metrics()
+
+
+@dataclass
+class RequestTimings:
+    """Stage durations of one request, summed per stage."""
+
+    stages: dict[str, list[float]] = field(default_factory=dict)
+
+    def add(self, stage: str, seconds: float) -> None:
+        entry = self.stages.setdefault(stage, [0.0, 0])
+        entry[0] += seconds
+        entry[1] += 1
+
+    def header(self) -> str:
+        """``Server-Timing`` value, e.g. ``gdelt;dur=231.4, gemini;dur=812.0;desc="2 calls"``."""
+
+        parts = []
+        for stage, (seconds, calls) in self.stages.items():
+            part = f"{stage};dur={seconds * 1000:.1f}"
+            if calls > 1:
+                part += f';desc="{int(calls)} calls"'
+            parts.append(part)
+        return ", ".join(parts)
+
+
+# Tasks and threads started during a request copy the context, so they share its timings.
+_current: ContextVar[RequestTimings | None] = ContextVar("world_news_timings", default=None)
+
+
+@contextlib.contextmanager
+def request_timings() -> Iterator[RequestTimings]:
+    """Collect the stages timed inside the block into a fresh `RequestTimings`."""
+
+    timings = RequestTimings()
+    token = _current.set(timings)
+    try:
+        yield timings
+    finally:
+        _current.reset(token)
+
+
+def record_stage(stage: str, seconds: float) -> None:
+    METRICS.observe("world_news_stage_seconds", seconds, stage=stage)
+    timings = _current.get()
+    if timings is not None:
+        timings.add(stage, seconds)
+
+
+class _Timer:
+    __slots__ = ("stage", "started")
+
+    def __init__(self, stage: str) -> None:
+        self.stage = stage
+        self.started = 0.0
+
+    def __enter__(self) -> _Timer:
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        record_stage(self.stage, time.perf_counter() - self.started)
+
+
+_NOOP: AbstractContextManager[None] = contextlib.nullcontext()
+
+
+def timed(stage: str) -> AbstractContextManager[object]:
+    """Time the enclosed block as ``stage`` (a no-op while metrics are disabled)."""
+
+    if not METRICS.enabled:
+        return _NOOP
+    return _Timer(stage)
+
+
+def record_articles(stage: str, count: int) -> None:
+    if METRICS.enabled:
+        METRICS.observe("world_news_articles", count, COUNT_BUCKETS, stage=stage)
+
+
+def record_plan_parse(outcome: str) -> None:
+    if METRICS.enabled:
+        METRICS.inc("world_news_plan_parse_total", outcome=outcome)
+
+
+def record_generation(model: str, prompt: str, usage: object | None) -> None:
+    """Record the prompt size and the token counts of a response's ``usage_metadata``."""
+
+    if not METRICS.enabled:
+        return
+    METRICS.observe("world_news_gemini_prompt_chars", len(prompt), CHARS_BUCKETS, model=model)
+    if usage is None:
+        return
+    for kind in ("prompt", "candidates", "total"):
+        tokens = getattr(usage, f"{kind}_token_count", None)
+        if tokens:
+            METRICS.inc("world_news_gemini_tokens_total", tokens, model=model, kind=kind)
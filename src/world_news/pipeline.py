@@ -2,94 +2,503 @@
 
 Stages:
 1) Planning LLM: reads the user's question and produces a cleaned GDELT query and optional params.
-2) Retrieval via GDELT client (or MCP tool): fetch articles.
+   Simple questions are planned by local rules (`fast_planner`) and skip the LLM.
+2) Retrieval via GDELT client (or MCP tool): fetch articles, collapse near-duplicates and
+   keep the ones most relevant to the question (BM25 rerank).
 3) Summarizer LLM: summarizes the fetched articles based on the user question.
+
+The async variants are the primary implementation; the sync functions are thin
+wrappers kept for scripts and callers without an event loop.
 """
 
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass
+import asyncio
+import contextlib
+import re
+from collections.abc import AsyncIterator
+from dataclasses import asdict, dataclass, field, replace
+from datetime import UTC, date, datetime
+from typing import Any
+
+from .clients import Article, GeminiClient
+from .clients.gdelt import DEFAULT_SEARCH_WINDOW, ArticleRetriever, articles_to_dicts
+from .config import PipelineConfig
+from .deadline import Deadline, bounded, fit_summary, headline_digest
+from .dedup import collapse_duplicates
+from .fast_planner import plan_locally
+from .mapreduce import (
+    config_chunks,
+    map_summaries_async,
+    select_summary_context,
+    summarize_chunks_async,
+)
+from .metrics import record_articles, timed
+from .plan_cache import PlanCache
+from .planner import (
+    PlanResult,
+    build_plan_prompt,
+    parse_plan,
+    plan_gdelt_search,
+    plan_gdelt_search_async,
+)
+from .rerank import rerank
+from .text import content_terms, extract_keywords, quoted_phrases
+
+__all__ = [
+    "PipelineEvent",
+    "PipelineTrace",
+    "PlanResult",
+    "build_plan_prompt",
+    "parse_plan",
+    "plan_question_async",
+    "refine_articles",
+    "plan_gdelt_search",
+    "plan_gdelt_search_async",
+    "run_pipeline",
+    "run_pipeline_async",
+    "stream_pipeline_async",
+]
+
+
+@dataclass
+class PipelineTrace:
+    """Per-request telemetry filled in by `run_pipeline_async`.
+
+    Attributes:
+        plan: Search plan used for retrieval.
+        planner: Where the plan came from ("rules", "cache" or "llm").
+        plan_confidence: Confidence of the rule-based planner, if it ran.
+        num_articles: Number of distinct articles kept for summarization.
+        duplicates_collapsed: Near-duplicate articles folded into representatives.
+        rerank_dropped: Articles retrieved but cut by the BM25 reranker.
+        context: Kept/dropped article and token counts of the summarizer context.
+        map_reduce_chunks: Number of chunks summarized in parallel (0 for a single call).
+        speculative_query: Keyword query searched while planning, if speculation ran.
+        speculative_hit: Whether the speculative result was reused (None if not attempted).
+        degradations: Shortcuts taken to protect latency (``"overload"``, or the
+            latency-budget steps of `world_news.deadline`).
+    """
 
-from .clients import GDELTClient, GeminiClient
-from .prompt_library import get_prompts
+    plan: PlanResult | None = None
+    planner: str | None = None
+    plan_confidence: float | None = None
+    num_articles: int = 0
+    duplicates_collapsed: int = 0
+    rerank_dropped: int = 0
+    context: dict[str, int] | None = None
+    map_reduce_chunks: int = 0
+    speculative_query: str | None = None
+    speculative_hit: bool | None = None
+    degradations: list[str] = field(default_factory=list)
 
 
 @dataclass(frozen=True)
-class PlanResult:
-    query: str
-    start_date: str | None
-    end_date: str | None
-    languages: list[str] | None
-    max_records: int
-
-
-def plan_gdelt_search(planner_llm: GeminiClient, user_question: str) -> PlanResult:
-    prompts = get_prompts()
-    prompt = prompts.plan_gdelt + "\n\nUSER QUESTION:\n" + user_question + "\n"
-    raw = planner_llm.model.generate_content(prompt).text or "{}"
+class PipelineEvent:
+    """A stage event yielded by `stream_pipeline_async`.
+
+    Attributes:
+        event: ``plan``, ``articles``, ``token`` or ``done``.
+        data: JSON-serializable payload of the event.
+    """
+
+    event: str
+    data: Any
+
+
+_OPERATOR_RE = re.compile(r"\b(?:OR|NOT)\b|[()]|(?:^|\s)-|\w+:")
+
+
+def query_terms(query: str) -> frozenset[str] | None:
+    """Content terms of a plain AND query, or None if it uses other operators."""
+
+    if _OPERATOR_RE.search(query):
+        return None
+    phrases = [p.casefold() for p in quoted_phrases(query)]
+    rest = re.sub(r'"[^"]*"', " ", query)
+    return frozenset(phrases + content_terms(rest))
+
+
+def reuse_speculation(
+    plan: PlanResult,
+    speculative_query: str,
+    speculative_max_records: int,
+    articles: list[Article],
+) -> list[Article] | None:
+    """Return the planned result derived from the speculative one, or None if not derivable.
+
+    The speculation is reusable when the planned query has the same terms and the
+    plan only narrows it: fewer records, or a date window inside the default window
+    when the speculative result was not truncated by its record cap.
+    """
+
+    terms = query_terms(plan.query)
+    if not terms or terms != query_terms(speculative_query):
+        return None
+    if plan.languages:
+        return None
+    complete = len(articles) < speculative_max_records
+    if plan.start_date or plan.end_date:
+        if not complete or not _within_default_window(plan.start_date):
+            return None
+        articles = [a for a in articles if seen_within(a, plan.start_date, plan.end_date)]
+    elif plan.max_records > speculative_max_records and not complete:
+        return None
+    return articles[: plan.max_records]
+
+
+def _within_default_window(start_date: str | None) -> bool:
+    if not start_date:
+        return False
     try:
-        data = json.loads(raw)
-    except Exception:
-        data = {}
-
-    query = data.get("query") if isinstance(data, dict) else None
-    if not isinstance(query, str) or not query.strip():
-        # Fallback: use the user question best-effort
-        query = user_question.strip()
-
-    start_date = data.get("start_date") if isinstance(data, dict) else None
-    end_date = data.get("end_date") if isinstance(data, dict) else None
-    languages = data.get("languages") if isinstance(data, dict) else None
-    if not isinstance(languages, list):
-        languages = None
-    max_records = data.get("max_records") if isinstance(data, dict) else None
-    if not isinstance(max_records, int):
-        max_records = 20
-
-    return PlanResult(
-        query=query,
-        start_date=start_date or None,
-        end_date=end_date or None,
-        languages=languages or None,
-        max_records=max_records,
+        start = date.fromisoformat(start_date[:10])
+    except ValueError:
+        return False
+    return start >= datetime.now(UTC).date() - DEFAULT_SEARCH_WINDOW
+
+
+def seen_within(article: Article, start_date: str | None, end_date: str | None) -> bool:
+    """Whether the article's ``seendate`` falls inside the (inclusive) date window."""
+
+    # GDELT seendate looks like 20250101T120000Z; compare on the YYYYMMDD prefix.
+    seen = (article.seendate or "")[:8]
+    if not seen:
+        return False
+    if start_date and seen < start_date[:10].replace("-", ""):
+        return False
+    return not (end_date and seen > end_date[:10].replace("-", ""))
+
+
+async def _plan(
+    user_question: str,
+    planner_llm: GeminiClient,
+    retriever: ArticleRetriever | None,
+    config: PipelineConfig,
+    plan_cache: PlanCache | None,
+    trace: PipelineTrace,
+    deadline: Deadline | None = None,
+) -> tuple[PlanResult, asyncio.Task[list[Article]] | None]:
+    """Produce the search plan: local rules, then the plan cache, then the planner LLM.
+
+    Returns the plan and the speculative search task started while the LLM ran, if any.
+    If the planner LLM exceeds its share of ``deadline``, the rule-based plan is used.
+    """
+
+    plan: PlanResult | None = None
+    local = None
+    if config.fast_planner:
+        local = plan_locally(user_question)
+        trace.plan_confidence = local.confidence
+        if local.confidence >= config.fast_planner_threshold:
+            plan = local.plan
+            trace.planner = "rules"
+
+    if plan is None and plan_cache is not None:
+        plan = plan_cache.get(user_question)
+        if plan is not None:
+            trace.planner = "cache"
+
+    speculation: asyncio.Task[list[Article]] | None = None
+    if plan is None:
+        if config.speculative_retrieval and retriever is not None:
+            keywords = extract_keywords(user_question)
+            if keywords:
+                trace.speculative_query = keywords
+                speculation = asyncio.create_task(
+                    retriever.search_articles_async(
+                        query=keywords, max_records=speculative_records(config)
+                    )
+                )
+        try:
+            plan = await bounded(
+                plan_gdelt_search_async(planner_llm, user_question),
+                deadline,
+                config.deadline_planner_share,
+            )
+        except TimeoutError:
+            plan = (local or plan_locally(user_question)).plan
+            trace.planner = "rules"
+            trace.degradations.append("planner_timeout")
+        except BaseException:
+            if speculation is not None:
+                speculation.cancel()
+                with contextlib.suppress(BaseException):
+                    await speculation
+            raise
+        else:
+            trace.planner = "llm"
+            # A plan whose query is the raw question is a parse fallback; don't pin it.
+            if plan_cache is not None and plan.query != user_question.strip():
+                plan_cache.set(user_question, plan)
+    trace.plan = plan
+    return plan, speculation
+
+
+async def plan_question_async(
+    user_question: str,
+    planner_llm: GeminiClient,
+    *,
+    config: PipelineConfig | None = None,
+    plan_cache: PlanCache | None = None,
+    trace: PipelineTrace | None = None,
+) -> PlanResult:
+    """Plan one question (rules, plan cache, then the planner LLM) without retrieving."""
+
+    trace = trace if trace is not None else PipelineTrace()
+    plan, _ = await _plan(
+        user_question, planner_llm, None, config or PipelineConfig(), plan_cache, trace
     )
+    return plan
 
 
-def run_pipeline(
+def fetch_records(max_records: int, config: PipelineConfig) -> int:
+    """Records to fetch for a search wanting ``max_records`` articles."""
+
+    if config.rerank:
+        # Fetch wide; `refine_articles` keeps only the plan's worth of best-matching articles.
+        max_records = max(max_records, config.rerank_fetch_records)
+    if config.max_records_cap is not None:
+        max_records = min(max_records, config.max_records_cap)
+    return max_records
+
+
+def speculative_records(config: PipelineConfig) -> int:
+    """Records the speculative search fetches: as wide as the planned search will be.
+
+    Otherwise the rerank widening would always outgrow the speculative result.
+    """
+
+    return fetch_records(config.speculative_max_records, config)
+
+
+async def _retrieve(
+    retriever: ArticleRetriever,
+    plan: PlanResult,
+    speculation: asyncio.Task[list[Article]] | None,
+    config: PipelineConfig,
+    trace: PipelineTrace,
+) -> list[Article]:
+    plan = replace(plan, max_records=fetch_records(plan.max_records, config))
+    if speculation is not None and trace.speculative_query is not None:
+        reused: list[Article] | None = None
+        try:
+            # Wait for the in-flight keyword search only if it can serve this plan.
+            if query_terms(plan.query) == query_terms(trace.speculative_query):
+                speculative_articles = await speculation
+                reused = reuse_speculation(
+                    plan,
+                    trace.speculative_query,
+                    speculative_records(config),
+                    speculative_articles,
+                )
+        except Exception:
+            reused = None
+        finally:
+            speculation.cancel()
+            with contextlib.suppress(BaseException):
+                await speculation
+        trace.speculative_hit = reused is not None
+        if reused is not None:
+            return reused
+
+    return await retriever.search_articles_async(
+        query=plan.query,
+        start_date=plan.start_date,
+        end_date=plan.end_date,
+        max_records=plan.max_records,
+        languages=plan.languages,
+    )
+
+
+def refine_articles(
+    articles: list[Article],
+    user_question: str,
+    plan: PlanResult,
+    config: PipelineConfig,
+    trace: PipelineTrace,
+) -> list[Article]:
+    """Collapse near-duplicates, then keep the articles most relevant to the question."""
+
+    with timed("refine"):
+        if config.dedup:
+            retrieved = len(articles)
+            articles = collapse_duplicates(articles, max_distance=config.dedup_max_distance)
+            trace.duplicates_collapsed = retrieved - len(articles)
+        if config.rerank:
+            top_k = min(plan.max_records, config.rerank_top_k)
+            kept = rerank(articles, user_question, top_k=top_k)
+            trace.rerank_dropped = len(articles) - len(kept)
+            articles = kept
+    trace.num_articles = len(articles)
+    record_articles("kept", len(articles))
+    return articles
+
+
+async def run_pipeline_async(
     user_question: str,
     planner_llm: GeminiClient,
-    retriever: GDELTClient,
+    retriever: ArticleRetriever,
     summarizer_llm: GeminiClient,
+    *,
+    config: PipelineConfig | None = None,
+    plan_cache: PlanCache | None = None,
+    trace: PipelineTrace | None = None,
+    budget_seconds: float | None = None,
 ) -> str:
-    """Run the 2-step LLM + retrieval pipeline and return a summary.
+    """Run the 2-step LLM + retrieval pipeline without blocking the event loop.
 
     Args:
         user_question: The user's natural-language question.
         planner_llm: LLM used to plan GDELT search parameters.
-        retriever: Client for GDELT.
+        retriever: GDELT client, or a local-first retriever with the same interface.
         summarizer_llm: LLM used to summarize the retrieved articles.
+        config: Pipeline options; defaults are used if omitted.
+        plan_cache: Optional persistent cache of LLM plans.
+        trace: Optional telemetry object filled in as stages complete.
+        budget_seconds: Latency budget (default ``config.default_budget_seconds``).
+            Stages degrade to meet it; see `world_news.deadline`.
 
     Returns:
         str: Final summary text.
     """
 
-    plan = plan_gdelt_search(planner_llm, user_question)
-    articles = retriever.search_articles(
-        query=plan.query,
-        start_date=plan.start_date,
-        end_date=plan.end_date,
-        max_records=plan.max_records,
-        languages=plan.languages,
+    config = config or PipelineConfig()
+    trace = trace if trace is not None else PipelineTrace()
+    if budget_seconds is None:
+        budget_seconds = config.default_budget_seconds
+    deadline = Deadline.after(budget_seconds) if budget_seconds is not None else None
+
+    plan, speculation = await _plan(
+        user_question, planner_llm, retriever, config, plan_cache, trace, deadline
     )
+
+    try:
+        articles = await bounded(
+            _retrieve(retriever, plan, speculation, config, trace),
+            deadline,
+            config.deadline_retrieval_share,
+        )
+    except TimeoutError:
+        trace.degradations.append("retrieval_timeout")
+        return "No articles could be retrieved within the time budget."
+    articles = refine_articles(articles, user_question, plan, config, trace)
     if not articles:
         return "No relevant articles found."
 
-    passages: list[str] = []
-    for a in articles:
-        title = a.get("title") or ""
-        url = a.get("url") or ""
-        snippet = a.get("snippet") or ""
-        passages.append(f"Title: {title}\nURL: {url}\nSnippet: {snippet}")
-    combined = "\n\n".join(passages)
-    return summarizer_llm.summarize(combined, max_words=200)
+    with timed("summarize"):
+        config, max_words = fit_summary(config, deadline, trace.degradations)
+        context, use_map_reduce = select_summary_context(
+            articles, question=user_question, config=config
+        )
+        trace.context = context.report()
+        if use_map_reduce:
+            chunks = config_chunks(context.articles, config)
+            trace.map_reduce_chunks = len(chunks)
+            summary = summarize_chunks_async(
+                summarizer_llm,
+                chunks,
+                max_words=max_words,
+                concurrency=config.map_reduce_concurrency,
+            )
+        else:
+            summary = summarizer_llm.summarize_async(context.text, max_words=max_words)
+        try:
+            return await bounded(summary, deadline)
+        except TimeoutError:
+            trace.degradations.append("summary_timeout")
+            return headline_digest(context.articles)
+
+
+async def stream_pipeline_async(
+    user_question: str,
+    planner_llm: GeminiClient,
+    retriever: ArticleRetriever,
+    summarizer_llm: GeminiClient,
+    *,
+    config: PipelineConfig | None = None,
+    plan_cache: PlanCache | None = None,
+    trace: PipelineTrace | None = None,
+) -> AsyncIterator[PipelineEvent]:
+    """Generator form of `run_pipeline_async` yielding stage events as they happen.
+
+    Yields, in order: the ``plan``, the ``articles`` as soon as GDELT returns, the
+    summary as ``token`` chunks while Gemini streams it, and a final ``done`` event
+    carrying the trace.
+    """
+
+    config = config or PipelineConfig()
+    trace = trace if trace is not None else PipelineTrace()
+
+    plan, speculation = await _plan(
+        user_question, planner_llm, retriever, config, plan_cache, trace
+    )
+    yield PipelineEvent("plan", asdict(plan))
+
+    articles = await _retrieve(retriever, plan, speculation, config, trace)
+    articles = refine_articles(articles, user_question, plan, config, trace)
+    yield PipelineEvent("articles", articles_to_dicts(articles))
+
+    if not articles:
+        yield PipelineEvent("token", "No relevant articles found.")
+    else:
+        context, use_map_reduce = select_summary_context(
+            articles, question=user_question, config=config
+        )
+        trace.context = context.report()
+        if use_map_reduce:
+            # Partial digests are produced in parallel; only the merge is streamed.
+            chunks = config_chunks(context.articles, config)
+            trace.map_reduce_chunks = len(chunks)
+            partials = await map_summaries_async(
+                summarizer_llm, chunks, concurrency=config.map_reduce_concurrency
+            )
+            stream = summarizer_llm.merge_summaries_stream_async(partials, max_words=200)
+        else:
+            stream = summarizer_llm.summarize_stream_async(context.text, max_words=200)
+        async for text in stream:
+            yield PipelineEvent("token", text)
+    yield PipelineEvent("done", asdict(trace))
+
+
+def run_pipeline(
+    user_question: str,
+    planner_llm: GeminiClient,
+    retriever: ArticleRetriever,
+    summarizer_llm: GeminiClient,
+    *,
+    config: PipelineConfig | None = None,
+    plan_cache: PlanCache | None = None,
+    trace: PipelineTrace | None = None,
+    budget_seconds: float | None = None,
+) -> str:
+    """Run the 2-step LLM + retrieval pipeline and return a summary.
+
+    Blocking wrapper around `run_pipeline_async`; must not be called from a
+    running event loop.
+
+    Args:
+        user_question: The user's natural-language question.
+        planner_llm: LLM used to plan GDELT search parameters.
+        retriever: GDELT client, or a local-first retriever with the same interface.
+        summarizer_llm: LLM used to summarize the retrieved articles.
+        config: Pipeline options; defaults are used if omitted.
+        plan_cache: Optional persistent cache of LLM plans.
+        trace: Optional telemetry object filled in as stages complete.
+        budget_seconds: Latency budget (default ``config.default_budget_seconds``).
+
+    Returns:
+        str: Final summary text.
+    """
+
+    return asyncio.run(
+        run_pipeline_async(
+            user_question,
+            planner_llm=planner_llm,
+            retriever=retriever,
+            summarizer_llm=summarizer_llm,
+            config=config,
+            plan_cache=plan_cache,
+            trace=trace,
+            budget_seconds=budget_seconds,
+        )
+    )
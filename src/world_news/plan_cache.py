@@ -0,0 +1,149 @@
+"""Persistent cache of planner results keyed by normalized question text.
+
+Backed by a small SQLite database so plans survive restarts. Entries are
+versioned by a hash of the planner prompt, model and generation settings, so
+editing ``plan_gdelt`` or switching the planner model invalidates them
+automatically. Plans whose window depends on the current day expire at the
+next UTC day boundary: a date the question did not spell out was resolved
+relative to today ("last week", or the open end of "since 2026-10-01"), and a
+window reaching today is still filling up. Other plans do not expire.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from collections.abc import Mapping
+from dataclasses import asdict
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from .cache import CacheStats
+from .generation_cache import generation_key
+from .planner import PlanResult
+from .prompt_library import get_prompts
+from .text import STOPWORDS, tokenize
+
+# Words that change the meaning of a news question and must survive normalization.
+_SIGNIFICANT = frozenset({"today", "now", "before", "after", "during", "until", "not", "no", "or"})
+_STOPWORDS = STOPWORDS - _SIGNIFICANT
+_ISO_DATE_RE = re.compile(r"\b\d{4}-\d{2}-\d{2}\b")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS plans (
+    question TEXT NOT NULL,
+    prompt_version TEXT NOT NULL,
+    plan TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL,
+    PRIMARY KEY (question, prompt_version)
+)
+"""
+
+
+def normalize_question(question: str) -> str:
+    """Casefold, collapse whitespace and strip stopwords from ``question``."""
+
+    return " ".join(t for t in tokenize(question) if t not in _STOPWORDS)
+
+
+def prompt_version(
+    template: str | None = None,
+    *,
+    model_name: str = "",
+    generation_config: Mapping[str, Any] | None = None,
+) -> str:
+    """Short hash of the planner prompt template, model name and generation settings."""
+
+    text = template if template is not None else get_prompts().plan_gdelt
+    return generation_key(model_name, text, generation_config)[:16]
+
+
+def next_day_boundary(now: float | None = None) -> float:
+    """Unix timestamp of the next UTC midnight."""
+
+    current = datetime.fromtimestamp(now if now is not None else time.time(), UTC)
+    tomorrow = (current + timedelta(days=1)).date()
+    return datetime(tomorrow.year, tomorrow.month, tomorrow.day, tzinfo=UTC).timestamp()
+
+
+def _depends_on_today(question: str, plan: PlanResult, now: float) -> bool:
+    spelled = set(_ISO_DATE_RE.findall(question))
+    today = datetime.fromtimestamp(now, UTC).date().isoformat()
+    for value in (plan.start_date, plan.end_date):
+        if value and (value[:10] not in spelled or value[:10] >= today):
+            return True
+    return False
+
+
+class PlanCache:
+    """SQLite-backed map from normalized question to `PlanResult`.
+
+    Args:
+        path: Database file; parent directories are created. ``":memory:"`` is allowed.
+        version: Prompt version tag, usually from `prompt_version`; defaults to the
+            hash of the current planner prompt alone.
+    """
+
+    def __init__(self, path: str | Path, *, version: str | None = None) -> None:
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).expanduser().parent.mkdir(parents=True, exist_ok=True)
+            self.path = str(Path(self.path).expanduser())
+        self.version = version or prompt_version()
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(_SCHEMA)
+            # Drop plans produced by older planner prompts.
+            self._conn.execute("DELETE FROM plans WHERE prompt_version != ?", (self.version,))
+
+    def get(self, question: str) -> PlanResult | None:
+        key = normalize_question(question)
+        if not key:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT plan, expires_at FROM plans WHERE question = ? AND prompt_version = ?",
+                (key, self.version),
+            ).fetchone()
+            if row is None:
+                self.stats.misses += 1
+                return None
+            raw, expires_at = row
+            if expires_at is not None and expires_at <= time.time():
+                with self._conn:
+                    self._conn.execute(
+                        "DELETE FROM plans WHERE question = ? AND prompt_version = ?",
+                        (key, self.version),
+                    )
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+            self.stats.hits += 1
+        return PlanResult(**json.loads(raw))
+
+    def set(self, question: str, plan: PlanResult) -> None:
+        key = normalize_question(question)
+        if not key:
+            return
+        now = time.time()
+        expires_at = next_day_boundary(now) if _depends_on_today(question, plan, now) else None
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO plans VALUES (?, ?, ?, ?, ?)",
+                (key, self.version, json.dumps(asdict(plan)), now, expires_at),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM plans")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,86 @@
+"""Planning step: turn a user question into GDELT search parameters via the planner LLM.
+
+The planner call asks Gemini for schema-constrained JSON (``response_schema`` is
+`PlanResult`), so the reply is a bare object. Replies that still arrive fenced or
+wrapped in prose are recovered by `extract_json_object`; only unusable replies
+fall back to the raw question. Each outcome is counted in
+``world_news_plan_parse_total``.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import Any
+
+from .clients import GeminiClient
+from .json_extract import extract_json_object
+from .metrics import record_plan_parse, timed
+from .prompt_library import get_prompts
+
+
+@dataclass(frozen=True)
+class PlanResult:
+    query: str
+    start_date: str | None
+    end_date: str | None
+    languages: list[str] | None
+    max_records: int
+
+
+def build_plan_prompt(user_question: str) -> str:
+    prompts = get_prompts()
+    return prompts.plan_gdelt + "\n\nUSER QUESTION:\n" + user_question + "\n"
+
+
+def parse_plan(raw: str, user_question: str) -> PlanResult:
+    """Parse the planner's raw JSON output into a `PlanResult`, best-effort."""
+
+    data: Any = _decode(raw)
+
+    query = data.get("query") if isinstance(data, dict) else None
+    if not isinstance(query, str) or not query.strip():
+        # Fallback: use the user question best-effort
+        query = user_question.strip()
+
+    start_date = data.get("start_date") if isinstance(data, dict) else None
+    end_date = data.get("end_date") if isinstance(data, dict) else None
+    languages = data.get("languages") if isinstance(data, dict) else None
+    if not isinstance(languages, list):
+        languages = None
+    max_records = data.get("max_records") if isinstance(data, dict) else None
+    if not isinstance(max_records, int):
+        max_records = 20
+
+    return PlanResult(
+        query=query,
+        start_date=start_date or None,
+        end_date=end_date or None,
+        languages=languages or None,
+        max_records=max_records,
+    )
+
+
+def _decode(raw: str) -> dict[str, Any]:
+    try:
+        data = json.loads(raw)
+    except ValueError:
+        data = None
+    if isinstance(data, dict):
+        record_plan_parse("ok")
+        return data
+    data = extract_json_object(raw)
+    record_plan_parse("recovered" if data is not None else "failed")
+    return data or {}
+
+
+def plan_gdelt_search(planner_llm: GeminiClient, user_question: str) -> PlanResult:
+    with timed("plan_llm"):
+        raw = planner_llm.generate(build_plan_prompt(user_question), schema=PlanResult)
+        return parse_plan(raw, user_question)
+
+
+async def plan_gdelt_search_async(planner_llm: GeminiClient, user_question: str) -> PlanResult:
+    with timed("plan_llm"):
+        raw = await planner_llm.generate_async(build_plan_prompt(user_question), schema=PlanResult)
+        return parse_plan(raw, user_question)
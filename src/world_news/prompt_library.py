@@ -18,6 +18,7 @@ class PromptTemplates:
     """
 
     summarize: str
+    merge_summaries: str
     qa: str
     tool_guidance: str
     plan_gdelt: str
@@ -42,6 +43,19 @@ def get_prompts() -> PromptTemplates:
         """
     ).strip()
 
+    merge_summaries = dedent(
+        """
+        You are a concise news assistant.
+        The partial digests below each cover a different batch of articles.
+        Merge them into one digest of up to {{max_words}} words.
+        Combine overlapping facts, keep key numbers and attributions, and avoid speculation.
+
+        PARTIAL DIGESTS START
+        {{text}}
+        PARTIAL DIGESTS END
+        """
+    ).strip()
+
     qa = dedent(
         """
         You are a news analyst.
@@ -92,6 +106,7 @@ def get_prompts() -> PromptTemplates:
 
     return PromptTemplates(
         summarize=summarize,
+        merge_summaries=merge_summaries,
         qa=qa,
         tool_guidance=tool_guidance,
         plan_gdelt=plan_gdelt,
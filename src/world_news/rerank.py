@@ -0,0 +1,75 @@
+"""BM25 reranking of retrieved articles against the user's question.
+
+GDELT orders results by date, not by relevance to the question, so the pipeline
+fetches wide and keeps only the best-matching articles for the prompt. Scoring is
+Okapi BM25 over title + snippet (title terms counted twice), with term statistics
+computed once per retrieved batch. Pure Python; no model download.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import Counter
+from collections.abc import Sequence
+
+from .clients import Article
+from .text import content_terms
+
+K1 = 1.2
+B = 0.75
+TITLE_WEIGHT = 2
+
+
+def _terms(text: str) -> list[str]:
+    return [t.removesuffix("'s") for t in content_terms(text)]
+
+
+def article_terms(article: Article) -> list[str]:
+    """Index terms of an article: title terms repeated ``TITLE_WEIGHT`` times, then snippet."""
+
+    return _terms(article.title or "") * TITLE_WEIGHT + _terms(article.snippet or "")
+
+
+def bm25_scores(
+    query: Sequence[str],
+    documents: Sequence[Sequence[str]],
+    *,
+    k1: float = K1,
+    b: float = B,
+) -> list[float]:
+    """BM25 score of each tokenized document for the query terms."""
+
+    n = len(documents)
+    if not n or not query:
+        return [0.0] * n
+    counts = [Counter(doc) for doc in documents]
+    lengths = [len(doc) for doc in documents]
+    avgdl = (sum(lengths) / n) or 1.0
+    terms = set(query)
+    df = {t: sum(1 for c in counts if t in c) for t in terms}
+    idf = {t: math.log(1.0 + (n - df[t] + 0.5) / (df[t] + 0.5)) for t in terms if df[t]}
+    scores: list[float] = []
+    for c, length in zip(counts, lengths, strict=True):
+        norm = k1 * (1.0 - b + b * length / avgdl)
+        score = 0.0
+        for t, weight in idf.items():
+            tf = c.get(t, 0)
+            if tf:
+                score += weight * tf * (k1 + 1.0) / (tf + norm)
+        scores.append(score)
+    return scores
+
+
+def rerank(articles: Sequence[Article], question: str, *, top_k: int) -> list[Article]:
+    """Return the ``top_k`` articles most relevant to ``question``.
+
+    Ties (including all-zero scores when the question has no content terms) keep
+    the retrieval order.
+    """
+
+    query = _terms(question)
+    if not query:
+        return list(articles[:top_k])
+    scores = bm25_scores(query, [article_terms(a) for a in articles])
+    order = sorted(range(len(articles)), key=lambda i: (-scores[i], i))
+    return [articles[i] for i in order[:top_k]]
@@ -6,9 +6,78 @@ Exposes a high-level `NewsService` used by both the HTTP app and the MCP tools.
 from __future__ import annotations
 
 from collections.abc import Iterable, Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+from .article_store import LocalFirstRetriever, create_store
 from .clients import Article, GDELTClient, GeminiClient
+from .clients.gdelt import ArticleRetriever
+from .config import ModelConfig, PipelineConfig, ProjectConfig
+from .context import ContextPack, pack_context
+from .dedup import collapse_duplicates
+from .generation_cache import GenerationCache
+from .mapreduce import (
+    config_chunks,
+    select_summary_context,
+    summarize_chunks,
+    summarize_chunks_async,
+)
+from .plan_cache import PlanCache, prompt_version
+
+
+@dataclass
+class ArticleSearch:
+    """GDELT search through the local-first store, with dedup; needs no Gemini client.
+
+    Attributes:
+        gdelt_client: Client to query GDELT Doc API.
+        config: Project configuration the search was built from.
+        local_retriever: Optional local-first retriever over the ingested article store.
+    """
+
+    gdelt_client: GDELTClient
+    config: ProjectConfig = field(default_factory=ProjectConfig)
+    local_retriever: LocalFirstRetriever | None = None
+
+    @classmethod
+    def create_default(cls, config: ProjectConfig | None = None) -> ArticleSearch:
+        config = config or ProjectConfig()
+        pipeline = config.pipeline
+        store = create_store(pipeline)
+        gdelt_client = GDELTClient.create_default(config.gdelt, store=store)
+        return cls(
+            gdelt_client=gdelt_client,
+            config=config,
+            local_retriever=(
+                LocalFirstRetriever(
+                    store,
+                    gdelt_client,
+                    max_age_seconds=pipeline.local_store_max_age_seconds,
+                    min_results=pipeline.local_store_min_results,
+                )
+                if store is not None
+                else None
+            ),
+        )
+
+    def search(
+        self,
+        query: str,
+        *,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        max_records: int = 20,
+        languages: Sequence[str] | None = None,
+    ) -> list[Article]:
+        """Search news articles, from the local store when fresh enough, else on GDELT."""
+
+        articles = (self.local_retriever or self.gdelt_client).search_articles(
+            query=query,
+            start_date=start_date,
+            end_date=end_date,
+            max_records=max_records,
+            languages=languages,
+        )
+        return _collapse(articles, self.config.pipeline)
 
 
 @dataclass
@@ -17,29 +86,132 @@ class NewsService:
 
     Attributes:
         gdelt_client: Client to query GDELT Doc API.
-        gemini_client: Client to call Gemini model.
+        gemini_client: Gemini client of the summarizer role (and of any role without its own).
+        planner_client: Optional Gemini client of the query planner.
+        qa_client: Optional Gemini client for grounded answers.
+        config: Project configuration the service was built from.
+        plan_cache: Optional persistent cache of planner results.
+        local_retriever: Optional local-first retriever over the ingested article store.
     """
 
     gdelt_client: GDELTClient
     gemini_client: GeminiClient
+    planner_client: GeminiClient | None = None
+    qa_client: GeminiClient | None = None
+    config: ProjectConfig = field(default_factory=ProjectConfig)
+    plan_cache: PlanCache | None = None
+    local_retriever: LocalFirstRetriever | None = None
 
     @classmethod
-    def create_default(cls, gemini_api_key: str, gemini_model: str) -> NewsService:
+    def create_default(
+        cls,
+        gemini_api_key: str,
+        gemini_model: str,
+        config: ProjectConfig | None = None,
+        *,
+        search: ArticleSearch | None = None,
+    ) -> NewsService:
         """Create a default service with default clients.
 
         Args:
             gemini_api_key: API key for Gemini.
-            gemini_model: Model name.
+            gemini_model: Default model name of roles that do not set their own.
+            config: Optional project configuration (YAML); defaults are used if omitted.
+            search: Existing GDELT side to reuse (its client, rate limiter and store).
 
         Returns:
             NewsService: Configured service instance.
         """
 
+        config = config or ProjectConfig()
+        gemini = config.gemini
+        pipeline = config.pipeline
+        search = search or ArticleSearch.create_default(config)
+        response_cache = (
+            GenerationCache(
+                max_entries=gemini.response_cache_max_entries,
+                ttl=gemini.response_cache_ttl_seconds,
+                path=gemini.response_cache_path,
+            )
+            if gemini.response_cache_enabled
+            else None
+        )
+        # Roles with identical model settings share one client (and its coalescer).
+        clients: dict[tuple[str, tuple[tuple[str, object], ...]], GeminiClient] = {}
+
+        def client_for(role: ModelConfig) -> GeminiClient:
+            model_name = role.model or gemini_model
+            generation_config = role.generation_config()
+            key = (model_name, tuple(sorted(generation_config.items())))
+            if key not in clients:
+                clients[key] = GeminiClient.create(
+                    api_key=gemini_api_key,
+                    model_name=model_name,
+                    coalesce=gemini.coalesce_requests,
+                    response_cache=response_cache,
+                    generation_config=generation_config,
+                )
+            return clients[key]
+
+        planner = client_for(gemini.planner)
+        plan_cache = None
+        if pipeline.plan_cache_enabled:
+            version = prompt_version(
+                model_name=planner.model_name, generation_config=planner.generation_config
+            )
+            plan_cache = PlanCache(pipeline.plan_cache_path, version=version)
         return cls(
-            gdelt_client=GDELTClient.create_default(),
-            gemini_client=GeminiClient.create(api_key=gemini_api_key, model_name=gemini_model),
+            gdelt_client=search.gdelt_client,
+            gemini_client=client_for(gemini.summarizer),
+            planner_client=planner,
+            qa_client=client_for(gemini.qa),
+            config=config,
+            plan_cache=plan_cache,
+            local_retriever=search.local_retriever,
         )
 
+    @property
+    def retriever(self) -> ArticleRetriever:
+        """Local-first retriever when the article store is enabled, else the GDELT client."""
+
+        return self.local_retriever or self.gdelt_client
+
+    @property
+    def planner_llm(self) -> GeminiClient:
+        """Gemini client of the query planner."""
+
+        return self.planner_client or self.gemini_client
+
+    @property
+    def qa_llm(self) -> GeminiClient:
+        """Gemini client for grounded answers."""
+
+        return self.qa_client or self.gemini_client
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """Return counters of the service's caches and coalescers, keyed by component."""
+
+        result: dict[str, dict[str, float]] = {}
+        if self.gdelt_client.cache is not None:
+            result["gdelt_cache"] = self.gdelt_client.cache.stats.as_dict()
+        if self.gdelt_client.singleflight is not None:
+            result["gdelt_singleflight"] = self.gdelt_client.singleflight.stats.as_dict()
+        if self.gdelt_client.limiter is not None:
+            result["gdelt_limiter"] = self.gdelt_client.limiter.stats_dict()
+        if self.gemini_client.singleflight is not None:
+            result["gemini_singleflight"] = self.gemini_client.singleflight.stats.as_dict()
+        for role, client in (("planner", self.planner_llm), ("qa", self.qa_llm)):
+            if client is not self.gemini_client and client.singleflight is not None:
+                result[f"gemini_{role}_singleflight"] = client.singleflight.stats.as_dict()
+        if self.gemini_client.response_cache is not None:
+            result["gemini_response_cache"] = self.gemini_client.response_cache.stats_dict()
+        if self.plan_cache is not None:
+            result["plan_cache"] = self.plan_cache.stats.as_dict()
+        if self.local_retriever is not None:
+            result["local_first"] = self.local_retriever.stats.as_dict()
+            result["local_store"] = self.local_retriever.store.stats_dict()
+        return result
+
     def search(
         self,
         query: str,
@@ -49,7 +221,7 @@ class NewsService:
         max_records: int = 20,
         languages: Sequence[str] | None = None,
     ) -> list[Article]:
-        """Search news articles on GDELT.
+        """Search news articles, from the local store when fresh enough, else on GDELT.
 
         Args:
             query: User query or keywords.
@@ -59,52 +231,138 @@ class NewsService:
             languages: Optional language filters.
 
         Returns:
-            list[Article]: Articles.
+            list[Article]: Articles, with syndicated near-duplicates collapsed.
         """
 
-        return self.gdelt_client.search_articles(
+        articles = self.retriever.search_articles(
+            query=query,
+            start_date=start_date,
+            end_date=end_date,
+            max_records=max_records,
+            languages=languages,
+        )
+        return _collapse(articles, self.config.pipeline)
+
+    async def search_async(
+        self,
+        query: str,
+        *,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        max_records: int = 20,
+        languages: Sequence[str] | None = None,
+    ) -> list[Article]:
+        """Async variant of `search`."""
+
+        articles = await self.retriever.search_articles_async(
             query=query,
             start_date=start_date,
             end_date=end_date,
             max_records=max_records,
             languages=languages,
         )
+        return _collapse(articles, self.config.pipeline)
 
-    def summarize_articles(self, articles: Iterable[Article], *, max_words: int = 160) -> str:
+    def build_context(
+        self, articles: Iterable[Article], *, question: str | None = None
+    ) -> ContextPack:
+        """Pack article passages into the configured token budget.
+
+        Args:
+            articles: Candidate articles.
+            question: Optional question used to rank passages by relevance.
+
+        Returns:
+            ContextPack: Kept passages plus kept/dropped article and token counts.
+        """
+
+        return pack_context(
+            articles,
+            question=question,
+            token_budget=self.config.pipeline.context_token_budget,
+        )
+
+    def summarize_articles(
+        self, articles: Iterable[Article], *, max_words: int = 160, bypass_cache: bool = False
+    ) -> str:
         """Summarize multiple articles into a single digest.
 
+        Inputs larger than the context budget are summarized in parallel chunks
+        whose partial digests are then merged (see `world_news.mapreduce`).
+
         Args:
             articles: Article records.
             max_words: Soft word cap.
+            bypass_cache: Regenerate instead of reusing a cached summary of the same input.
 
         Returns:
             str: Digest summary.
         """
 
-        passages: list[str] = []
-        for a in articles:
-            title = a.get("title") or ""
-            url = a.get("url") or ""
-            snippet = a.get("snippet") or ""
-            passages.append(f"Title: {title}\nURL: {url}\nSnippet: {snippet}")
-        combined = "\n\n".join(passages)
-        return self.gemini_client.summarize(combined, max_words=max_words)
+        config = self.config.pipeline
+        context, use_map_reduce = select_summary_context(articles, question=None, config=config)
+        if use_map_reduce:
+            return summarize_chunks(
+                self.gemini_client,
+                config_chunks(context.articles, config),
+                max_words=max_words,
+                concurrency=config.map_reduce_concurrency,
+                bypass_cache=bypass_cache,
+            )
+        return self.gemini_client.summarize(
+            context.text, max_words=max_words, bypass_cache=bypass_cache
+        )
 
-    def answer_question(self, question: str, *, articles: Iterable[Article]) -> str:
+    async def summarize_articles_async(
+        self, articles: Iterable[Article], *, max_words: int = 160, bypass_cache: bool = False
+    ) -> str:
+        """Async variant of `summarize_articles`."""
+
+        config = self.config.pipeline
+        context, use_map_reduce = select_summary_context(articles, question=None, config=config)
+        if use_map_reduce:
+            return await summarize_chunks_async(
+                self.gemini_client,
+                config_chunks(context.articles, config),
+                max_words=max_words,
+                concurrency=config.map_reduce_concurrency,
+                bypass_cache=bypass_cache,
+            )
+        return await self.gemini_client.summarize_async(
+            context.text, max_words=max_words, bypass_cache=bypass_cache
+        )
+
+    def answer_question(
+        self, question: str, *, articles: Iterable[Article], bypass_cache: bool = False
+    ) -> str:
         """Answer a question grounded in provided articles.
 
         Args:
             question: User question.
             articles: Article records used as context.
+            bypass_cache: Regenerate instead of reusing a cached answer to the same input.
 
         Returns:
             str: Grounded answer.
         """
 
-        passages: list[str] = []
-        for a in articles:
-            title = a.get("title") or ""
-            url = a.get("url") or ""
-            snippet = a.get("snippet") or ""
-            passages.append(f"Title: {title}\nURL: {url}\nSnippet: {snippet}")
-        return self.gemini_client.answer_based_on_context(question, passages)
+        context = self.build_context(articles, question=question)
+        return self.qa_llm.answer_based_on_context(
+            question, context.passages, bypass_cache=bypass_cache
+        )
+
+    async def answer_question_async(
+        self, question: str, *, articles: Iterable[Article], bypass_cache: bool = False
+    ) -> str:
+        """Async variant of `answer_question`."""
+
+        context = self.build_context(articles, question=question)
+        return await self.qa_llm.answer_based_on_context_async(
+            question, context.passages, bypass_cache=bypass_cache
+        )
+
+
+def _collapse(articles: list[Article], config: PipelineConfig) -> list[Article]:
+    if not config.dedup:
+        return articles
+    return collapse_duplicates(articles, max_distance=config.dedup_max_distance)
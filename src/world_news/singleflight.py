@@ -0,0 +1,101 @@
+"""Single-flight coalescing of concurrent identical calls.
+
+When several callers ask for the same key while a call for that key is already
+in flight, they wait for and share its result instead of issuing their own.
+Nothing is cached once the call completes; pair it with a cache for that.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import asdict, dataclass
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class SingleFlightStats:
+    """Counters describing how many calls were collapsed."""
+
+    calls: int = 0
+    executed: int = 0
+    collapsed: int = 0
+
+    def as_dict(self) -> dict[str, float]:
+        return {k: float(v) for k, v in asdict(self).items()}
+
+
+class _SyncCall:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Coalesce concurrent calls sharing a key, for both threads and asyncio."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._sync_calls: dict[Hashable, _SyncCall] = {}
+        self._async_calls: dict[Hashable, asyncio.Task[Any]] = {}
+        self.stats = SingleFlightStats()
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Run ``fn`` unless a call with ``key`` is in flight; then share its result."""
+
+        with self._lock:
+            self.stats.calls += 1
+            call = self._sync_calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._sync_calls[key] = _SyncCall()
+                self.stats.executed += 1
+            else:
+                self.stats.collapsed += 1
+        assert call is not None
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._sync_calls.pop(key, None)
+            call.done.set()
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Async variant of `do`; the shared call survives cancellation of any one waiter."""
+
+        task = self._async_calls.get(key)
+        leader = task is None or task.get_loop() is not asyncio.get_running_loop()
+        if leader:
+            task = asyncio.ensure_future(fn())
+            self._async_calls[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+        with self._lock:
+            self.stats.calls += 1
+            if leader:
+                self.stats.executed += 1
+            else:
+                self.stats.collapsed += 1
+        assert task is not None
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+        if self._async_calls.get(key) is task:
+            del self._async_calls[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved when every waiter went away.
+            task.exception()
@@ -0,0 +1,61 @@
+"""Small text helpers shared by the planner, caches and retrieval stages."""
+
+from __future__ import annotations
+
+import re
+
+STOPWORDS = frozenset(
+    """
+    a about above after again against all am an and any are articles as at be because
+    been before being below between both breaking but by can could coverage current
+    developments did do does doing down during each few for from further get give had
+    happened happening has have having he headlines her here hers him his how i if in
+    into is it it's its itself just latest me more most my new news no nor not now of
+    off on once only or other our ours out over own please recent same she should show
+    so some stories story such tell than that that's the their theirs them then there
+    there's these they this those through to today too under until up update updates
+    very was we were what what's whats when where which while who who's whom why will
+    with would you your yours
+    """.split()
+)
+
+_TOKEN_RE = re.compile(r"[^\W_]+(?:['’][^\W_]+)*", re.UNICODE)
+_QUOTED_RE = re.compile(r'"([^"]+)"')
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into casefolded word tokens."""
+
+    return [t.casefold().replace("’", "'") for t in _TOKEN_RE.findall(text)]
+
+
+def content_terms(text: str) -> list[str]:
+    """Tokens of ``text`` with stopwords and single characters removed, in order."""
+
+    return [t for t in tokenize(text) if t not in STOPWORDS and len(t) > 1]
+
+
+def quoted_phrases(text: str) -> list[str]:
+    """Return the double-quoted phrases in ``text``."""
+
+    return [p.strip() for p in _QUOTED_RE.findall(text) if p.strip()]
+
+
+def extract_keywords(text: str, *, max_terms: int = 6) -> str:
+    """Cheap keyword query for ``text``: quoted phrases first, then content terms.
+
+    The result is a plain GDELT query (space-separated terms are ANDed).
+    """
+
+    phrases = quoted_phrases(text)
+    remainder = _QUOTED_RE.sub(" ", text)
+    parts = [f'"{p}"' for p in phrases]
+    seen: set[str] = set()
+    for term in content_terms(remainder):
+        term = term.removesuffix("'s")
+        # GDELT rejects very short keywords.
+        if term in seen or len(term) < 3:
+            continue
+        seen.add(term)
+        parts.append(term)
+    return " ".join(parts[:max_terms])
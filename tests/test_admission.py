@@ -0,0 +1,131 @@
+import asyncio
+
+import pytest
+
+from world_news.admission import AdmissionController, OverloadedError, degraded_config
+from world_news.config import PipelineConfig
+
+
+def test_waiters_are_admitted_in_order_as_slots_free() -> None:
+    async def scenario() -> list[str]:
+        controller = AdmissionController(max_concurrent=1, max_queue=2, queue_timeout=1.0)
+        first = await controller.acquire()
+        order: list[str] = []
+
+        async def wait(name: str) -> None:
+            async with controller.admit():
+                order.append(name)
+
+        waiters = [asyncio.create_task(wait("a")), asyncio.create_task(wait("b"))]
+        await asyncio.sleep(0)
+        assert controller.queue_depth == 2
+        controller.release(first)
+        await asyncio.gather(*waiters)
+        assert (controller.running, controller.queue_depth) == (0, 0)
+        return order
+
+    assert asyncio.run(scenario()) == ["a", "b"]
+
+
+def test_requests_are_shed_when_the_queue_is_full() -> None:
+    async def scenario() -> AdmissionController:
+        controller = AdmissionController(max_concurrent=1, max_queue=1, queue_timeout=1.0)
+        held = await controller.acquire()
+        queued = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0)
+        with pytest.raises(OverloadedError) as shed:
+            await controller.acquire()
+        assert 1 <= shed.value.retry_after <= 60
+        controller.release(held)
+        controller.release(await queued)
+        return controller
+
+    controller = asyncio.run(scenario())
+    assert (controller.stats.admitted, controller.stats.shed_queue_full) == (2, 1)
+    assert controller.running == 0
+
+
+def test_a_timed_out_waiter_is_shed_and_leaves_the_queue() -> None:
+    async def scenario() -> AdmissionController:
+        controller = AdmissionController(max_concurrent=1, max_queue=4, queue_timeout=1.0)
+        held = await controller.acquire()
+        with pytest.raises(OverloadedError, match="timed out"):
+            await controller.acquire(timeout=0.01)
+        assert controller.queue_depth == 0
+        controller.release(held)
+        return controller
+
+    controller = asyncio.run(scenario())
+    assert (controller.stats.shed_timeout, controller.running) == (1, 0)
+
+
+def test_requests_admitted_under_pressure_are_degraded() -> None:
+    async def scenario() -> list[bool]:
+        controller = AdmissionController(
+            max_concurrent=1, max_queue=4, queue_timeout=1.0, degrade_queue_depth=1
+        )
+        held = await controller.acquire()
+        calm = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0)
+        busy = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0)
+        controller.release(held)
+        first = await calm
+        controller.release(first)
+        second = await busy
+        controller.release(second)
+        return [held.degraded, first.degraded, second.degraded]
+
+    assert asyncio.run(scenario()) == [False, False, True]
+
+
+def test_degraded_config_skips_the_planner_llm_and_caps_records() -> None:
+    config = degraded_config(PipelineConfig(degraded_max_records=25, rerank_top_k=40))
+    assert (config.fast_planner, config.fast_planner_threshold) == (True, 0.0)
+    assert (config.max_records_cap, config.rerank_top_k) == (25, 25)
+    assert not config.speculative_retrieval
+
+
+def test_multi_slot_requests_wait_for_enough_free_slots_in_order() -> None:
+    async def scenario() -> list[str]:
+        controller = AdmissionController(max_concurrent=4, max_queue=4, queue_timeout=1.0)
+        single = await controller.acquire()
+        order: list[str] = []
+
+        async def wait(name: str, slots: int) -> None:
+            async with controller.admit(slots=slots):
+                order.append(name)
+                await asyncio.sleep(0)
+
+        batch = asyncio.create_task(wait("batch", 4))
+        await asyncio.sleep(0)
+        # The batch needs every slot; a later single request must not overtake it.
+        late = asyncio.create_task(wait("late", 1))
+        await asyncio.sleep(0)
+        assert (controller.running, controller.queue_depth) == (1, 2)
+        controller.release(single)
+        await asyncio.gather(batch, late)
+        assert (controller.running, controller.queue_depth) == (0, 0)
+        return order
+
+    assert asyncio.run(scenario()) == ["batch", "late"]
+
+
+def test_slots_are_capped_and_returned_when_a_waiter_times_out() -> None:
+    async def scenario() -> AdmissionController:
+        controller = AdmissionController(max_concurrent=2, max_queue=4, queue_timeout=1.0)
+        held = await controller.acquire()
+        with pytest.raises(OverloadedError):
+            await controller.acquire(0.01, slots=10)
+        # With the oversized request gone, a single slot is granted at once.
+        other = await controller.acquire(0.01)
+        assert controller.running == 2
+        controller.release(held)
+        controller.release(other)
+        big = await controller.acquire(slots=10)
+        assert (big.slots, controller.running) == (2, 2)
+        controller.release(big)
+        return controller
+
+    controller = asyncio.run(scenario())
+    assert controller.running == 0
@@ -0,0 +1,77 @@
+import time
+from collections.abc import Iterable
+
+from world_news.article_store import LocalArticleStore, LocalFirstRetriever
+from world_news.clients import Article, SearchRequest
+
+
+class FakeRemote:
+    """Stands in for `GDELTClient`: returns 12 fresh articles and ingests them."""
+
+    def __init__(self, store: LocalArticleStore) -> None:
+        self.store = store
+        self.calls: list[str] = []
+
+    def search_articles(
+        self,
+        query: str,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        max_records: int = 20,
+        sort_by: str = "date",
+        languages: Iterable[str] | None = None,
+    ) -> list[Article]:
+        self.calls.append(query)
+        seen = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
+        articles = [
+            Article(title=f"{query} report {i}", url=f"https://x.example/{i}", seendate=seen)
+            for i in range(12)
+        ]
+        request = SearchRequest(query, start_date, end_date, max_records, sort_by, None)
+        self.store.add(articles, request=request)
+        return articles
+
+
+def _retriever(max_age: float = 60.0) -> tuple[LocalFirstRetriever, FakeRemote]:
+    store = LocalArticleStore(":memory:", batch_size=200)
+    remote = FakeRemote(store)
+    return LocalFirstRetriever(store, remote, max_age_seconds=max_age, min_results=10), remote
+
+
+def test_only_searches_fetched_from_gdelt_are_served_locally() -> None:
+    retriever, remote = _retriever()
+    retriever.search_articles("flood")
+    # Same search (cap, case and spacing aside): answered from the still-buffered results.
+    retriever.search_articles("Flood ", max_records=50)
+    # The store has matching-looking data, but GDELT was never asked about "report".
+    retriever.search_articles("report")
+    assert remote.calls == ["flood", "report"]
+    assert (retriever.stats.hits, retriever.stats.misses) == (1, 2)
+
+
+def test_coverage_is_recorded_only_once_written() -> None:
+    store = LocalArticleStore(":memory:", batch_size=200)
+    article = Article(title="Storm", url="https://x.example/storm")
+    store.add([article], request=SearchRequest("storm"))
+    assert store.stats.batches == 0
+    assert store.coverage("storm", None) != []
+    assert store.stats.batches == 1
+
+
+def test_stale_coverage_goes_back_to_gdelt() -> None:
+    retriever, remote = _retriever(max_age=0.0)
+    retriever.search_articles("flood")
+    time.sleep(0.01)
+    retriever.search_articles("flood")
+    assert remote.calls == ["flood", "flood"]
+
+
+def test_add_nowait_writes_full_batches_off_the_calling_thread() -> None:
+    store = LocalArticleStore(":memory:", batch_size=4)
+    articles = [Article(title=f"Quake {i}", url=f"https://x.example/quake/{i}") for i in range(5)]
+    store.add_nowait(articles, request=SearchRequest("quake"))
+    assert store._writer is not None
+    store._writer.shutdown(wait=True)
+    assert store.stats.batches == 1
+    assert store.coverage("quake", None) != []
+    assert store.count() == 5
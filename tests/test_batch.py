@@ -0,0 +1,61 @@
+import asyncio
+from datetime import date
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from world_news import batch
+from world_news.clients import Article
+from world_news.config import PipelineConfig
+from world_news.planner import PlanResult
+
+
+class FakeRetriever:
+    async def search_articles_async(self, **kwargs: Any) -> list[Article]:
+        return [Article(title="Flood relief arrives", url="https://x.example/1")]
+
+
+def test_a_refine_failure_is_reported_per_question(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def plan(question: str, *args: Any, **kwargs: Any) -> PlanResult:
+        return PlanResult(question, None, None, None, 10)
+
+    def refine(articles: list[Article], question: str, *args: Any) -> list[Article]:
+        if question == "bad":
+            raise ValueError("boom")
+        return articles
+
+    async def answer(question: str, *, articles: list[Article]) -> str:
+        return f"{question}: {len(articles)}"
+
+    monkeypatch.setattr(batch, "plan_question_async", plan)
+    monkeypatch.setattr(batch, "refine_articles", refine)
+    service = SimpleNamespace(
+        config=SimpleNamespace(pipeline=PipelineConfig()),
+        planner_llm=None,
+        plan_cache=None,
+        retriever=FakeRetriever(),
+        answer_question_async=answer,
+    )
+    items, _ = asyncio.run(batch.answer_batch_async(service, ["good", "bad"]))  # type: ignore[arg-type]
+    assert (items[0].answer, items[0].error) == ("good: 1", None)
+    assert (items[1].answer, items[1].error) == (None, "refine failed: boom")
+
+
+def test_only_windows_ending_on_the_same_day_share_a_fetch() -> None:
+    today = date(2026, 10, 17)
+    plans = [
+        PlanResult("flood relief", "2026-08-01", "2026-08-05", None, 20),
+        PlanResult("relief flood", "2026-08-01", None, None, 10),
+        PlanResult("flood relief", None, None, None, 30),
+        PlanResult("flood relief", "2026-08-03", "2026-08-05", None, 40),
+    ]
+    fetches = batch.merge_plans(plans, today=today)
+    assert [fetch.members for fetch in fetches] == [[0, 3], [1, 2]]
+    august, recent = (fetch.plan for fetch in fetches)
+    assert (august.start_date, august.end_date, august.max_records) == (
+        "2026-08-01",
+        "2026-08-05",
+        40,
+    )
+    assert (recent.start_date, recent.end_date, recent.max_records) == (None, None, 30)
@@ -0,0 +1,57 @@
+import zipfile
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from world_news.article_store import LocalArticleStore
+from world_news.bulk_ingest import EXPORT_DATEADDED, EXPORT_SOURCEURL, ingest_files
+from world_news.clients import Article
+
+
+def _export(tmp_path: Path, rows: list[tuple[datetime, str]]) -> Path:
+    lines = []
+    for seen, url in rows:
+        fields = [""] * (EXPORT_SOURCEURL + 1)
+        fields[EXPORT_DATEADDED] = seen.strftime("%Y%m%d%H%M%S")
+        fields[EXPORT_SOURCEURL] = url
+        lines.append("\t".join(fields))
+    path = tmp_path / "20260101000000.export.CSV.zip"
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("20260101000000.export.CSV", "\n".join(lines) + "\n")
+    return path
+
+
+def test_slug_titles_are_stored_as_marked_snippets(tmp_path: Path) -> None:
+    now = datetime.now(UTC)
+    path = _export(tmp_path, [(now, "https://news.example/world/volcano-erupts-near-town")])
+    store = LocalArticleStore(":memory:")
+    stats = ingest_files([path], store)
+    assert stats.records == 1
+    [article] = store.search_articles("volcano")
+    assert article.title == ""
+    assert article.snippet == "URL keywords: volcano erupts near town"
+
+
+def test_records_outside_retention_are_skipped(tmp_path: Path) -> None:
+    now = datetime.now(UTC)
+    path = _export(
+        tmp_path,
+        [
+            (now, "https://news.example/world/volcano-erupts-near-town"),
+            (now - timedelta(days=30), "https://news.example/world/old-volcano-story"),
+        ],
+    )
+    store = LocalArticleStore(":memory:", retention_days=7)
+    stats = ingest_files([path], store)
+    assert (stats.records, stats.skipped_old) == (1, 1)
+    assert store.count() == 1
+
+
+def test_bulk_records_do_not_overwrite_stored_articles(tmp_path: Path) -> None:
+    url = "https://news.example/world/volcano-erupts-near-town"
+    store = LocalArticleStore(":memory:")
+    store.add([Article(title="Volcano erupts near town", url=url, snippet="Lava flows")])
+    store.flush()
+    stats = ingest_files([_export(tmp_path, [(datetime.now(UTC), url)])], store)
+    assert (stats.records, stats.skipped_existing) == (0, 1)
+    [article] = store.search_articles("volcano")
+    assert (article.title, article.snippet) == ("Volcano erupts near town", "Lava flows")
@@ -0,0 +1,58 @@
+from world_news.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_entries_expire_after_their_ttl() -> None:
+    clock = FakeClock()
+    cache: TTLCache[str] = TTLCache(ttl=10, max_entries=8, clock=clock)
+    cache.set("default", "a")
+    cache.set("short", "b", ttl=2)
+
+    clock.now = 1.9
+    assert cache.get("short") == "b"
+    clock.now = 2.0
+    assert cache.get("short") is None
+    assert cache.get("default") == "a"
+    clock.now = 10.0
+    assert cache.get("default") is None
+
+    assert len(cache) == 0
+    assert cache.stats.expirations == 2
+    assert cache.stats.hits == 2
+    assert cache.stats.misses == 2
+
+
+def test_least_recently_used_entry_is_evicted_by_count() -> None:
+    cache: TTLCache[int] = TTLCache(ttl=60, max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now the least recently used
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats.evictions == 1
+
+
+def test_byte_budget_evicts_oldest_and_skips_oversized_values() -> None:
+    cache: TTLCache[str] = TTLCache(ttl=60, max_entries=10, max_bytes=10, sizeof=len)
+    cache.set("a", "xxxx")
+    cache.set("b", "yyyy")
+    cache.set("c", "zzzz")
+
+    assert cache.get("a") is None
+    assert cache.size_bytes == 8
+    cache.set("huge", "w" * 11)
+    assert cache.get("huge") is None
+    assert cache.size_bytes == 8
+
+    cache.set("b", "yy")  # replacing an entry releases its old size
+    assert cache.size_bytes == 6
@@ -0,0 +1,21 @@
+from world_news.config import ConfigManager, WatchedTopic
+
+
+def test_topics_accept_strings_mappings_and_scalar_languages() -> None:
+    config = ConfigManager()._from_dict(
+        {
+            "ingest": {
+                "topics": [
+                    "ukraine grain",
+                    {"query": "eu ai act", "languages": "english", "max_records": 50},
+                    {"query": "elections", "languages": ["eng", "fra"]},
+                    {"languages": ["eng"]},
+                ]
+            }
+        }
+    )
+    assert config.ingest.topics == (
+        WatchedTopic(query="ukraine grain"),
+        WatchedTopic(query="eu ai act", max_records=50, languages=("english",)),
+        WatchedTopic(query="elections", languages=("eng", "fra")),
+    )
@@ -0,0 +1,62 @@
+from world_news.clients import Article
+from world_news.context import PASSAGE_SEPARATOR, estimate_tokens, format_passage, pack_context
+
+PLACES = ["Lisbon", "Oslo", "Quito", "Hanoi", "Dakar", "Lima", "Perth", "Cairo", "Bern", "Kyiv"]
+
+
+def _article(i: int) -> Article:
+    return Article(
+        title=f"Floods in {PLACES[i]}",
+        url=f"https://x.example/{i}",
+        snippet="Rescue teams reach the area.",
+    )
+
+
+def test_pack_respects_the_token_budget_and_counts_drops() -> None:
+    articles = [_article(i) for i in range(10)]
+    tokens = [estimate_tokens(format_passage(article)) for article in articles]
+    budget = sum(tokens[:3]) + 2 * estimate_tokens(PASSAGE_SEPARATOR)
+
+    pack = pack_context(articles, token_budget=budget)
+
+    assert pack.kept_articles == 3
+    assert pack.articles == articles[:3]
+    assert pack.kept_tokens <= budget
+    assert estimate_tokens(pack.text) <= budget
+    assert pack.dropped_articles == 7
+    assert pack.dropped_tokens == sum(tokens[3:])
+    assert pack.report() == {
+        "kept_articles": 3,
+        "dropped_articles": 7,
+        "kept_tokens": pack.kept_tokens,
+        "dropped_tokens": sum(tokens[3:]),
+    }
+
+
+def test_pack_drops_empty_and_duplicate_passages() -> None:
+    articles = [
+        _article(1),
+        Article(title="", url="https://x.example/empty", snippet="  "),
+        Article(title="Other", url="https://x.example/1", snippet="Same URL."),
+        Article(title="Floods in Oslo", url="https://y.example/9", snippet="Same title."),
+        _article(2),
+    ]
+
+    pack = pack_context(articles)
+
+    assert pack.articles == [articles[0], articles[4]]
+    assert pack.dropped_articles == 3
+    assert pack.dropped_tokens == sum(estimate_tokens(format_passage(a)) for a in articles[2:4])
+
+
+def test_pack_puts_relevant_passages_first_within_the_budget() -> None:
+    articles = [
+        Article(title="Markets close higher", url="https://x.example/1", snippet="Stocks."),
+        Article(title="Earthquake hits coast", url="https://x.example/2", snippet="Quake."),
+    ]
+    budget = estimate_tokens(format_passage(articles[1]))
+
+    pack = pack_context(articles, question="earthquake coast", token_budget=budget)
+
+    assert pack.articles == [articles[1]]
+    assert pack.dropped_articles == 1
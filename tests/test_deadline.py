@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+
+from world_news.clients import Article
+from world_news.config import PipelineConfig
+from world_news.deadline import (
+    MIN_CONTEXT_TOKENS,
+    SUMMARY_MAX_WORDS,
+    Deadline,
+    bounded,
+    fit_summary,
+    headline_digest,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_deadline_shares_the_time_left() -> None:
+    clock = FakeClock()
+    deadline = Deadline.after(4.0, clock)
+    clock.now += 2.0
+    assert deadline.remaining() == 2.0
+    assert deadline.share(0.25) == 0.5
+    clock.now += 5.0
+    assert deadline.remaining() == 0.0
+
+
+def test_summary_keeps_full_settings_with_enough_time() -> None:
+    config = PipelineConfig(map_reduce=True, deadline_summary_full_seconds=8.0)
+    degradations: list[str] = []
+
+    assert fit_summary(config, None, degradations) == (config, SUMMARY_MAX_WORDS)
+    assert fit_summary(config, Deadline.after(10.0, FakeClock()), degradations) == (
+        config,
+        SUMMARY_MAX_WORDS,
+    )
+    assert degradations == []
+
+
+def test_summary_shrinks_under_a_tight_budget() -> None:
+    config = PipelineConfig(
+        map_reduce=True,
+        context_token_budget=8000,
+        deadline_summary_full_seconds=8.0,
+        deadline_min_max_words=60,
+    )
+    degradations: list[str] = []
+
+    fitted, max_words = fit_summary(config, Deadline.after(4.0, FakeClock()), degradations)
+
+    assert degradations == ["context_shrunk"]
+    assert not fitted.map_reduce
+    assert fitted.context_token_budget == 4000
+    assert max_words == SUMMARY_MAX_WORDS // 2
+
+
+def test_summary_never_shrinks_below_the_floors() -> None:
+    config = PipelineConfig(context_token_budget=2000, deadline_min_max_words=60)
+    degradations: list[str] = []
+
+    fitted, max_words = fit_summary(config, Deadline.after(0.0, FakeClock()), degradations)
+
+    assert fitted.context_token_budget == MIN_CONTEXT_TOKENS
+    assert max_words == 60
+    assert degradations == ["context_shrunk"]
+
+
+def test_bounded_times_out_and_cancels_the_stage() -> None:
+    cancelled = False
+
+    async def slow() -> str:
+        nonlocal cancelled
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        return "late"
+
+    async def fast() -> str:
+        return "done"
+
+    async def run() -> None:
+        deadline = Deadline.after(0.2)
+        assert await bounded(fast(), deadline) == "done"
+        assert await bounded(fast(), None) == "done"
+        with pytest.raises(TimeoutError):
+            await bounded(slow(), deadline, share=0.1)
+
+    asyncio.run(run())
+    assert cancelled
+
+
+def test_headline_digest_lists_top_titles() -> None:
+    articles = [
+        Article(title="Floods hit coast", url="https://a.example/1", domain="a.example"),
+        Article(title="", url="https://b.example/2"),
+        Article(title="Relief arrives", url="https://c.example/3"),
+    ]
+
+    digest = headline_digest(articles)
+
+    assert digest.endswith("- Floods hit coast (a.example)\n- Relief arrives")
+    assert headline_digest([]) == "No summary could be produced within the time budget."
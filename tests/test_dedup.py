@@ -0,0 +1,70 @@
+from world_news.clients import Article
+from world_news.dedup import canonical_url, collapse_duplicates
+
+WIRE = "Heavy rains flood the river valley, forcing thousands of residents to evacuate overnight."
+
+
+def test_near_duplicates_collapse_into_alternate_sources() -> None:
+    articles = [
+        Article(title="Floods force evacuations", url="https://a.example/story", snippet=WIRE),
+        Article(
+            title="Floods force evacuations - B News",
+            url="https://b.example/wire/123",
+            snippet=WIRE,
+        ),
+        Article(
+            title="Floods force mass evacuations",
+            url="https://c.example/x",
+            snippet=WIRE,
+        ),
+        Article(title="Other", url="https://www.a.example/story/?utm_source=feed", snippet="Copy."),
+    ]
+
+    collapsed = collapse_duplicates(articles)
+
+    assert len(collapsed) == 1
+    assert collapsed[0].url == "https://a.example/story"
+    assert collapsed[0].alternate_sources == [
+        "https://b.example/wire/123",
+        "https://c.example/x",
+        "https://www.a.example/story/?utm_source=feed",
+    ]
+
+
+def test_distinct_stories_are_kept_in_order() -> None:
+    articles = [
+        Article(title="Floods force evacuations", url="https://a.example/1", snippet=WIRE),
+        Article(
+            title="Central bank raises rates",
+            url="https://b.example/2",
+            snippet="The central bank lifted its benchmark rate by a quarter point on Tuesday.",
+        ),
+        Article(
+            title="Team wins championship",
+            url="https://c.example/3",
+            snippet="The home side clinched the title with a late goal in extra time.",
+        ),
+    ]
+
+    collapsed = collapse_duplicates(articles)
+
+    assert collapsed == articles
+    assert all(article.alternate_sources is None for article in collapsed)
+
+
+def test_representative_prefers_an_article_with_a_snippet() -> None:
+    articles = [
+        Article(title="Floods force evacuations", url="https://a.example/1", isduplicate=1),
+        Article(title="Floods force evacuations", url="https://b.example/2", snippet=WIRE),
+    ]
+
+    collapsed = collapse_duplicates(articles, max_distance=-1)
+
+    assert [a.url for a in collapsed] == ["https://b.example/2"]
+    assert collapsed[0].alternate_sources == ["https://a.example/1"]
+
+
+def test_canonical_url_ignores_tracking_and_host_prefixes() -> None:
+    assert canonical_url("https://www.x.example/a/amp/?utm_medium=x&id=1") == canonical_url(
+        "http://x.example/a?id=1"
+    )
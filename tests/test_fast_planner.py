@@ -0,0 +1,33 @@
+from datetime import date, datetime
+
+from world_news.clients.gdelt import SearchRequest, _filter_window
+from world_news.fast_planner import plan_locally
+
+TODAY = date(2026, 10, 17)
+
+
+def test_single_day_plans_cover_the_whole_day() -> None:
+    plan = plan_locally("Ukraine news today", today=TODAY).plan
+    assert (plan.start_date, plan.end_date) == ("2026-10-17", "2026-10-17")
+    window = _filter_window(SearchRequest(plan.query, plan.start_date, plan.end_date))
+    assert window == {
+        "start_date": datetime(2026, 10, 17),
+        "end_date": datetime(2026, 10, 17, 23, 59, 59),
+    }
+
+
+def test_undated_questions_get_a_recent_window() -> None:
+    local = plan_locally("latest news on Ukraine", today=TODAY)
+    assert (local.plan.start_date, local.plan.end_date) == ("2026-10-10", "2026-10-17")
+    assert local.confidence >= 0.8
+
+
+def test_unparsed_time_phrases_go_to_the_llm_planner() -> None:
+    for question in ("Ukraine news last quarter", "economy news this weekend"):
+        assert plan_locally(question, today=TODAY).confidence < 0.8
+
+
+def test_gdeltdoc_window_fills_missing_dates() -> None:
+    assert _filter_window(SearchRequest("x")) == {"timespan": "3months"}
+    window = _filter_window(SearchRequest("x", None, "2026-10-17"))
+    assert window["start_date"] == datetime(2026, 7, 19)
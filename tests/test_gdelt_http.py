@@ -0,0 +1,85 @@
+import httpx
+import pytest
+
+from world_news.clients import GDELTError, GDELTThrottledError, GDELTTransientError, SearchRequest
+from world_news.clients.gdelt_http import build_params, check_status, parse_response
+
+
+def _response(status: int, text: str = "") -> httpx.Response:
+    request = httpx.Request("GET", "https://api.gdeltproject.org/api/v2/doc/doc")
+    return httpx.Response(status, text=text, request=request)
+
+
+def test_build_params_defaults() -> None:
+    params = build_params(SearchRequest(query="  ukraine grain  "))
+    assert params == {
+        "query": "ukraine grain",
+        "mode": "artlist",
+        "format": "json",
+        "maxrecords": "20",
+        "sort": "DateDesc",
+    }
+
+
+def test_build_params_single_language_has_no_parentheses() -> None:
+    params = build_params(SearchRequest(query="election", languages=["fra"]))
+    assert params["query"] == "election sourcelang:fra"
+
+
+def test_build_params_languages_are_or_clause() -> None:
+    params = build_params(SearchRequest(query="election", languages=["eng", "deu"]))
+    assert params["query"] == "election (sourcelang:eng OR sourcelang:deu)"
+
+
+def test_build_params_dates_records_and_sort() -> None:
+    request = SearchRequest(
+        query="storm",
+        start_date="2025-03-01",
+        end_date="2025-03-02T10:00:00",
+        max_records=1000,
+        sort_by="relevance",
+    )
+    params = build_params(request)
+    assert params["startdatetime"] == "20250301000000"
+    assert params["enddatetime"] == "20250302235959"
+    assert params["maxrecords"] == "250"
+    assert params["sort"] == "HybridRel"
+    assert build_params(SearchRequest(query="x", max_records=0))["maxrecords"] == "1"
+
+
+def test_parse_response_decodes_articles() -> None:
+    body = (
+        '{"articles": [{"url": "https://a.example/1", "title": "Tab\tin title", '
+        '"domain": "a.example", "seendate": "20250301T120000Z"}, "junk"]}'
+    )
+    [article] = parse_response(body)
+    assert article.url == "https://a.example/1"
+    assert article.title == "Tab\tin title"
+    assert article.domain == "a.example"
+    assert article.language is None
+
+
+@pytest.mark.parametrize("body", ["", "   ", "{}", '{"articles": null}', "[]"])
+def test_parse_response_empty_payloads(body: str) -> None:
+    assert parse_response(body) == []
+
+
+def test_parse_response_throttle_notice() -> None:
+    with pytest.raises(GDELTThrottledError):
+        parse_response("Please limit requests to one every 5 seconds")
+
+
+def test_parse_response_html_is_an_error_but_not_throttling() -> None:
+    with pytest.raises(GDELTError) as info:
+        parse_response("<html><body>Service unavailable</body></html>")
+    assert not isinstance(info.value, GDELTThrottledError)
+
+
+def test_check_status() -> None:
+    check_status(_response(200, "{}"))
+    with pytest.raises(GDELTThrottledError):
+        check_status(_response(429))
+    with pytest.raises(GDELTTransientError, match="HTTP 503"):
+        check_status(_response(503, "down"))
+    with pytest.raises(httpx.HTTPStatusError):
+        check_status(_response(404))
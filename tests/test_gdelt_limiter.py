@@ -0,0 +1,106 @@
+import pytest
+
+from world_news.clients.gdelt import GDELTThrottledError, GDELTTransientError
+from world_news.clients.gdelt_limiter import AdaptiveConcurrency, GDELTLimiter, TokenBucket
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_token_bucket_spends_its_burst_then_spaces_callers() -> None:
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2.0, burst=2, clock=clock)
+    assert [bucket.reserve(), bucket.reserve()] == [0.0, 0.0]
+    # Each further caller waits one more 1/rate interval.
+    assert [bucket.reserve(), bucket.reserve()] == [0.5, 1.0]
+    assert not bucket.try_acquire()
+    clock.now = 10.0
+    assert bucket.tokens == 2.0
+
+
+def test_token_bucket_drain_drops_the_saved_burst() -> None:
+    bucket = TokenBucket(rate=1.0, burst=5, clock=FakeClock())
+    bucket.drain()
+    assert bucket.reserve() == 1.0
+
+
+def test_disabled_token_bucket_never_waits() -> None:
+    bucket = TokenBucket(rate=0, burst=1, clock=FakeClock())
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+
+
+def test_adaptive_concurrency_grows_additively_and_halves_on_throttle() -> None:
+    clock = FakeClock()
+    concurrency = AdaptiveConcurrency(8, 1, decrease=0.5, cooldown=1.0, clock=clock)
+    for _ in range(8):
+        assert concurrency.try_acquire()
+    assert not concurrency.try_acquire()
+    concurrency.release(success=False, throttled=True)
+    assert concurrency.limit == 4.0
+    # A burst of throttles within the cooldown counts once.
+    concurrency.release(success=False, throttled=True)
+    assert concurrency.limit == 4.0
+    clock.now = 2.0
+    concurrency.release(success=False, throttled=True)
+    assert concurrency.limit == 2.0
+    concurrency.release()
+    assert concurrency.limit == 2.5
+    assert concurrency.in_flight == 4
+
+
+def test_adaptive_concurrency_stays_within_its_bounds() -> None:
+    clock = FakeClock()
+    concurrency = AdaptiveConcurrency(2, 1, cooldown=0.0, clock=clock)
+    for _ in range(5):
+        concurrency.try_acquire()
+        concurrency.release(success=False, throttled=True)
+        clock.now += 1.0
+    assert concurrency.limit == 1.0
+    for _ in range(10):
+        concurrency.try_acquire()
+        concurrency.release()
+    assert concurrency.limit == 2.0
+
+
+def test_limiter_retries_transient_failures_and_backs_off_on_throttling() -> None:
+    limiter = GDELTLimiter(TokenBucket(0, 1), AdaptiveConcurrency(4), retries=2, backoff=0.0)
+    failures = [GDELTThrottledError("slow down"), GDELTTransientError("502")]
+
+    def flaky() -> str:
+        if failures:
+            raise failures.pop(0)
+        return "ok"
+
+    assert limiter.call(flaky) == "ok"
+    assert (limiter.stats.attempts, limiter.stats.retries, limiter.stats.throttled) == (3, 2, 1)
+    assert limiter.concurrency.limit < 4
+    assert limiter.concurrency.in_flight == 0
+
+
+def test_limiter_does_not_retry_other_errors() -> None:
+    limiter = GDELTLimiter(TokenBucket(0, 1), AdaptiveConcurrency(1), retries=3, backoff=0.0)
+
+    def broken() -> None:
+        raise ValueError("bad query")
+
+    with pytest.raises(ValueError):
+        limiter.call(broken)
+    assert (limiter.stats.attempts, limiter.stats.failures) == (1, 1)
+    assert limiter.concurrency.in_flight == 0
+
+
+def test_interrupted_call_returns_its_concurrency_slot() -> None:
+    limiter = GDELTLimiter(TokenBucket(0, 1), AdaptiveConcurrency(1), retries=0)
+
+    def interrupted() -> None:
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        limiter.call(interrupted)
+    assert limiter.concurrency.in_flight == 0
+    assert limiter.call(lambda: "ok") == "ok"
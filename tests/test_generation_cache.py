@@ -0,0 +1,22 @@
+from world_news.generation_cache import GenerationCache, generation_key
+from world_news.planner import PlanResult
+
+
+def test_generation_key_separates_generation_settings() -> None:
+    plain = generation_key("models/gemini-2.5-flash", "Summarize: x")
+    cool = generation_key("models/gemini-2.5-flash", "Summarize: x", {"temperature": 0.2})
+    warm = generation_key("models/gemini-2.5-flash", "Summarize: x", {"temperature": 0.3})
+    schema = generation_key("models/gemini-2.5-flash", "Summarize: x", schema=PlanResult)
+    assert len({plain, cool, warm, schema}) == 4
+    # No settings: same key as model and prompt alone; settings order is irrelevant.
+    assert generation_key("models/gemini-2.5-flash", "Summarize: x", {}) == plain
+    assert generation_key("m", "p", {"a": 1, "b": 2}) == generation_key("m", "p", {"b": 2, "a": 1})
+
+
+def test_cache_round_trip() -> None:
+    cache = GenerationCache(max_entries=4, ttl=60)
+    key = generation_key("m", "p", {"temperature": 0.2})
+    assert cache.get(key) is None
+    cache.set(key, "digest")
+    assert cache.get(key) == "digest"
+    assert cache.get(generation_key("m", "p", {"temperature": 0.3})) is None
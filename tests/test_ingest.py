@@ -0,0 +1,67 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+from world_news.article_store import LocalArticleStore, LocalFirstRetriever
+from world_news.clients.gdelt import Article, GDELTClient, SearchRequest
+from world_news.config import IngestConfig, WatchedTopic
+from world_news.ingest import IngestScheduler
+
+
+class FakeBackend:
+    def __init__(self, count: int) -> None:
+        self.count = count
+        self.requests: list[SearchRequest] = []
+
+    def fetch(self, request: SearchRequest) -> list[Article]:
+        self.requests.append(request)
+        now = datetime.now(UTC)
+        return [
+            Article(
+                title=f"Ukraine update {i}",
+                url=f"https://x.example/{len(self.requests)}/{i}",
+                seendate=(now - timedelta(minutes=i)).strftime("%Y%m%dT%H%M%SZ"),
+            )
+            for i in range(self.count)
+        ]
+
+    async def fetch_async(self, request: SearchRequest) -> list[Article]:
+        return self.fetch(request)
+
+
+def _setup(count: int) -> tuple[IngestScheduler, LocalFirstRetriever, FakeBackend]:
+    store = LocalArticleStore(":memory:")
+    backend = FakeBackend(count)
+    client = GDELTClient(backend=backend, store=store)
+    config = IngestConfig(topics=(WatchedTopic("ukraine"),), max_records=75, jitter_seconds=0)
+    return IngestScheduler(client, config), LocalFirstRetriever(store, client), backend
+
+
+def test_scheduled_runs_send_both_dates() -> None:
+    scheduler, _, backend = _setup(5)
+    asyncio.run(scheduler.run_due(force=True))
+    [request] = backend.requests
+    assert request.start_date and request.end_date == datetime.now(UTC).date().isoformat()
+    assert scheduler.stats.errors == 0
+
+
+def test_user_searches_for_a_watched_topic_are_served_locally() -> None:
+    scheduler, retriever, backend = _setup(30)
+    asyncio.run(scheduler.run_due(force=True))
+    # An undated search: the newest 20 matches all fall inside the ingested window.
+    assert len(retriever.search_articles("Ukraine", max_records=20)) == 20
+    # The ingested window itself.
+    start = scheduler.topics[0].covered_since
+    today = datetime.now(UTC).date().isoformat()
+    assert len(retriever.search_articles("ukraine", start_date=start, end_date=today)) == 20
+    assert (retriever.stats.hits, retriever.stats.misses) == (2, 0)
+    assert len(backend.requests) == 1
+
+
+def test_searches_reaching_past_the_ingested_window_go_to_gdelt() -> None:
+    scheduler, retriever, backend = _setup(5)
+    asyncio.run(scheduler.run_due(force=True))
+    # Not sorted by date, so the newest local matches don't settle it.
+    retriever.search_articles("ukraine", max_records=5, sort_by="relevance")
+    # Fewer local matches than requested: older articles may exist on GDELT.
+    retriever.search_articles("ukraine", start_date="2026-01-01", max_records=20)
+    assert (retriever.stats.hits, retriever.stats.misses) == (0, 2)
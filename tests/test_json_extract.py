@@ -0,0 +1,44 @@
+from world_news.json_extract import JSONObjectExtractor, extract_json_object
+from world_news.metrics import METRICS
+from world_news.planner import parse_plan
+
+
+def test_fenced_json() -> None:
+    text = '```json\n{"query": "flood", "max_records": 20}\n```'
+    assert extract_json_object(text) == {"query": "flood", "max_records": 20}
+
+
+def test_json_surrounded_by_prose() -> None:
+    text = 'Here is the plan: {"query": "flood"} Let me know if you need more.'
+    assert extract_json_object(text) == {"query": "flood"}
+
+
+def test_braces_and_escaped_quotes_inside_strings() -> None:
+    text = 'Sure {note} {"query": "say \\"hi\\" {not a brace}", "n": {"a": 1}} trailing }'
+    assert extract_json_object(text) == {"query": 'say "hi" {not a brace}', "n": {"a": 1}}
+
+
+def test_input_split_across_stream_chunks() -> None:
+    extractor = JSONObjectExtractor()
+    chunks = ['Plan: {"que', 'ry": "a \\', '" b", "langu', 'ages": ["eng"]}', " and more"]
+    results = [extractor.feed(chunk) for chunk in chunks]
+    assert results[:3] == [None, None, None]
+    assert results[3] == {"query": 'a " b', "languages": ["eng"]}
+    assert extractor.done
+
+
+def test_no_object_found() -> None:
+    assert extract_json_object("no JSON here [1, 2]") is None
+    assert extract_json_object('{"unterminated": "value') is None
+    assert extract_json_object("") is None
+
+
+def test_planner_records_recovered_and_failed_replies() -> None:
+    METRICS.reset()
+    recovered = parse_plan('```json\n{"query": "flood relief"}\n```', "flood?")
+    failed = parse_plan("I cannot help with that.", "What about the flood?")
+    assert recovered.query == "flood relief"
+    assert failed.query == "What about the flood?"
+    rendered = METRICS.render()
+    assert 'world_news_plan_parse_total{outcome="recovered"} 1' in rendered
+    assert 'world_news_plan_parse_total{outcome="failed"} 1' in rendered
@@ -0,0 +1,79 @@
+import pytest
+
+from world_news.clients import Article
+from world_news.config import PipelineConfig
+from world_news.context import PASSAGE_SEPARATOR, estimate_tokens, format_passage
+from world_news.mapreduce import chunk_articles, select_summary_context
+
+
+def _article(i: int, domain: str, country: str = "US") -> Article:
+    return Article(
+        title=f"Story {i}",
+        url=f"https://{domain}/{i}",
+        domain=domain,
+        sourcecountry=country,
+        snippet="Officials said more details would follow later today. " * 3,
+    )
+
+
+def _cost(article: Article) -> int:
+    return estimate_tokens(format_passage(article) + PASSAGE_SEPARATOR)
+
+
+def test_chunks_fill_in_order_within_the_budget() -> None:
+    articles = [_article(i, "a.example") for i in range(5)]
+    chunk_tokens = 2 * _cost(articles[0])
+
+    chunks = chunk_articles(articles, chunk_tokens=chunk_tokens)
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert [p for chunk in chunks for p in chunk] == [format_passage(a) for a in articles]
+    assert chunk_articles(articles, chunk_tokens=chunk_tokens, max_chunks=2) == chunks[:2]
+
+
+def test_chunks_keep_a_domain_together() -> None:
+    articles = [_article(i, domain) for i, domain in enumerate("abab")]
+    chunk_tokens = 2 * _cost(articles[0])
+
+    chunks = chunk_articles(articles, chunk_tokens=chunk_tokens, group_by="domain")
+
+    assert chunks == [
+        [format_passage(articles[0]), format_passage(articles[2])],
+        [format_passage(articles[1]), format_passage(articles[3])],
+    ]
+
+
+def test_small_country_groups_share_a_chunk() -> None:
+    articles = [_article(0, "a", "US"), _article(1, "b", "FR"), _article(2, "c", "US")]
+    chunk_tokens = 3 * _cost(articles[0])
+
+    chunks = chunk_articles(articles, chunk_tokens=chunk_tokens, group_by="country")
+
+    assert chunks == [[format_passage(articles[i]) for i in (0, 2, 1)]]
+    with pytest.raises(ValueError, match="group_by"):
+        chunk_articles(articles, chunk_tokens=chunk_tokens, group_by="language")
+
+
+def test_small_inputs_take_the_single_call_path() -> None:
+    articles = [_article(i, "a.example") for i in range(3)]
+    config = PipelineConfig(map_reduce=True, context_token_budget=10_000)
+
+    pack, use_map_reduce = select_summary_context(articles, question=None, config=config)
+
+    assert not use_map_reduce
+    assert pack.articles == articles
+
+
+def test_large_inputs_are_map_reduced_without_dropping_articles() -> None:
+    articles = [_article(i, "a.example") for i in range(20)]
+    budget = 3 * _cost(articles[0])
+
+    config = PipelineConfig(map_reduce=True, context_token_budget=budget)
+    pack, use_map_reduce = select_summary_context(articles, question=None, config=config)
+    assert use_map_reduce
+    assert pack.kept_articles == 20
+
+    config = PipelineConfig(map_reduce=False, context_token_budget=budget)
+    pack, use_map_reduce = select_summary_context(articles, question=None, config=config)
+    assert not use_map_reduce
+    assert pack.kept_articles == 3
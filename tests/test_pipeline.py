@@ -0,0 +1,22 @@
+from world_news.clients import Article
+from world_news.config import PipelineConfig
+from world_news.pipeline import fetch_records, reuse_speculation, speculative_records
+from world_news.planner import PlanResult
+
+
+def test_speculative_search_is_as_wide_as_the_reranked_search() -> None:
+    config = PipelineConfig(rerank=True, rerank_fetch_records=100, speculative_max_records=50)
+    plan = PlanResult("flood relief", None, None, None, 20)
+    fetched = fetch_records(plan.max_records, config)
+    assert fetched == speculative_records(config) == 100
+
+    articles = [Article(title=f"Flood {i}", url=f"https://x.example/{i}") for i in range(100)]
+    planned = PlanResult(plan.query, None, None, None, fetched)
+    reused = reuse_speculation(planned, "relief flood", speculative_records(config), articles)
+    assert reused == articles
+
+
+def test_fetch_size_respects_the_cap() -> None:
+    config = PipelineConfig(rerank=True, rerank_fetch_records=100, max_records_cap=40)
+    assert fetch_records(20, config) == speculative_records(config) == 40
+    assert fetch_records(20, PipelineConfig(rerank=False)) == 20
@@ -0,0 +1,58 @@
+import time
+from datetime import UTC, datetime, timedelta
+
+from world_news.plan_cache import PlanCache, next_day_boundary, prompt_version
+from world_news.planner import PlanResult
+
+
+def _plan(start: str | None = None, end: str | None = None) -> PlanResult:
+    return PlanResult(query="q", start_date=start, end_date=end, languages=None, max_records=20)
+
+
+def _expires_at(cache: PlanCache) -> float | None:
+    row = cache._conn.execute("SELECT expires_at FROM plans").fetchone()
+    cache.clear()
+    return row[0]
+
+
+def test_plan_expiry() -> None:
+    cache = PlanCache(":memory:", version="test")
+    today = datetime.now(UTC).date()
+    boundary = next_day_boundary(time.time())
+
+    # Relative dates were resolved against today.
+    cache.set("floods last week", _plan(str(today - timedelta(days=7)), str(today)))
+    assert _expires_at(cache) == boundary
+
+    # The open end of "since <date>" is today, which the question did not spell out.
+    cache.set("news since 2026-01-05", _plan("2026-01-05", str(today)))
+    assert _expires_at(cache) == boundary
+
+    # A fully spelled-out window that already ended never changes.
+    question = "news between 2024-01-01 and 2024-01-31"
+    cache.set(question, _plan("2024-01-01", "2024-01-31"))
+    assert _expires_at(cache) is None
+
+    # A spelled-out window reaching today is still filling up.
+    question = f"news from 2024-01-01 to {today}"
+    cache.set(question, _plan("2024-01-01", str(today)))
+    assert _expires_at(cache) == boundary
+
+    cache.set("latest on the election", _plan())
+    assert _expires_at(cache) is None
+
+
+def test_version_changes_with_planner_model_and_settings() -> None:
+    base = prompt_version("plan {question}", model_name="models/a")
+    assert base == prompt_version("plan {question}", model_name="models/a")
+    assert base != prompt_version("plan {question}", model_name="models/b")
+    assert base != prompt_version(
+        "plan {question}", model_name="models/a", generation_config={"temperature": 0.0}
+    )
+    assert base != prompt_version("plan the {question}", model_name="models/a")
+
+    cache = PlanCache(":memory:", version=base)
+    cache.set("floods in 2026-01-05", _plan("2026-01-05", "2026-01-05"))
+    assert cache.get("floods in 2026-01-05") is not None
+    cache.version = prompt_version("plan {question}", model_name="models/b")
+    assert cache.get("floods in 2026-01-05") is None
@@ -0,0 +1,31 @@
+import subprocess
+import sys
+
+import pytest
+
+from world_news.config import PipelineConfig, ProjectConfig
+from world_news.service import ArticleSearch, NewsService
+
+
+def _config() -> ProjectConfig:
+    return ProjectConfig(pipeline=PipelineConfig(local_store_path=":memory:"))
+
+
+def test_article_search_does_not_import_gemini() -> None:
+    code = (
+        "import sys\n"
+        "from world_news.config import PipelineConfig, ProjectConfig\n"
+        "from world_news.service import ArticleSearch\n"
+        "pipeline = PipelineConfig(local_store_path=':memory:')\n"
+        "ArticleSearch.create_default(ProjectConfig(pipeline=pipeline))\n"
+        "assert 'google.generativeai' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_service_reuses_an_existing_article_search() -> None:
+    pytest.importorskip("google.generativeai")
+    search = ArticleSearch.create_default(_config())
+    service = NewsService.create_default("test-key", "gemini-test", _config(), search=search)
+    assert service.gdelt_client is search.gdelt_client
+    assert service.local_retriever is search.local_retriever
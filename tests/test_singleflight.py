@@ -0,0 +1,126 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from world_news.singleflight import SingleFlight
+
+
+def test_concurrent_sync_calls_share_one_execution() -> None:
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = 0
+
+    def slow() -> str:
+        nonlocal calls
+        calls += 1
+        started.set()
+        release.wait(5)
+        return "result"
+
+    results: list[str] = []
+
+    def call() -> None:
+        results.append(flight.do("key", slow))
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait(5)
+    followers = [threading.Thread(target=call) for _ in range(3)]
+    for thread in followers:
+        thread.start()
+    while flight.stats.calls < 4:
+        time.sleep(0.001)
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join(5)
+
+    assert calls == 1
+    assert results == ["result"] * 4
+    assert flight.stats.as_dict() == {"calls": 4, "executed": 1, "collapsed": 3}
+
+
+def test_sync_errors_reach_every_waiter() -> None:
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def failing() -> str:
+        started.set()
+        release.wait(5)
+        raise RuntimeError("boom")
+
+    errors: list[BaseException] = []
+
+    def call() -> None:
+        try:
+            flight.do("key", failing)
+        except RuntimeError as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=call)]
+    threads[0].start()
+    started.wait(5)
+    threads.append(threading.Thread(target=call))
+    threads[1].start()
+    while flight.stats.calls < 2:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert [str(exc) for exc in errors] == ["boom", "boom"]
+    assert flight.stats.executed == 1
+
+
+def test_async_calls_share_result_and_errors() -> None:
+    flight = SingleFlight()
+    calls = 0
+
+    async def fetch() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return 42
+
+    async def fail() -> int:
+        await asyncio.sleep(0.01)
+        raise ValueError("nope")
+
+    async def run() -> None:
+        results = await asyncio.gather(*(flight.do_async("ok", fetch) for _ in range(5)))
+        assert results == [42] * 5
+        outcomes = await asyncio.gather(
+            *(flight.do_async("bad", fail) for _ in range(3)), return_exceptions=True
+        )
+        assert all(isinstance(o, ValueError) and str(o) == "nope" for o in outcomes)
+
+    asyncio.run(run())
+    assert calls == 1
+    assert flight.stats.as_dict() == {"calls": 8, "executed": 2, "collapsed": 6}
+
+
+def test_cancelled_async_leader_does_not_cancel_followers() -> None:
+    flight = SingleFlight()
+    calls = 0
+
+    async def fetch() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.02)
+        return "shared"
+
+    async def run() -> None:
+        leader = asyncio.create_task(flight.do_async("key", fetch))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do_async("key", fetch))
+        await asyncio.sleep(0)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        assert await follower == "shared"
+
+    asyncio.run(run())
+    assert calls == 1
@@ -0,0 +1,124 @@
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from types import SimpleNamespace
+from typing import Any
+
+import httpx
+
+from world_news import app as app_module
+from world_news.clients import Article, GDELTClient, GeminiClient
+from world_news.clients.gdelt import SearchRequest
+from world_news.config import PipelineConfig, ProjectConfig
+from world_news.pipeline import stream_pipeline_async
+from world_news.service import NewsService
+
+QUESTION = "latest news on flood relief"
+
+
+class FakeModel:
+    model_name = "models/fake"
+
+    def generate_content(self, prompt: str, stream: bool = False, **_: Any) -> Any:
+        raise AssertionError("the streaming pipeline only calls the async API")
+
+    async def generate_content_async(self, prompt: str, stream: bool = False, **_: Any) -> Any:
+        if not stream:
+            return SimpleNamespace(text="Floods recede.")
+
+        async def chunks() -> AsyncIterator[Any]:
+            for text in ("Floods ", "recede."):
+                yield SimpleNamespace(text=text)
+
+        return chunks()
+
+
+class FakeBackend:
+    def __init__(self, error: Exception | None = None) -> None:
+        self.error = error
+
+    def fetch(self, request: SearchRequest) -> list[Article]:
+        if self.error is not None:
+            raise self.error
+        return [
+            Article(title="Flood relief arrives", url="https://x.example/1", snippet="Aid."),
+            Article(title="Relief for flood victims", url="https://y.example/2", snippet="Aid."),
+        ]
+
+    async def fetch_async(self, request: SearchRequest) -> list[Article]:
+        return self.fetch(request)
+
+
+def _service(error: Exception | None = None) -> NewsService:
+    pipeline = PipelineConfig(local_store_enabled=False, plan_cache_enabled=False)
+    return NewsService(
+        gdelt_client=GDELTClient(backend=FakeBackend(error)),
+        gemini_client=GeminiClient(model=FakeModel()),  # type: ignore[arg-type]
+        config=ProjectConfig(pipeline=pipeline),
+    )
+
+
+def _events(body: str) -> list[tuple[str, Any]]:
+    events = []
+    for block in body.strip().split("\n\n"):
+        event, data = block.split("\n")
+        events.append((event.removeprefix("event: "), json.loads(data.removeprefix("data: "))))
+    return events
+
+
+async def _post_stream(service: NewsService) -> list[tuple[str, Any]]:
+    app_module.use_service(service)
+    transport = httpx.ASGITransport(app=app_module.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post("/chat/stream", json={"query": QUESTION})
+        assert response.headers["content-type"].startswith("text/event-stream")
+        return _events(response.text)
+
+
+def test_pipeline_events_arrive_in_order() -> None:
+    service = _service()
+
+    async def collect() -> list[str]:
+        stream = stream_pipeline_async(
+            QUESTION,
+            service.planner_llm,
+            service.retriever,
+            service.gemini_client,
+            config=service.config.pipeline,
+        )
+        return [event.event async for event in stream]
+
+    assert asyncio.run(collect()) == ["plan", "articles", "token", "token", "done"]
+
+
+def test_chat_stream_sends_sse_events_in_order() -> None:
+    events = asyncio.run(_post_stream(_service()))
+    names = [name for name, _ in events]
+    assert names == ["plan", "articles", "token", "token", "done"]
+    assert events[0][1]["query"] == "flood relief"
+    assert "".join(data for name, data in events if name == "token") == "Floods recede."
+    assert app_module.get_admission().running == 0
+
+
+def test_chat_stream_reports_failures_in_band() -> None:
+    events = asyncio.run(_post_stream(_service(ValueError("GDELT said no"))))
+    assert [name for name, _ in events] == ["plan", "error"]
+    assert events[-1][1] == {"detail": "GDELT said no"}
+    assert app_module.get_admission().running == 0
+
+
+def test_admission_slot_is_released_when_the_client_disconnects() -> None:
+    app_module.use_service(_service())
+
+    async def disconnect_after_first_event() -> None:
+        response = await app_module.chat_stream(app_module.ChatRequest(query=QUESTION))
+        admission = app_module.get_admission()
+        assert admission.running == 1
+        body = response.body_iterator
+        first = await anext(body)
+        assert str(first).startswith("event: plan")
+        # Starlette closes the body iterator when the client goes away.
+        await body.aclose()  # type: ignore[attr-defined]
+        assert admission.running == 0
+
+    asyncio.run(disconnect_after_first_event())